@@ -17,22 +17,49 @@ Meaningful files exclude:
 The hook can be bypassed with SKIP_CHANGELOG_CHECK=1 environment variable.
 """
 
-import json
 import os
 import re
-import subprocess
 import sys
+from functools import lru_cache
 from typing import Any
 
-from hook_utils import Colors, exit_if_disabled
+from hook_utils import Colors, exit_if_disabled, find_executable, read_tool_input
 
+# Regex pattern matching "git commit" with word boundaries
+GIT_COMMIT_PATTERN = re.compile(r"\bgit\s+commit\b")
 
+# Static parts of the blocking message, formatted once at import
+MISSING_CHANGELOG_HEADER = f"""{Colors.red("❌ Meaningful changes without CHANGELOG.md update!")}
+
+{Colors.yellow("📝 Staged files requiring changelog:")}"""
+
+MISSING_CHANGELOG_FOOTER = f"""{Colors.blue("💡 Options:")}
+   1. Update CHANGELOG.md, then retry commit
+   2. {Colors.green("SKIP_CHANGELOG_CHECK=1")} git commit ..."""
+
+# Regex pattern matching the inline skip variable anywhere in the command
+SKIP_CHANGELOG_PATTERN = re.compile(r"SKIP_CHANGELOG_CHECK=1")
+
+# Single alternation covering every non-meaningful path rule:
+# tests/, .github/, .claude/ directories, __pycache__ and *.pyc artifacts,
+# .gitignore and conftest.py files, and markdown documentation (any case)
+MEANINGFUL_EXCLUDE_PATTERN = re.compile(
+    r"(?:^|/)(?:tests|\.github|\.claude)/"
+    r"|__pycache__"
+    r"|(?:^|/)(?:\.gitignore|conftest\.py)$"
+    r"|\.pyc$"
+    r"|(?i:\.md)$"
+)
+
+
+@lru_cache(maxsize=4096)
 def is_meaningful_file(file_path: str) -> bool:
     """
     Determine if a file is meaningful for changelog purposes.
 
     Meaningful files are production code changes that should be documented.
     Excludes test files, configuration, documentation, and build artifacts.
+    Decisions are cached since the result depends only on the path string.
 
     Args:
         file_path: The file path to check.
@@ -46,35 +73,8 @@ def is_meaningful_file(file_path: str) -> bool:
     # Normalize path for consistent checking
     path = file_path.strip()
 
-    # Exclude test files
-    if path.startswith("tests/") or "/tests/" in path:
-        return False
-
-    # Exclude GitHub workflows and templates
-    if path.startswith(".github/") or "/.github/" in path:
-        return False
-
-    # Exclude Python cache files
-    if "__pycache__" in path or path.endswith(".pyc"):
-        return False
-
-    # Exclude specific configuration files
-    if path == ".gitignore" or path.endswith("/.gitignore"):
-        return False
-
-    if path == "conftest.py" or path.endswith("/conftest.py"):
-        return False
-
-    # Exclude .claude directory
-    if path.startswith(".claude/") or "/.claude/" in path:
-        return False
-
-    # Exclude all markdown files (documentation)
-    if path.lower().endswith(".md"):
-        return False
-
-    # Everything else is meaningful
-    return True
+    # Everything not matching an exclusion rule is meaningful
+    return MEANINGFUL_EXCLUDE_PATTERN.search(path) is None
 
 
 def get_staged_files() -> list[str]:
@@ -84,20 +84,28 @@ def get_staged_files() -> list[str]:
     Returns:
         List of staged file paths, or empty list on error.
     """
+    # Deferred import: only commit commands reach this point
+    import subprocess
+
     try:
         result = subprocess.run(
             ["git", "diff", "--cached", "--name-only"],
-            capture_output=True,
-            text=True,
+            executable=find_executable("git"),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
             timeout=5,
         )
 
         if result.returncode != 0:
             return []
 
-        # Split output into lines and filter empty lines
-        files = [f.strip() for f in result.stdout.strip().split("\n") if f.strip()]
-        return files
+        # Split raw output into lines, decoding only non-empty entries
+        return [
+            entry.decode("utf-8", "replace")
+            for line in result.stdout.splitlines()
+            if (entry := line.strip())
+        ]
 
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
         return []
@@ -107,13 +115,17 @@ def is_changelog_staged(staged_files: list[str]) -> bool:
     """
     Check if CHANGELOG.md is in the staged files.
 
+    Compares exact file names, so lookalikes such as CHANGELOG.md.bak
+    do not count as a staged changelog.
+
     Args:
         staged_files: List of staged file paths.
 
     Returns:
         True if CHANGELOG.md is staged, False otherwise.
     """
-    return any("CHANGELOG.md" in f for f in staged_files)
+    basenames = {f.rsplit("/", 1)[-1] for f in staged_files}
+    return "CHANGELOG.md" in basenames
 
 
 def is_git_commit_command(command: str) -> bool:
@@ -127,21 +139,20 @@ def is_git_commit_command(command: str) -> bool:
         True if command is git commit, False otherwise.
     """
     # Match "git commit" with word boundaries to avoid false matches
-    return bool(re.search(r"\bgit\s+commit\b", command))
+    return bool(GIT_COMMIT_PATTERN.search(command))
 
 
 def main() -> None:
     """Main entry point for the changelog reminder hook."""
+    # Check for skip environment variable before any file or stdin I/O
+    if os.environ.get("SKIP_CHANGELOG_CHECK") == "1":
+        sys.exit(0)
+
     exit_if_disabled()
 
     try:
-        # Check for skip environment variable
-        if os.environ.get("SKIP_CHANGELOG_CHECK") == "1":
-            sys.exit(0)
-
         # Read hook data from stdin
-        tool_use_json = sys.stdin.read()
-        tool_use: dict[str, Any] = json.loads(tool_use_json)
+        tool_use: dict[str, Any] = read_tool_input()
 
         # Only process Bash commands
         if tool_use.get("tool_name") != "Bash":
@@ -150,7 +161,7 @@ def main() -> None:
         command = tool_use.get("tool_input", {}).get("command", "")
 
         # Check for skip in command string (inline env var anywhere in command)
-        if re.search(r"SKIP_CHANGELOG_CHECK=1", command):
+        if SKIP_CHANGELOG_PATTERN.search(command):
             sys.exit(0)
 
         # Check if this is a git commit command
@@ -172,14 +183,10 @@ def main() -> None:
             sys.exit(0)
 
         # Block commit - meaningful files without CHANGELOG.md
-        error_msg = f"""{Colors.red("❌ Meaningful changes without CHANGELOG.md update!")}
-
-{Colors.yellow("📝 Staged files requiring changelog:")}
-{chr(10).join(f"   - {f}" for f in meaningful_files)}
-
-{Colors.blue("💡 Options:")}
-   1. Update CHANGELOG.md, then retry commit
-   2. {Colors.green("SKIP_CHANGELOG_CHECK=1")} git commit ..."""
+        file_list = "\n".join(f"   - {f}" for f in meaningful_files)
+        error_msg = (
+            f"{MISSING_CHANGELOG_HEADER}\n{file_list}\n\n{MISSING_CHANGELOG_FOOTER}"
+        )
 
         print(error_msg, file=sys.stderr)
         sys.exit(2)
@@ -10,36 +10,56 @@ The hook can be bypassed with SKIP_DOC_CHECK=1 environment variable or by adding
 files to .doc-check-ignore following gitignore-style patterns.
 """
 
-import json
 import os
 import re
 import subprocess
 import sys
-from pathlib import Path
+import threading
+from functools import lru_cache
 from typing import Any
 
-from hook_utils import Colors, exit_if_disabled
+from hook_utils import (
+    Colors,
+    exit_if_disabled,
+    find_executable,
+    get_current_branch,
+    read_tool_input,
+)
+
+# Regex pattern splitting a command chain into segments on &&, || and ;
+COMMAND_SEPARATOR_PATTERN = re.compile(r"&&|\|\||;")
+
+# Regex pattern classifying a chain segment in one pass via named groups:
+# "gh pr merge", "git checkout/switch <branch>" or "git merge"
+MERGE_SEGMENT_PATTERN = re.compile(
+    r"^\s*(?:"
+    r"(?P<gh_merge>gh\s+pr\s+merge\b)"
+    r"|git\s+(?:"
+    r"(?:checkout|switch)\s+(?:-\S+\s+)*(?P<checkout>[^\s-]\S*)"
+    r"|(?P<merge>merge\b)"
+    r"))"
+)
+
+# Branch names treated as the main line of development
+MAIN_BRANCHES = frozenset({"main", "master"})
+
+# Blocking message, formatted once at import since it has no dynamic parts
+MISSING_DOCS_MESSAGE = f"""{Colors.red("❌ No documentation updates detected in this branch.")}
 
+{Colors.yellow("📝 Files checked:")} CHANGELOG.md, README.md, *.md (excluding .doc-check-ignore patterns)
 
-def get_current_branch() -> str | None:
-    """
-    Get the current git branch name.
+{Colors.blue("💡 Options:")}
+   1. Update relevant documentation, then retry merge
+   2. If no docs needed, ask user to confirm, then run:
+      {Colors.green("SKIP_DOC_CHECK=1")} git merge <branch>
 
-    Returns:
-        The current branch name, or None if not in a git repo or error.
-    """
-    try:
-        result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-        return None
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        return None
+{Colors.cyan("🔍 Branch diff:")} git diff main...HEAD --name-only"""
+
+# Seconds before a running git diff is killed and the check fails open
+GIT_DIFF_TIMEOUT = 10
+
+# Regex pattern matching the inline skip variable anywhere in the command
+SKIP_DOC_PATTERN = re.compile(r"SKIP_DOC_CHECK=1")
 
 
 def extract_merge_target(command: str) -> str | None:
@@ -80,11 +100,17 @@ def is_merge_to_main_regex(command: str) -> bool:
     """
     Detect if the command is attempting to merge into main branch using strict regex.
 
-    This function uses regex patterns to avoid false positives from commit messages
-    containing "merge" as text. It checks for:
-    1. 'gh pr merge' command with strict word boundaries
-    2. 'git merge' subcommand (not 'git commit' with merge in message)
-    3. 'checkout main' followed by 'merge' in command chain
+    The command is split into segments on &&, || and ; and parsed locally,
+    which avoids false positives from commit messages containing "merge" as
+    text. A segment counts as a merge to main if it is:
+    1. 'gh pr merge' with strict word boundaries
+    2. 'git merge <branch>' while on main or master, where the branch is
+       tracked through preceding 'git checkout'/'git switch' segments
+
+    Merging main into a feature branch (e.g. 'git checkout feature &&
+    git merge main') is not a merge to main. The current branch is only
+    looked up for a 'git merge' that no earlier segment switched away from,
+    and only after every other segment has been checked.
 
     Args:
         command: The bash command being executed.
@@ -92,25 +118,37 @@ def is_merge_to_main_regex(command: str) -> bool:
     Returns:
         True if merge-to-main is detected, False otherwise.
     """
-    # Check for gh pr merge (strict word boundary matching at start)
-    if re.match(r"^\s*gh\s+pr\s+merge\b", command):
-        return True
+    # Commands that never mention merge cannot merge
+    if "merge" not in command:
+        return False
 
-    # Extract git subcommand to verify it's actually "merge"
-    git_match = re.match(r"^\s*git\s+(\w+)", command)
-    if git_match:
-        subcommand = git_match.group(1)
-        if subcommand == "merge":
-            # Case 1: Already on main branch
-            current_branch = get_current_branch()
-            if current_branch == "main":
-                return True
+    branch: str | None = None
+    # Targets of merges that run on the current (not yet looked up) branch
+    pending_targets: list[str | None] = []
 
-    # Case 2: Command contains checkout main followed by merge
-    # Match patterns like: git checkout main && git merge
-    # or: git checkout main; git merge
-    if re.search(r"checkout\s+main\s*(?:&&|;|$).*merge", command):
-        return True
+    for segment in COMMAND_SEPARATOR_PATTERN.split(command):
+        match = MERGE_SEGMENT_PATTERN.match(segment)
+        if not match:
+            continue
+
+        # Check for gh pr merge (strict word boundary matching at start)
+        if match.group("gh_merge"):
+            return True
+
+        # Track branch switches within the chain
+        if match.group("checkout"):
+            branch = match.group("checkout")
+            continue
+
+        target = extract_merge_target(segment)
+        if branch is None:
+            pending_targets.append(target)
+        elif branch in MAIN_BRANCHES and target not in MAIN_BRANCHES:
+            return True
+
+    # Resolve merges that run on the starting branch with a single lookup
+    if pending_targets and get_current_branch() in MAIN_BRANCHES:
+        return any(target not in MAIN_BRANCHES for target in pending_targets)
 
     return False
 
@@ -160,36 +198,24 @@ Answer ONLY "yes" or "no"."""
 
 def is_ai_mode_enabled() -> bool:
     """
-    Check if AI mode is enabled via flag file or environment variable.
+    Check if the AI fallback is forced via environment variable.
 
-    AI mode uses Claude Haiku to semantically analyze commands instead of regex.
-    Can be enabled via:
-    - DOC_CHECK_USE_AI=1 environment variable
-    - .claude/hook-doc-check-ai-mode-on flag file in project directory
+    The local command parser covers the chained checkout/merge cases AI mode
+    was introduced for, so the Claude Haiku fallback is only used when
+    explicitly forced with DOC_CHECK_FORCE_AI=1.
 
     Returns:
-        True if AI mode is enabled, False otherwise.
+        True if AI fallback is forced, False otherwise.
     """
-    # Environment variable takes precedence
-    if os.environ.get("DOC_CHECK_USE_AI") == "1":
-        return True
-
-    # Check for project flag file
-    project_dir = os.environ.get("CLAUDE_PROJECT_DIR")
-    if project_dir:
-        flag_file = Path(project_dir) / ".claude" / "hook-doc-check-ai-mode-on"
-        if flag_file.exists():
-            return True
-
-    return False
+    return os.environ.get("DOC_CHECK_FORCE_AI") == "1"
 
 
 def is_merge_to_main(command: str) -> bool:
     """
     Detect if the command is attempting to merge into main branch.
 
-    Uses regex-first approach for performance, with optional AI fallback for
-    edge cases. When AI mode is enabled, AI is only called if:
+    Uses the local parser, with an optional AI fallback for edge cases.
+    When DOC_CHECK_FORCE_AI=1 is set, AI is only called if:
     1. Regex returned False (no obvious merge detected)
     2. Command contains merge-related keywords (pre-filter)
 
@@ -203,7 +229,7 @@ def is_merge_to_main(command: str) -> bool:
     if is_merge_to_main_regex(command):
         return True
 
-    # AI fallback only if enabled + command has keywords + regex said no
+    # AI fallback only if forced + command has keywords + regex said no
     if is_ai_mode_enabled():
         command_lower = command.lower()
         if "merge" in command_lower or "gh" in command_lower:
@@ -222,14 +248,13 @@ def load_doc_check_ignore_patterns() -> list[str]:
     project_dir = os.environ.get("CLAUDE_PROJECT_DIR", "")
     if not project_dir:
         return []  # Can't load ignore file without project directory
-    ignore_file = Path(project_dir) / ".doc-check-ignore"
-    patterns: list[str] = []
 
-    if not ignore_file.exists():
-        return patterns
+    ignore_file = os.path.join(project_dir, ".doc-check-ignore")
+    patterns: list[str] = []
 
+    # Open directly instead of probing first; a missing file raises OSError
     try:
-        with ignore_file.open("r", encoding="utf-8") as f:
+        with open(ignore_file, encoding="utf-8") as f:
             for line in f:
                 line = line.strip()
                 # Skip empty lines and comments
@@ -242,23 +267,29 @@ def load_doc_check_ignore_patterns() -> list[str]:
     return patterns
 
 
-def is_ignored(file_path: str, patterns: list[str]) -> bool:
+@lru_cache(maxsize=8)
+def compile_ignore_patterns(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
     """
-    Check if a file path matches any ignore pattern.
+    Compile glob-style ignore patterns into a single anchored regular expression.
 
-    Uses simple glob-style pattern matching:
+    Uses simple glob-style pattern conversion:
     - * matches anything in current directory
     - ** matches across directories
-    - Patterns ending with / match directories
+
+    Each converted pattern becomes one branch of a non-capturing alternation,
+    so a file path is tested against all patterns in a single match call.
+    Results are cached per pattern tuple.
 
     Args:
-        file_path: The file path to check.
-        patterns: List of glob-style patterns.
+        patterns: Tuple of glob-style patterns.
 
     Returns:
-        True if file matches any ignore pattern, False otherwise.
+        Compiled alternation of all patterns, or None if there are no patterns.
     """
+    if not patterns:
+        return None
 
+    branches: list[str] = []
     for pattern in patterns:
         # Convert glob pattern to regex
         # Simple implementation: * -> [^/]*, ** -> .*
@@ -272,69 +303,101 @@ def is_ignored(file_path: str, patterns: list[str]) -> bool:
         if not regex_pattern.endswith("$"):
             regex_pattern = regex_pattern + "$"
 
-        if re.match(regex_pattern, file_path):
-            return True
+        branches.append(f"(?:{regex_pattern})")
 
-    return False
+    return re.compile("|".join(branches))
 
 
-def get_modified_docs(merge_target: str | None = None) -> list[str]:
+def is_ignored(file_path: str, patterns: list[str]) -> bool:
     """
-    Get list of modified documentation files in current branch vs main.
+    Check if a file path matches any ignore pattern.
+
+    Uses simple glob-style pattern matching:
+    - * matches anything in current directory
+    - ** matches across directories
+    - Patterns ending with / match directories
+
+    Args:
+        file_path: The file path to check.
+        patterns: List of glob-style patterns.
+
+    Returns:
+        True if file matches any ignore pattern, False otherwise.
+    """
+    compiled = compile_ignore_patterns(tuple(patterns))
+    return compiled is not None and compiled.match(file_path) is not None
+
+
+def has_modified_docs(merge_target: str | None = None) -> bool:
+    """
+    Check whether the branch modifies any documentation file.
+
+    Streams `git diff --name-only` output and stops at the first .md file
+    that is not excluded by .doc-check-ignore, terminating git early instead
+    of collecting the full file list. A git diff still running after
+    GIT_DIFF_TIMEOUT seconds is killed and treated as no documentation.
 
     Args:
         merge_target: Optional branch name being merged. If provided, diff against
                       this branch instead of main. Used when already on main branch.
 
     Returns:
-        List of .md file paths modified in the branch.
+        True if at least one non-ignored .md file is modified, False otherwise.
     """
+    # Determine diff range
+    if merge_target:
+        # When on main, diff against the branch being merged
+        diff_range = [merge_target]
+    else:
+        # When on feature branch, diff against main
+        diff_range = ["main...HEAD"]
+
+    ignore_patterns = load_doc_check_ignore_patterns()
+
     try:
-        # Determine diff range
-        if merge_target:
-            # When on main, diff against the branch being merged
-            diff_range = [merge_target]
-        else:
-            # When on feature branch, diff against main
-            diff_range = ["main...HEAD"]
-
-        # Get list of changed files in branch
-        result = subprocess.run(
+        proc = subprocess.Popen(
             ["git", "diff"] + diff_range + ["--name-only"],
-            capture_output=True,
-            text=True,
-            timeout=10,
+            executable=find_executable("git"),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
         )
+    except (FileNotFoundError, OSError):
+        return False
 
-        if result.returncode != 0:
-            return []
-
-        # Filter to .md files (case insensitive)
-        all_files = result.stdout.strip().split("\n")
-        md_files = [f for f in all_files if f.lower().endswith(".md")]
+    # Kill git once the deadline passes; the closed pipe ends the loop below
+    watchdog = threading.Timer(GIT_DIFF_TIMEOUT, proc.kill)
+    watchdog.daemon = True
+    watchdog.start()
 
-        # Apply ignore patterns
-        ignore_patterns = load_doc_check_ignore_patterns()
-        filtered_files = [f for f in md_files if not is_ignored(f, ignore_patterns)]
-
-        return filtered_files
-
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        return []
+    try:
+        for line in proc.stdout:
+            file_path = line.rstrip(b"\r\n").decode("utf-8", "replace")
+            # Match .md files (case insensitive) not covered by ignore patterns
+            if file_path.lower().endswith(".md") and not is_ignored(
+                file_path, ignore_patterns
+            ):
+                return True
+        return False
+    finally:
+        # Stop git if we returned before it finished writing
+        watchdog.cancel()
+        proc.kill()
+        proc.stdout.close()
+        proc.wait()
 
 
 def main() -> None:
     """Main entry point for the documentation update check hook."""
+    # Check for skip environment variable before any file or stdin I/O
+    if os.environ.get("SKIP_DOC_CHECK") == "1":
+        sys.exit(0)
+
     exit_if_disabled()
 
     try:
-        # Check for skip environment variable
-        if os.environ.get("SKIP_DOC_CHECK") == "1":
-            sys.exit(0)
-
         # Read hook data from stdin
-        tool_use_json = sys.stdin.read()
-        tool_use: dict[str, Any] = json.loads(tool_use_json)
+        tool_use: dict[str, Any] = read_tool_input()
 
         # Only process Bash commands
         if tool_use.get("tool_name") != "Bash":
@@ -343,7 +406,7 @@ def main() -> None:
         command = tool_use.get("tool_input", {}).get("command", "")
 
         # Check for skip in command string (inline env var anywhere in command)
-        if re.search(r"SKIP_DOC_CHECK=1", command):
+        if SKIP_DOC_PATTERN.search(command):
             sys.exit(0)
 
         # Check if this is a merge-to-main operation
@@ -353,29 +416,15 @@ def main() -> None:
         # Get current branch and extract merge target if needed
         current_branch = get_current_branch()
         merge_target = (
-            extract_merge_target(command) if current_branch == "main" else None
+            extract_merge_target(command) if current_branch in MAIN_BRANCHES else None
         )
 
-        # Get list of modified documentation files
-        modified_docs = get_modified_docs(merge_target)
-
         # If docs were modified, allow the merge
-        if modified_docs:
+        if has_modified_docs(merge_target):
             sys.exit(0)
 
         # No docs modified - block the merge
-        error_msg = f"""{Colors.red("❌ No documentation updates detected in this branch.")}
-
-{Colors.yellow("📝 Files checked:")} CHANGELOG.md, README.md, *.md (excluding .doc-check-ignore patterns)
-
-{Colors.blue("💡 Options:")}
-   1. Update relevant documentation, then retry merge
-   2. If no docs needed, ask user to confirm, then run:
-      {Colors.green("SKIP_DOC_CHECK=1")} git merge <branch>
-
-{Colors.cyan("🔍 Branch diff:")} git diff main...HEAD --name-only"""
-
-        print(error_msg, file=sys.stderr)
+        print(MISSING_DOCS_MESSAGE, file=sys.stderr)
         sys.exit(2)
 
     except Exception:
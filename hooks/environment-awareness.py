@@ -11,15 +11,52 @@ Provides the AI with awareness of:
 
 import json
 import os
-import platform
 import sys
 from datetime import datetime
-from pathlib import Path
+from functools import lru_cache
 from typing import Any
 
 from hook_utils import exit_if_disabled
 
 
+@lru_cache(maxsize=1)
+def get_os_string() -> str:
+    """
+    Get the operating system name and release, computed once per process.
+
+    Returns:
+        OS description such as "macOS 24.0.0" or "Linux 6.2.0".
+    """
+    # Deferred import: only needed for SessionStart events
+    import platform
+
+    os_name = platform.system()
+    os_release = platform.release()
+    if os_name == "Darwin":
+        os_name = "macOS"
+    return f"{os_name} {os_release}"
+
+
+@lru_cache(maxsize=1)
+def get_home_dir() -> str:
+    """
+    Get the user's home directory, computed once per process.
+
+    Reads $HOME directly and only falls back to Path.home() (which queries
+    the password database) when it is unset.
+
+    Returns:
+        Home directory path as a string.
+    """
+    home = os.environ.get("HOME")
+    if home:
+        return home
+
+    from pathlib import Path
+
+    return str(Path.home())
+
+
 def get_environment_context() -> str:
     """
     Gather environment information and format as markdown block.
@@ -36,16 +73,12 @@ def get_environment_context() -> str:
     time_str = now.strftime("%H:%M %Z")
 
     # Get OS info
-    os_name = platform.system()
-    os_release = platform.release()
-    if os_name == "Darwin":
-        os_name = "macOS"
-    os_str = f"{os_name} {os_release}"
+    os_str = get_os_string()
 
     # Get working directory, collapse home to ~
     project_dir = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
-    home = str(Path.home())
-    if project_dir.startswith(home):
+    home = get_home_dir().rstrip(os.sep)
+    if home and (project_dir == home or project_dir.startswith(home + os.sep)):
         project_dir = "~" + project_dir[len(home) :]
 
     return f"""## Environment
@@ -61,7 +94,7 @@ def main() -> None:
     exit_if_disabled()
 
     try:
-        input_data: dict[str, Any] = json.load(sys.stdin)
+        input_data: dict[str, Any] = json.loads(sys.stdin.buffer.read())
 
         # Only process SessionStart events
         if input_data.get("hook_event_name") != "SessionStart":
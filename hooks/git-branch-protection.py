@@ -14,54 +14,72 @@ Note: Tool filtering is handled by the matcher in settings.json.
 This hook assumes it's only called for edit-related tools.
 """
 
-import json
 import re
-import subprocess
 import sys
 
-from hook_utils import Colors, exit_if_disabled
+from hook_utils import (
+    Colors,
+    exit_if_disabled,
+    get_current_branch,
+    read_tool_input,
+    write_stderr,
+)
 
 # Branches where edits are blocked
-PROTECTED_BRANCHES: list[str] = [
-    "main",
-    "master",
-    "production",
-    "prod",
-]
+PROTECTED_BRANCHES: frozenset[str] = frozenset({"main", "master", "production", "prod"})
 
 # Safe redirect targets that should be ignored
-SAFE_REDIRECT_TARGETS = ["/dev/null", "/dev/stdout", "/dev/stderr"]
+SAFE_REDIRECT_TARGETS = frozenset({"/dev/null", "/dev/stdout", "/dev/stderr"})
 
+# Regex pattern finding the next character or command word the write-pattern
+# scanner must inspect; everything in between is skipped in C
+SCAN_PATTERN = re.compile(r"""[\\'"<>\n]|(?:^|(?<=[\s;|&(`]))(?:sed|perl|tee)\b""")
 
-def get_current_branch() -> str | None:
-    """
-    Get the current git branch name.
+# Regex pattern matching the rest of a double-quoted string up to and
+# including the closing quote (backslash escapes allowed)
+DOUBLE_QUOTED_PATTERN = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
 
-    Returns:
-        The current branch name, or None if not in a git repo or error.
-    """
-    try:
-        result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-        return None
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        return None
+# Regex pattern matching a heredoc operator and its delimiter word
+HEREDOC_START_PATTERN = re.compile(r"""<<(-?)\s*(['"]?)(\w+)\2""")
+
+# Regex pattern matching an in-place edit or tee command at a word boundary
+WRITE_COMMAND_PATTERN = re.compile(
+    r"(?P<sed>sed\s+-i)"
+    r"|(?P<perl>perl\s+-i)"
+    r"|tee\s+(?:-\S+\s+)*(?P<tee_target>[^\s;|&]*)"
+)
+
+# Regex pattern capturing the target word of an output redirect
+REDIRECT_TARGET_PATTERN = re.compile(r"\s*([^\s;|&<>()]*)")
+
+# Characters after ">&" that make it a file descriptor duplication
+FD_DUP_CHARS = frozenset("0123456789-")
+
+# Edit/Write blocking messages, formatted and encoded once at import per
+# protected branch
+EDIT_BLOCKED_MESSAGES = {
+    branch: f"""{Colors.red(f"❌ Cannot edit files on protected branch '{branch}'!")}
+{Colors.yellow("📝 Create a feature branch first:")}
+   git checkout -b feature/your-feature-name
+{Colors.blue("💡 Or disable this hook:")}
+   echo "git-branch-protection" >> .claude/disabled-hooks""".encode()
+    for branch in PROTECTED_BRANCHES
+}
+
+# Colored headings of the file-write question, formatted once at import
+WRITE_CHECK_HEADING = Colors.yellow("## Branch Protection Check")
+WRITE_CHECK_PROMPT = Colors.blue("Please verify:")
 
 
 def detect_file_write_patterns(command: str) -> list[tuple[str, str]]:
     """
     Detect potential file-writing patterns in a bash command.
 
-    This uses simple regex patterns and cannot reliably distinguish between:
-    - Actual file writes (echo "x" > file)
-    - Quoted text (git commit -m "x > y")
-    - Comparison operators (awk '{if(x>5)}')
+    Scans the command once from left to right. Single- and double-quoted
+    strings and heredoc bodies are skipped, so text such as
+    `git commit -m "x > y"` or `awk '{if(x>5)}'` is not reported. Unquoted
+    redirects, `tee`, `sed -i` and `perl -i` are still heuristics and cannot
+    account for every shell construct.
 
     Args:
         command: The bash command to analyze
@@ -73,60 +91,125 @@ def detect_file_write_patterns(command: str) -> list[tuple[str, str]]:
     if not command:
         return []
 
-    patterns: list[tuple[str, str]] = []
-
-    # Check for sed -i (in-place edit)
-    sed_match = re.search(r"sed\s+-i(?:\.\w+)?", command)
-    if sed_match:
-        patterns.append(("sed -i", command))
-
-    # Check for perl -i (in-place edit)
-    perl_match = re.search(r"perl\s+-i", command)
-    if perl_match:
-        patterns.append(("perl -i", command))
-
-    # Check for redirect operators (>, >>)
-    # Look for > or >> followed by something that's not a safe target
-    redirect_match = re.search(r">\s*(?!\s*/dev/(?:null|stdout|stderr))", command)
-    if redirect_match:
-        # Make sure it's not redirecting to /dev/null, /dev/stdout, or /dev/stderr
-        is_safe = False
-        for safe_target in SAFE_REDIRECT_TARGETS:
-            if safe_target in command[redirect_match.start() :]:
-                # Check if the safe target is actually after this redirect
-                remaining = command[redirect_match.start() :]
-                if re.search(r">\s*" + re.escape(safe_target), remaining):
-                    is_safe = True
-                    break
-
-        if not is_safe:
-            if ">>" in command[redirect_match.start() : redirect_match.start() + 3]:
-                patterns.append(("redirect >>", command))
-            else:
-                patterns.append(("redirect >", command))
-
-    # Check for tee command (writes to file)
-    tee_match = re.search(r"\btee\s+", command)
-    if tee_match:
-        # Make sure it's not tee to /dev/null
-        remaining = command[tee_match.end() :]
-        is_safe = any(
-            safe in remaining.split()[0] if remaining.split() else ""
-            for safe in SAFE_REDIRECT_TARGETS
-        )
-        if not is_safe:
-            patterns.append(("tee", command))
-
-    # Check for heredoc with redirect (<<EOF ... > file)
-    heredoc_match = re.search(r"<<\w+.*?>", command, re.DOTALL)
-    if heredoc_match:
-        is_safe = any(
-            safe in command[heredoc_match.start() :] for safe in SAFE_REDIRECT_TARGETS
-        )
-        if not is_safe:
-            patterns.append(("heredoc redirect", command))
-
-    return patterns
+    # Insertion-ordered set of detected pattern names
+    found: dict[str, None] = {}
+    pending_heredocs: list[tuple[str, bool]] = []
+    has_heredoc = False
+    pos = 0
+
+    while True:
+        match = SCAN_PATTERN.search(command, pos)
+        if match is None:
+            break
+        i = match.start()
+        token = match.group()
+
+        if token == "\\":
+            # Escaped character outside quotes
+            pos = i + 2
+        elif token == "'":
+            # Single quotes have no escapes; skip to the closing quote
+            end = command.find("'", i + 1)
+            if end < 0:
+                break
+            pos = end + 1
+        elif token == '"':
+            quoted = DOUBLE_QUOTED_PATTERN.match(command, i + 1)
+            if quoted is None:
+                break
+            pos = quoted.end()
+        elif token == "\n":
+            pos = skip_heredoc_bodies(command, i + 1, pending_heredocs)
+            pending_heredocs.clear()
+        elif token == "<":
+            heredoc = HEREDOC_START_PATTERN.match(command, i)
+            if heredoc is None:
+                # Plain input redirect or here-string (<<<)
+                pos = i + (3 if command.startswith("<<<", i) else 1)
+                continue
+            pending_heredocs.append((heredoc.group(3), heredoc.group(1) == "-"))
+            has_heredoc = True
+            pos = heredoc.end()
+        elif token == ">":
+            pos = scan_redirect(command, i, found)
+        else:
+            # Command word at a word boundary: sed, perl or tee
+            write_command = WRITE_COMMAND_PATTERN.match(command, i)
+            if write_command is not None:
+                if write_command.group("sed"):
+                    found["sed -i"] = None
+                elif write_command.group("perl"):
+                    found["perl -i"] = None
+                elif write_command.group("tee_target") not in SAFE_REDIRECT_TARGETS:
+                    found["tee"] = None
+            pos = match.end()
+
+    if has_heredoc and ("redirect >" in found or "redirect >>" in found):
+        found["heredoc redirect"] = None
+
+    return [(name, command) for name in found]
+
+
+def scan_redirect(command: str, index: int, found: dict[str, None]) -> int:
+    """
+    Record an output redirect at index unless it targets a safe location.
+
+    File descriptor duplication (`2>&1`) and process substitution (`>(...)`)
+    are not file writes and are skipped.
+
+    Args:
+        command: The bash command being scanned.
+        index: Position of the `>` character.
+        found: Insertion-ordered set of detected pattern names to update.
+
+    Returns:
+        Position to resume scanning from.
+    """
+    if command.startswith(">>", index):
+        name, op_end = "redirect >>", index + 2
+    else:
+        name, op_end = "redirect >", index + 1
+
+    following = command[op_end : op_end + 1]
+    if following == "(" or (
+        following == "&" and command[op_end + 1 : op_end + 2] in FD_DUP_CHARS
+    ):
+        return op_end + 1
+    if following in ("|", "&"):
+        op_end += 1
+
+    target = REDIRECT_TARGET_PATTERN.match(command, op_end)
+    if target is None or target.group(1) not in SAFE_REDIRECT_TARGETS:
+        found[name] = None
+    return op_end
+
+
+def skip_heredoc_bodies(
+    command: str, start: int, heredocs: list[tuple[str, bool]]
+) -> int:
+    """
+    Skip the bodies of heredocs opened on the line ending before start.
+
+    Args:
+        command: The bash command being scanned.
+        start: Position just after the newline that ends the heredoc line.
+        heredocs: Pending (terminator, strip_tabs) pairs in opening order.
+
+    Returns:
+        Position just after the last terminator line, or the end of the
+        command if a terminator is missing.
+    """
+    pos = start
+    for terminator, strip_tabs in heredocs:
+        while pos < len(command):
+            end = command.find("\n", pos)
+            if end < 0:
+                end = len(command)
+            line = command[pos:end]
+            pos = end + 1
+            if (line.lstrip("\t") if strip_tabs else line) == terminator:
+                break
+    return min(pos, len(command))
 
 
 def main() -> None:
@@ -135,7 +218,7 @@ def main() -> None:
 
     try:
         # Read and parse stdin
-        input_data = json.load(sys.stdin)
+        input_data = read_tool_input()
         tool_name = input_data.get("tool_name", "")
         tool_input = input_data.get("tool_input", {})
 
@@ -152,12 +235,7 @@ def main() -> None:
 
         # For Edit/Write tools: Block with exit 2
         if tool_name in ["Edit", "Write"]:
-            error_msg = f"""{Colors.red(f"❌ Cannot edit files on protected branch '{current_branch}'!")}
-{Colors.yellow("📝 Create a feature branch first:")}
-   git checkout -b feature/your-feature-name
-{Colors.blue("💡 Or disable this hook:")}
-   echo "git-branch-protection" >> .claude/disabled-hooks"""
-            print(error_msg, file=sys.stderr)
+            write_stderr(EDIT_BLOCKED_MESSAGES[current_branch])
             sys.exit(2)
 
         # For Bash tool: Check for file-write patterns
@@ -172,7 +250,7 @@ def main() -> None:
                 )
 
                 question = f"""---
-{Colors.yellow("## Branch Protection Check")}
+{WRITE_CHECK_HEADING}
 
 You are on protected branch '{current_branch}'.
 
@@ -186,7 +264,7 @@ However, pattern matching cannot reliably distinguish between:
 - Quoted text (`git commit -m "x > y"`) - just text
 - Comparison operators (`awk '{{if(x>5)}}'`) - not a write
 
-{Colors.blue("Please verify:")} Does this command actually write files on the protected branch?
+{WRITE_CHECK_PROMPT} Does this command actually write files on the protected branch?
 If yes, consider using the Edit tool or a feature branch instead.
 ---"""
                 print(question, file=sys.stderr)
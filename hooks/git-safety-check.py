@@ -10,12 +10,95 @@ This hook prevents dangerous Git operations including:
 - Clean operations that delete untracked files
 """
 
-import json
 import re
 import sys
 from typing import Any
 
-from hook_utils import Colors, exit_if_disabled
+from hook_utils import Colors, exit_if_disabled, read_tool_input, write_stderr
+
+# Protected branches that cannot be deleted
+PROTECTED_BRANCHES: frozenset[str] = frozenset({"main", "master", "production", "prod"})
+
+# Regex pattern matching --no-verify as a standalone command argument
+NO_VERIFY_PATTERN = re.compile(r"(^|\s)--no-verify(\s|$)")
+
+# Regex pattern matching a quoted -m "..." commit message (may span lines)
+COMMIT_MESSAGE_PATTERN = re.compile(r'-m\s+["\'].*?["\']', re.DOTALL)
+
+# Regex pattern matching a heredoc operator and capturing its delimiter word
+HEREDOC_START_PATTERN = re.compile(r"""<<(-?)\s*(['"]?)(\w+)\2""")
+
+# Protected branch names as a regex alternation. Longest names come first so
+# "production" is matched (and reported) before its prefix "prod".
+PROTECTED_BRANCH_ALTERNATION = "|".join(
+    re.escape(branch)
+    for branch in sorted(PROTECTED_BRANCHES, key=lambda name: (-len(name), name))
+)
+
+# Regex pattern matching remote deletion of any protected branch
+# (git push origin :branch), capturing the branch name
+REMOTE_DELETE_PATTERN = re.compile(
+    rf"git push origin :({PROTECTED_BRANCH_ALTERNATION})"
+)
+
+# Regex pattern matching local deletion of any protected branch, capturing
+# the branch name. Use \s+ (not .*) after flag to prevent false positives in
+# chained commands like "git branch -d feature && git push origin main".
+# Word boundary ensures exact branch match at command/separator boundaries.
+LOCAL_DELETE_PATTERN = re.compile(
+    rf"git\s+branch\s+-[dD]\s+({PROTECTED_BRANCH_ALTERNATION})(\s|$|&&|;|\|)"
+)
+
+# Blocking messages, formatted and encoded once at import since the branch
+# set is fixed
+NO_VERIFY_MESSAGE = Colors.red(
+    "❌ Using --no-verify to skip Git hooks is prohibited!"
+).encode()
+BRANCH_DELETE_MESSAGES = {
+    branch: Colors.red(
+        f"❌ Blocked: Cannot delete protected branch '{branch}'"
+    ).encode()
+    for branch in PROTECTED_BRANCHES
+}
+
+
+def is_in_heredoc(command: str, pos: int) -> bool:
+    """
+    Check whether a position falls inside a heredoc body.
+
+    Heredoc bodies start on the line after the `<<DELIM` operator and end at
+    a line consisting of the delimiter. Terminators are located with
+    str.find line by line, so the check is linear in the command length.
+
+    Args:
+        command: The bash command being executed.
+        pos: Character offset to check.
+
+    Returns:
+        True if pos is inside a heredoc body, False otherwise.
+    """
+    for heredoc in HEREDOC_START_PATTERN.finditer(command, 0, pos):
+        body_start = command.find("\n", heredoc.end()) + 1
+        if body_start == 0 or body_start > pos:
+            # pos is on the operator line, which is not part of the body
+            continue
+
+        terminator = heredoc.group(3)
+        strip_tabs = heredoc.group(1) == "-"
+        line_start = body_start
+        while line_start <= pos:
+            line_end = command.find("\n", line_start)
+            if line_end < 0:
+                # Unterminated heredocs run to the end of the command
+                return True
+            line = command[line_start:line_end]
+            if (line.lstrip("\t") if strip_tabs else line) == terminator:
+                break
+            line_start = line_end + 1
+        else:
+            return True
+
+    return False
 
 
 def check_git_command(command: str) -> None:
@@ -35,53 +118,41 @@ def check_git_command(command: str) -> None:
     """
     # Check if --no-verify is used to skip hooks - block immediately
     # Only detect --no-verify as a command argument, not within quotes or heredocs
-    if re.search(r"(^|\s)--no-verify(\s|$)", command):
+    # Literal check first: the regex only runs when the flag text is present
+    if "--no-verify" in command and NO_VERIFY_PATTERN.search(command):
         # Further validation: ensure it's not inside quotes or heredocs
         verify_pos = command.find("--no-verify")
         safe_in_content = False
 
         # Check if --no-verify is inside -m "..." message (re.DOTALL for multiline)
-        msg_match = re.search(r'-m\s+["\'].*?["\']', command, re.DOTALL)
+        msg_match = COMMIT_MESSAGE_PATTERN.search(command)
         if msg_match and msg_match.start() < verify_pos < msg_match.end():
             safe_in_content = True
 
-        # Check if --no-verify is inside <<'EOF' ... EOF heredoc
-        heredoc_match = re.search(r'<<["\']?EOF["\']?.*?EOF', command, re.DOTALL)
-        if heredoc_match and heredoc_match.start() < verify_pos < heredoc_match.end():
+        # Check if --no-verify is inside a heredoc body (<<'EOF' ... EOF)
+        if is_in_heredoc(command, verify_pos):
             safe_in_content = True
 
         if not safe_in_content:
-            error_msg = Colors.red(
-                "❌ Using --no-verify to skip Git hooks is prohibited!"
-            )
-            print(error_msg, file=sys.stderr)
+            write_stderr(NO_VERIFY_MESSAGE)
             sys.exit(2)
 
-    # Protected branches that cannot be deleted
-    protected_branches = ["main", "master", "production", "prod"]
-
     # Check for protected branch deletion attempts - block immediately
-    for branch in protected_branches:
-        # Check for remote branch deletion: git push origin :branch
-        if f"git push origin :{branch}" in command:
-            error_msg = Colors.red(
-                f"❌ Blocked: Cannot delete protected branch '{branch}'"
-            )
-            print(error_msg, file=sys.stderr)
-            sys.exit(2)
-
-        # Check for local branch deletion: git branch -d/-D branch
-        # Use \s+ (not .*) after flag to prevent false positives in chained commands
-        # like "git branch -d feature && git push origin main"
-        # Word boundary ensures exact branch match at command/separator boundaries
-        if re.search(
-            rf"git\s+branch\s+-[dD]\s+{re.escape(branch)}(\s|$|&&|;|\|)", command
-        ):
-            error_msg = Colors.red(
-                f"❌ Blocked: Cannot delete protected branch '{branch}'"
-            )
-            print(error_msg, file=sys.stderr)
-            sys.exit(2)
+    # Literal checks gate each kind of deletion before any regex search
+    remote_delete = "git push origin :" in command
+    # The deletion patterns allow any whitespace, so gate on the bare keyword
+    local_delete = "branch" in command
+    if not (remote_delete or local_delete):
+        return
+
+    # Remote (git push origin :branch) then local (git branch -d/-D branch)
+    # deletion, each a single alternation search over all protected branches
+    delete_match = (remote_delete and REMOTE_DELETE_PATTERN.search(command)) or (
+        local_delete and LOCAL_DELETE_PATTERN.search(command)
+    )
+    if delete_match:
+        write_stderr(BRANCH_DELETE_MESSAGES[delete_match.group(1)])
+        sys.exit(2)
 
     # Dangerous operation patterns (logged only, not blocked)
     # These are informational warnings for the user
@@ -97,8 +168,7 @@ def main() -> None:
 
     try:
         # Read hook data from stdin
-        tool_use_json = sys.stdin.read()
-        tool_use: dict[str, Any] = json.loads(tool_use_json)
+        tool_use: dict[str, Any] = read_tool_input()
 
         # Only process Bash commands
         if tool_use.get("tool_name") != "Bash":
@@ -5,18 +5,74 @@ Shared utilities for Claude Code hooks.
 This module provides common functionality for hook scripts including:
 - Hook name detection
 - Disabled hook checking
+- Raw stdin reading and hook input parsing
+- Current git branch lookup
 - Environment variable access
 - Centralized ANSI color formatting
 - File classification and analysis
-- Language detection for code projects
+- Directory traversal and language detection for code projects
 """
 
 import fnmatch
-import json
 import os
+import re
+import stat
 import sys
+from collections.abc import Collection, Iterator
 from enum import Enum
-from pathlib import Path
+from functools import lru_cache
+from typing import Any
+
+__all__ = [
+    "BINARY_EXTENSIONS",
+    "CODE_EXTENSIONS",
+    "DATA_EXTENSIONS",
+    "LANGUAGE_BY_EXTENSION",
+    "Colors",
+    "FilenameMatcher",
+    "Language",
+    "build_language_extensions",
+    "classify_file",
+    "count_lines",
+    "detect_project_languages",
+    "estimate_tokens",
+    "exit_if_disabled",
+    "find_executable",
+    "find_git_dir",
+    "get_claude_settings",
+    "get_current_branch",
+    "get_current_branch_from_git",
+    "get_hook_name",
+    "get_large_file_threshold",
+    "is_hook_disabled",
+    "iter_files",
+    "load_claude_settings",
+    "load_disabled_hooks",
+    "read_head_branch",
+    "read_stdin_bytes",
+    "read_tool_input",
+    "translate_patterns",
+    "write_stderr",
+]
+
+# Bytes requested per os.read() call by read_stdin_bytes()
+STDIN_READ_SIZE = 65536
+
+# Bytes read per chunk by count_lines()
+COUNT_LINES_CHUNK_SIZE = 1 << 20
+
+# Prefix of the HEAD file contents when a branch is checked out
+HEAD_REF_PREFIX = "ref: refs/heads/"
+
+# Branch named by the placeholder HEAD of a reftable repository, whose real
+# HEAD lives in the reftable files rather than in .git/HEAD
+REFTABLE_PLACEHOLDER_BRANCH = ".invalid"
+
+# Prefix of a .git file pointing at the real git directory (worktrees)
+GITDIR_PREFIX = "gitdir:"
+
+# Regex pattern matching a detached HEAD commit hash (SHA-1 or SHA-256)
+DETACHED_HEAD_PATTERN = re.compile(r"[0-9a-f]{40}(?:[0-9a-f]{24})?")
 
 
 class Colors:
@@ -30,30 +86,40 @@ class Colors:
     CYAN = "\033[1;36m"
     RESET = "\033[0m"
 
+    # Evaluated once at import; NO_COLOR (https://no-color.org) disables codes
+    ENABLED = not os.environ.get("NO_COLOR")
+
+    @classmethod
+    def _wrap(cls, code: str, text: str) -> str:
+        """Wrap text in the given color code, or return it as-is if disabled."""
+        if not cls.ENABLED:
+            return text
+        return f"{code}{text}{cls.RESET}"
+
     @classmethod
     def red(cls, text: str) -> str:
         """Format text in red (for errors and blocking messages)."""
-        return f"{cls.RED}{text}{cls.RESET}"
+        return cls._wrap(cls.RED, text)
 
     @classmethod
     def yellow(cls, text: str) -> str:
         """Format text in yellow (for warnings and labels)."""
-        return f"{cls.YELLOW}{text}{cls.RESET}"
+        return cls._wrap(cls.YELLOW, text)
 
     @classmethod
     def green(cls, text: str) -> str:
         """Format text in green (for suggestions and alternatives)."""
-        return f"{cls.GREEN}{text}{cls.RESET}"
+        return cls._wrap(cls.GREEN, text)
 
     @classmethod
     def blue(cls, text: str) -> str:
         """Format text in blue (for tips and informational messages)."""
-        return f"{cls.BLUE}{text}{cls.RESET}"
+        return cls._wrap(cls.BLUE, text)
 
     @classmethod
     def cyan(cls, text: str) -> str:
         """Format text in cyan (for highlighting)."""
-        return f"{cls.CYAN}{text}{cls.RESET}"
+        return cls._wrap(cls.CYAN, text)
 
 
 def get_hook_name() -> str:
@@ -67,10 +133,8 @@ def get_hook_name() -> str:
         If the calling script is 'git-commit-message-filter.py',
         returns 'git-commit-message-filter'.
     """
-    # Get the calling script's filename
-    caller_path = Path(sys.argv[0])
-    hook_name = caller_path.stem  # filename without extension
-    return hook_name
+    # Get the calling script's filename without extension
+    return os.path.splitext(os.path.basename(sys.argv[0]))[0]
 
 
 def is_hook_disabled(hook_name: str | None = None) -> bool:
@@ -97,7 +161,14 @@ def is_hook_disabled(hook_name: str | None = None) -> bool:
 
         is_hook_disabled('git-commit-message-filter')  # Returns True
         is_hook_disabled('prompt-flag-appender')       # Returns False
+
+    Setting CLAUDE_HOOKS_ALL_ENABLED=1 skips the file lookup entirely and
+    treats every hook as enabled.
     """
+    # Fast path: no filesystem access when all hooks are declared enabled
+    if os.environ.get("CLAUDE_HOOKS_ALL_ENABLED") == "1":
+        return False
+
     if hook_name is None:
         hook_name = get_hook_name()
 
@@ -108,32 +179,52 @@ def is_hook_disabled(hook_name: str | None = None) -> bool:
         return False
 
     # Construct path to disabled-hooks file
-    disabled_hooks_file = Path(project_dir) / ".claude" / "disabled-hooks"
-
-    # If the file doesn't exist, no hooks are disabled
-    if not disabled_hooks_file.is_file():
-        return False
+    disabled_hooks_file = os.path.join(project_dir, ".claude", "disabled-hooks")
 
     try:
-        # Read and parse the disabled-hooks file
-        with disabled_hooks_file.open("r", encoding="utf-8") as f:
-            for line in f:
-                # Strip whitespace and skip comments and empty lines
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-
-                # Check if this hook is disabled
-                if line == hook_name:
-                    return True
+        # A single stat provides both the existence check and the cache key
+        file_stat = os.stat(disabled_hooks_file)
+        if not stat.S_ISREG(file_stat.st_mode):
+            return False
 
-        return False
+        disabled = load_disabled_hooks(
+            disabled_hooks_file, file_stat.st_mtime_ns, file_stat.st_size
+        )
+        return hook_name in disabled
 
     except OSError:
-        # If we can't read the file, assume the hook is not disabled
+        # If the file doesn't exist or can't be read, assume not disabled
         return False
 
 
+@lru_cache(maxsize=1)
+def load_disabled_hooks(path: str, mtime_ns: int, size: int) -> frozenset[str]:
+    """
+    Parse a disabled-hooks file into a set of hook names.
+
+    Cached per file path, modification time and size, so repeated checks in
+    the same process reuse the parsed set until the file changes.
+
+    Args:
+        path: Path to the disabled-hooks file.
+        mtime_ns: File modification time in nanoseconds (cache key only).
+        size: File size in bytes (cache key only).
+
+    Returns:
+        Frozen set of disabled hook names, excluding comments and blank lines.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+
+    # Strip whitespace and skip comments and empty lines
+    return frozenset(
+        name for line in lines if (name := line.strip()) and not name.startswith("#")
+    )
+
+
 def exit_if_disabled(hook_name: str | None = None) -> None:
     """
     Exit the hook script with status 0 if the hook is disabled.
@@ -154,24 +245,211 @@ def exit_if_disabled(hook_name: str | None = None) -> None:
         sys.exit(0)
 
 
-def classify_file(file_path: str) -> str:
+def read_stdin_bytes() -> bytes:
     """
-    Classify a file by its extension into binary, code, data, or unknown.
+    Read the hook input from stdin as raw bytes until EOF.
+
+    Uses os.read() on file descriptor 0 directly, bypassing the sys.stdin
+    text and buffer layers. Hook payloads are small JSON documents, so the
+    first read normally returns all of them; larger inputs are accumulated
+    in a single bytearray rather than truncated.
+
+    Returns:
+        The complete stdin contents.
+
+    Example:
+        input_data = json.loads(read_stdin_bytes())
+    """
+    data = bytearray()
+    while chunk := os.read(0, STDIN_READ_SIZE):
+        data += chunk
+    return bytes(data)
+
+
+def write_stderr(message: bytes) -> None:
+    """
+    Write a pre-encoded message line to stderr as raw bytes.
+
+    Hooks encode their static blocking messages once at import, so this
+    skips the per-call encoding of print(). Pending text output is flushed
+    first to keep earlier print() calls in order.
 
     Args:
-        file_path: Path to the file to classify.
+        message: UTF-8 encoded message without a trailing newline.
+
+    Example:
+        write_stderr(Colors.red("❌ Blocked").encode())
+    """
+    sys.stderr.flush()
+    sys.stderr.buffer.write(message + b"\n")
+    sys.stderr.buffer.flush()
+
+
+@lru_cache(maxsize=1)
+def read_tool_input() -> dict[str, Any]:
+    """
+    Read and parse the hook input JSON from stdin.
+
+    Stdin can only be consumed once, so the parsed payload is cached for
+    the lifetime of the process and shared by every caller.
 
     Returns:
-        One of: "binary", "code", "data", "unknown"
+        The parsed hook input.
+
+    Raises:
+        ValueError: If stdin does not contain valid JSON.
+    """
+    # Deferred import: disabled hooks exit before paying for it
+    import json
+
+    return json.loads(read_stdin_bytes())
+
+
+@lru_cache(maxsize=8)
+def find_executable(name: str) -> str:
+    """
+    Resolve a command name to its path on PATH.
+
+    subprocess only uses its posix_spawn() fast path (avoiding a fork of
+    the whole interpreter) when the executable includes a directory and
+    close_fds=False, so callers pass the resolved path as `executable=`.
+    Looked up once per process per name.
+
+    Args:
+        name: Command name such as "git".
+
+    Returns:
+        Path to the executable, or the bare name if it is not found on PATH
+        (letting subprocess raise FileNotFoundError as usual).
 
     Example:
-        classify_file("image.png")      # Returns "binary"
-        classify_file("script.py")      # Returns "code"
-        classify_file("config.json")    # Returns "data"
-        classify_file("readme.txt")     # Returns "unknown"
+        find_executable("git")  # Returns "/usr/bin/git"
+    """
+    for directory in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        candidate = os.path.join(directory or os.curdir, name)
+        if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+            return candidate
+    return name
+
+
+def find_git_dir(start: str) -> str | None:
+    """
+    Find the git directory for a working tree path.
+
+    Walks upward from start looking for a .git entry. A .git directory is
+    returned as-is; a .git file (worktree or submodule) is resolved through
+    its "gitdir:" pointer.
+
+    Args:
+        start: Directory to start searching from.
+
+    Returns:
+        Path to the git directory, or None if none is found.
+    """
+    current = os.path.abspath(start)
+    while True:
+        candidate = os.path.join(current, ".git")
+        if os.path.isdir(candidate):
+            return candidate
+        if os.path.isfile(candidate):
+            try:
+                with open(candidate, encoding="utf-8") as f:
+                    pointer = f.readline().strip()
+            except OSError:
+                return None
+            if not pointer.startswith(GITDIR_PREFIX):
+                return None
+            git_dir = pointer[len(GITDIR_PREFIX) :].strip()
+            return os.path.join(current, git_dir)
+
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def read_head_branch() -> str | None:
     """
-    # Define file type extensions
-    BINARY_EXTENSIONS = {
+    Read the current branch name directly from the HEAD file.
+
+    Returns None when $GIT_DIR is set or the repository uses reftable, since
+    the HEAD file found by walking up from the working directory does not
+    name the current branch in either case.
+
+    Returns:
+        The branch name, an empty string for a detached HEAD (matching
+        `git branch --show-current`), or None if HEAD cannot be read or parsed.
+    """
+    # $GIT_DIR overrides repository discovery; leave resolving it to git
+    if "GIT_DIR" in os.environ:
+        return None
+
+    git_dir = find_git_dir(os.getcwd())
+    if git_dir is None:
+        return None
+
+    try:
+        with open(os.path.join(git_dir, "HEAD"), encoding="utf-8") as f:
+            head = f.readline().strip()
+    except OSError:
+        return None
+
+    if head.startswith(HEAD_REF_PREFIX):
+        branch = head[len(HEAD_REF_PREFIX) :]
+        return None if branch == REFTABLE_PLACEHOLDER_BRANCH else branch
+    if DETACHED_HEAD_PATTERN.fullmatch(head):
+        return ""
+    return None
+
+
+@lru_cache(maxsize=1)
+def get_current_branch() -> str | None:
+    """
+    Get the current git branch name.
+
+    Reads the HEAD file directly and only spawns `git branch --show-current`
+    when HEAD cannot be located or parsed. The result, including a failed
+    lookup, is cached for the lifetime of the process so hooks never spawn
+    git twice.
+
+    Returns:
+        The current branch name, or None if not in a git repo or error.
+    """
+    branch = read_head_branch()
+    if branch is None:
+        branch = get_current_branch_from_git()
+    return branch
+
+
+def get_current_branch_from_git() -> str | None:
+    """
+    Get the current git branch name by running git.
+
+    Returns:
+        The current branch name, or None if not in a git repo or error.
+    """
+    # Deferred import: only needed when .git/HEAD cannot be read directly
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ["git", "branch", "--show-current"],
+            executable=find_executable("git"),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
+            timeout=5,
+        )
+        if result.returncode == 0:
+            return result.stdout.strip().decode("utf-8", "replace")
+        return None
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return None
+
+
+# File extensions used by classify_file()
+BINARY_EXTENSIONS: frozenset[str] = frozenset(
+    {
         ".png",
         ".jpg",
         ".jpeg",
@@ -184,7 +462,9 @@ def classify_file(file_path: str) -> str:
         ".tar",
         ".gz",
     }
-    CODE_EXTENSIONS = {
+)
+CODE_EXTENSIONS: frozenset[str] = frozenset(
+    {
         ".py",
         ".js",
         ".ts",
@@ -201,10 +481,30 @@ def classify_file(file_path: str) -> str:
         ".tsx",
         ".jsx",
     }
-    DATA_EXTENSIONS = {".json", ".yaml", ".yml", ".xml", ".csv", ".toml"}
+)
+DATA_EXTENSIONS: frozenset[str] = frozenset(
+    {".json", ".yaml", ".yml", ".xml", ".csv", ".toml"}
+)
+
+
+def classify_file(file_path: str) -> str:
+    """
+    Classify a file by its extension into binary, code, data, or unknown.
 
+    Args:
+        file_path: Path to the file to classify.
+
+    Returns:
+        One of: "binary", "code", "data", "unknown"
+
+    Example:
+        classify_file("image.png")      # Returns "binary"
+        classify_file("script.py")      # Returns "code"
+        classify_file("config.json")    # Returns "data"
+        classify_file("readme.txt")     # Returns "unknown"
+    """
     # Get extension in lowercase
-    ext = Path(file_path).suffix.lower()
+    ext = os.path.splitext(file_path)[1].lower()
 
     if ext in BINARY_EXTENSIONS:
         return "binary"
@@ -220,7 +520,8 @@ def estimate_tokens(content: str) -> int:
     """
     Estimate the number of tokens in text content.
 
-    Uses empirically validated 3.5 characters per token ratio.
+    Uses empirically validated 3.5 characters per token ratio, computed
+    as len * 2 // 7 in integer arithmetic.
 
     Args:
         content: Text content to estimate tokens for.
@@ -234,33 +535,109 @@ def estimate_tokens(content: str) -> int:
     """
     if not content:
         return 0
-    return int(len(content) / 3.5)
+    return len(content) * 2 // 7
 
 
-def count_lines(file_path: str) -> int:
+def count_lines(file_path: str, limit: int | None = None) -> int:
     """
     Count lines in a file using memory-efficient streaming.
 
+    Reads the file in unbuffered binary chunks and counts newline bytes
+    with bytes.count(), so no text decoding or per-line Python work is done.
+    A final line without a trailing newline is counted as well.
+
     Args:
         file_path: Path to the file to count lines in.
+        limit: Optional line count to stop at. Once more than `limit` lines
+               have been seen, reading stops and the lines counted so far
+               are returned, a lower bound on the real count.
 
     Returns:
-        Number of lines in the file, or 0 on error.
+        Number of lines in the file (or counted before exceeding `limit`),
+        or 0 on error.
 
     Example:
-        count_lines("script.py")     # Returns line count
-        count_lines("/nonexistent")  # Returns 0
+        count_lines("script.py")            # Returns line count
+        count_lines("script.py", limit=500)  # Stops once past 500 lines
+        count_lines("/nonexistent")         # Returns 0
     """
     try:
         count = 0
-        with open(file_path, encoding="utf-8", errors="ignore") as f:
-            for _ in f:
-                count += 1
+        last_chunk = b""
+        with open(file_path, "rb", buffering=0) as f:
+            read = f.read
+            while chunk := read(COUNT_LINES_CHUNK_SIZE):
+                count += chunk.count(b"\n")
+                last_chunk = chunk
+                if limit is not None and count > limit:
+                    break
+        if last_chunk and not last_chunk.endswith(b"\n"):
+            count += 1
         return count
     except OSError:
         return 0
 
 
+def get_claude_settings() -> dict[str, Any]:
+    """
+    Read the user's ~/.claude/settings.json.
+
+    Returns:
+        Parsed settings, or an empty dict if the file is missing, unreadable,
+        malformed or not a JSON object.
+
+    Example:
+        get_claude_settings().get("largeFileThreshold")  # Returns 1000 or None
+    """
+    home = os.environ.get("HOME")
+    if not home:
+        return {}
+
+    settings_path = os.path.join(home, ".claude", "settings.json")
+
+    try:
+        # A single stat provides both the existence check and the cache key
+        file_stat = os.stat(settings_path)
+        if not stat.S_ISREG(file_stat.st_mode):
+            return {}
+
+        settings = load_claude_settings(
+            settings_path, file_stat.st_mtime_ns, file_stat.st_size
+        )
+    except (OSError, ValueError):  # JSONDecodeError is a ValueError
+        return {}
+
+    return settings if isinstance(settings, dict) else {}
+
+
+@lru_cache(maxsize=1)
+def load_claude_settings(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a settings.json file.
+
+    Cached per file path, modification time and size, so every settings
+    lookup in the same process shares one parse until the file changes.
+
+    Args:
+        path: Path to the settings file.
+        mtime_ns: File modification time in nanoseconds (cache key only).
+        size: File size in bytes (cache key only).
+
+    Returns:
+        The decoded JSON value.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not valid JSON.
+    """
+    # Deferred import: disabled hooks exit before reaching this
+    import json
+
+    with open(path, "rb") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=1)
 def get_large_file_threshold() -> int:
     """
     Get large file threshold from configuration.
@@ -270,6 +647,8 @@ def get_large_file_threshold() -> int:
     2. LARGE_FILE_THRESHOLD environment variable
     3. Default: 500 lines
 
+    The result is cached for the lifetime of the hook process.
+
     Returns:
         Threshold value in lines.
 
@@ -285,15 +664,10 @@ def get_large_file_threshold() -> int:
     """
     # Try settings.json first
     try:
-        home = os.environ.get("HOME")
-        if home:
-            settings_path = Path(home) / ".claude" / "settings.json"
-            if settings_path.is_file():
-                with open(settings_path, encoding="utf-8") as f:
-                    settings = json.load(f)
-                    if "largeFileThreshold" in settings:
-                        return int(settings["largeFileThreshold"])
-    except (OSError, ValueError, json.JSONDecodeError):
+        settings = get_claude_settings()
+        if "largeFileThreshold" in settings:
+            return int(settings["largeFileThreshold"])
+    except ValueError:
         pass
 
     # Try environment variable second
@@ -308,11 +682,28 @@ def get_large_file_threshold() -> int:
     return 500
 
 
+def translate_patterns(patterns: list[str]) -> str:
+    """
+    Translate glob patterns into one regex alternation.
+
+    Args:
+        patterns: List of glob patterns (e.g., ["*.py", "*.pyi"])
+
+    Returns:
+        Regex source matching a filename against any of the patterns.
+        An empty pattern list yields a regex that never matches.
+    """
+    if not patterns:
+        return "(?!)"
+    return "|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in patterns)
+
+
 class FilenameMatcher:
     """
     Pattern-based filename matcher using fnmatch for glob-style patterns.
 
-    Supports patterns like *.py, *.js, Makefile, etc.
+    Supports patterns like *.py, *.js, Makefile, etc. All patterns are
+    translated into a single compiled regex, so a match is one regex call.
     """
 
     def __init__(self, patterns: list[str]) -> None:
@@ -323,6 +714,7 @@ class FilenameMatcher:
             patterns: List of glob patterns (e.g., ["*.py", "*.pyi"])
         """
         self.patterns = patterns
+        self.regex = re.compile(translate_patterns(patterns))
 
     def matches(self, filename: str) -> bool:
         """
@@ -340,15 +732,7 @@ class FilenameMatcher:
             matcher.matches("/path/to/file.py") # Returns True
             matcher.matches("file.txt")         # Returns False
         """
-        # Extract basename from path
-        basename = Path(filename).name
-
-        # Check against all patterns
-        for pattern in self.patterns:
-            if fnmatch.fnmatch(basename, pattern):
-                return True
-
-        return False
+        return self.regex.match(os.path.basename(filename)) is not None
 
 
 class Language(Enum):
@@ -409,10 +793,13 @@ class Language(Enum):
         self.patterns = patterns
         self.is_experimental = is_experimental
 
+    @lru_cache(maxsize=64)
     def get_source_fn_matcher(self) -> FilenameMatcher:
         """
         Get FilenameMatcher for this language's source files.
 
+        The matcher is built once per language and reused on later calls.
+
         Returns:
             FilenameMatcher configured with this language's patterns
 
@@ -423,6 +810,68 @@ class Language(Enum):
         return FilenameMatcher(self.patterns)
 
 
+# Regex pattern matching a plain "*.ext" glob, capturing the extension
+EXTENSION_GLOB_PATTERN = re.compile(r"\*(\.[^*?\[\]]+)")
+
+
+def build_language_extensions() -> dict[str, Language]:
+    """
+    Map lowercase source file extensions to non-experimental languages.
+
+    Only plain "*.ext" patterns are indexed; when two languages share an
+    extension, the first one in enum order wins.
+
+    Returns:
+        Dictionary from extension (with leading dot) to Language.
+    """
+    extensions: dict[str, Language] = {}
+    for language in Language:
+        if language.is_experimental:
+            continue
+        for pattern in language.patterns:
+            match = EXTENSION_GLOB_PATTERN.fullmatch(pattern)
+            if match:
+                extensions.setdefault(match.group(1).lower(), language)
+    return extensions
+
+
+# Lowercase source file extension to Language, built once at import time
+LANGUAGE_BY_EXTENSION = build_language_extensions()
+
+
+def iter_files(root: str, skip_dirs: Collection[str]) -> Iterator[os.DirEntry[str]]:
+    """
+    Yield every non-directory entry below root, skipping named directories.
+
+    Built on os.scandir, so file types come from the directory listing
+    without a stat call per entry. Like os.walk, symlinked directories are
+    not descended into and unreadable directories are silently skipped.
+
+    Args:
+        root: Directory to traverse.
+        skip_dirs: Directory names (not paths) to prune from the traversal.
+
+    Yields:
+        os.DirEntry for each file, including symlinks to files.
+
+    Example:
+        for entry in iter_files("/path/to/project", {".git"}):
+            print(entry.path)
+    """
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if entry.name not in skip_dirs and not entry.is_symlink():
+                            pending.append(entry.path)
+                    else:
+                        yield entry
+        except OSError:
+            continue
+
+
 def detect_project_languages(directory: str) -> list[Language]:
     """
     Detect programming languages in a project directory.
@@ -459,27 +908,15 @@ def detect_project_languages(directory: str) -> list[Language]:
     }
 
     try:
-        root_path = Path(directory)
-        if not root_path.exists():
+        if not os.path.exists(directory):
             return []
 
-        # Walk directory tree
-        for current_dir, subdirs, files in os.walk(root_path):
-            # Filter out directories to skip (modify in-place to affect traversal)
-            subdirs[:] = [d for d in subdirs if d not in SKIP_DIRS]
-
-            # Check each file against language patterns
-            for filename in files:
-                for language in Language:
-                    # Skip experimental languages
-                    if language.is_experimental:
-                        continue
-
-                    # Check if file matches this language's patterns
-                    matcher = language.get_source_fn_matcher()
-                    if matcher.matches(filename):
-                        detected_languages.add(language)
-                        break  # Found a match, no need to check other languages
+        # Look each file up by extension
+        for entry in iter_files(directory, SKIP_DIRS):
+            extension = os.path.splitext(entry.name)[1].lower()
+            language = LANGUAGE_BY_EXTENSION.get(extension)
+            if language:
+                detected_languages.add(language)
 
     except OSError:
         return []
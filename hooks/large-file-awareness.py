@@ -28,17 +28,24 @@ Output Format:
 
 import json
 import os
+import stat
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 
 from hook_utils import (
     classify_file,
     count_lines,
-    estimate_tokens,
     exit_if_disabled,
+    find_executable,
     get_large_file_threshold,
+    iter_files,
 )
 
+# Worker threads used by analyze_files() to overlap file reads
+ANALYZE_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 # Standard excluded directories for os.walk fallback
 EXCLUDE_DIRS = {
     ".git",
@@ -64,9 +71,8 @@ def get_project_files() -> list[str]:
     Get project files using git when available, fallback to os.walk.
 
     Strategy:
-    1. Check if in git repository
-    2. If yes: Use 'git ls-files' (respects .gitignore)
-    3. If no: Use os.walk with standard excludes
+    1. Run 'git ls-files' (respects .gitignore)
+    2. If it fails (not a git repository): Use os.walk with standard excludes
 
     Returns:
         List of relative file paths.
@@ -76,28 +82,21 @@ def get_project_files() -> list[str]:
         return walk_with_excludes()
 
     try:
-        # Check if we're in a git repo
-        check = subprocess.run(
-            ["git", "rev-parse", "--is-inside-work-tree"],
-            capture_output=True,
-            text=True,
-            timeout=2,
+        # git ls-files fails outside a repository, so its return code doubles
+        # as the repository check; -z separates names with NUL so paths
+        # containing newlines or quotes come through verbatim
+        result = subprocess.run(
+            ["git", "ls-files", "-z"],
+            executable=find_executable("git"),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
+            timeout=5,
             cwd=project_dir,
         )
 
-        if check.returncode == 0 and check.stdout.strip() == "true":
-            # Use git ls-files for git repositories
-            result = subprocess.run(
-                ["git", "ls-files"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-                cwd=project_dir,
-            )
-
-            if result.returncode == 0:
-                files = [f for f in result.stdout.strip().split("\n") if f]
-                return files
+        if result.returncode == 0:
+            return [os.fsdecode(f) for f in result.stdout.split(b"\0") if f]
 
     except (FileNotFoundError, subprocess.TimeoutExpired):
         pass
@@ -117,25 +116,16 @@ def walk_with_excludes() -> list[str]:
     Returns:
         List of relative file paths.
     """
-    files = []
     project_dir = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
+    # Entry paths start with project_dir plus a separator; slice it off
+    prefix_length = len(os.path.join(project_dir, ""))
 
-    for root, dirs, filenames in os.walk(project_dir):
-        # Modify dirs in-place to skip excluded directories
-        dirs[:] = [d for d in dirs if d not in EXCLUDE_DIRS]
-
-        for f in filenames:
-            full_path = os.path.join(root, f)
-
-            # Skip symlinks (security consideration)
-            if os.path.islink(full_path):
-                continue
-
-            # Convert to relative path
-            rel_path = os.path.relpath(full_path, project_dir)
-            files.append(rel_path)
-
-    return files
+    return [
+        entry.path[prefix_length:]
+        for entry in iter_files(project_dir, EXCLUDE_DIRS)
+        # Skip symlinks (security consideration)
+        if not entry.is_symlink()
+    ]
 
 
 def recommend_tool(file_type: str) -> str:
@@ -161,6 +151,62 @@ def recommend_tool(file_type: str) -> str:
         return "Read offset/limit"
 
 
+def analyze_file(file_path: str, threshold: int) -> dict[str, any] | None:
+    """
+    Analyze a single file and return its metadata if it is large.
+
+    Uses one stat call and one streamed read: the line count comes from
+    count_lines() and the token estimate from the stat size, so the file
+    content is never decoded or read a second time.
+
+    Args:
+        file_path: Relative file path.
+        threshold: Minimum line count for a file to be reported.
+
+    Returns:
+        File metadata dict (see analyze_files), or None if the file is
+        binary, missing, not a regular file, below the threshold or
+        cannot be read.
+    """
+    try:
+        # Skip binary files before touching the filesystem
+        file_type = classify_file(file_path)
+        if file_type == "binary":
+            return None
+
+        # Skip if file doesn't exist (race condition) or isn't a regular file
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+
+        # Every line needs at least one byte, so smaller files can't qualify
+        if file_stat.st_size < threshold:
+            return None
+
+        # Count lines
+        lines = count_lines(file_path)
+
+        # Check threshold
+        if lines < threshold:
+            return None
+
+        return {
+            "path": file_path,
+            "lines": lines,
+            # Same 3.5 chars/token ratio as estimate_tokens(), from byte size
+            "tokens": file_stat.st_size * 2 // 7,
+            "type": file_type,
+            "tool": recommend_tool(file_type),
+        }
+
+    except Exception:
+        # Skip files that error during analysis
+        return None
+
+
 def analyze_files(files: list[str]) -> list[dict[str, any]]:
     """
     Analyze files and identify large ones.
@@ -181,51 +227,16 @@ def analyze_files(files: list[str]) -> list[dict[str, any]]:
         }
     """
     threshold = get_large_file_threshold()
-    large_files = []
 
-    for file_path in files:
-        try:
-            # Skip if file doesn't exist (race condition)
-            if not os.path.exists(file_path):
-                continue
-
-            # Skip binary files
-            file_type = classify_file(file_path)
-            if file_type == "binary":
-                continue
-
-            # Count lines
-            lines = count_lines(file_path)
-
-            # Check threshold
-            if lines < threshold:
-                continue
-
-            # Estimate tokens
-            try:
-                with open(file_path, encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-                    tokens = estimate_tokens(content)
-            except Exception:
-                # Fallback: rough estimate from lines (~8 tokens/line average)
-                tokens = int(lines * 8)
-
-            # Recommend tool
-            tool = recommend_tool(file_type)
-
-            large_files.append(
-                {
-                    "path": file_path,
-                    "lines": lines,
-                    "tokens": tokens,
-                    "type": file_type,
-                    "tool": tool,
-                }
-            )
-
-        except Exception:
-            # Skip files that error during analysis
-            continue
+    # Skip binary files before dispatching any work for them
+    candidates = [f for f in files if classify_file(f) != "binary"]
+    if not candidates:
+        return []
+
+    # Files are independent and reads release the GIL, so overlap the I/O
+    with ThreadPoolExecutor(max_workers=ANALYZE_MAX_WORKERS) as executor:
+        results = executor.map(analyze_file, candidates, repeat(threshold))
+        large_files = [file_info for file_info in results if file_info is not None]
 
     # Sort by line count descending
     large_files.sort(key=lambda x: x["lines"], reverse=True)
@@ -233,12 +244,15 @@ def analyze_files(files: list[str]) -> list[dict[str, any]]:
     return large_files
 
 
-def print_action_guidance(shown: list[dict[str, any]]) -> None:
+def format_action_guidance(shown: list[dict[str, any]]) -> str:
     """
-    Print tool-specific guidance based on file types present.
+    Format tool-specific guidance based on file types present.
 
     Args:
         shown: List of file metadata dicts (top 10).
+
+    Returns:
+        Action line, or an empty string if no guidance applies.
     """
     tools_present = set(f["tool"] for f in shown)
 
@@ -250,14 +264,17 @@ def print_action_guidance(shown: list[dict[str, any]]) -> None:
     if "Read offset/limit" in tools_present:
         guidance.append("Read offset/limit for sections")
 
-    if guidance:
-        print(f"\nAction: {', '.join(guidance)}.")
+    if not guidance:
+        return ""
+    return f"Action: {', '.join(guidance)}."
 
 
 def print_awareness(large_files: list[dict[str, any]]) -> None:
     """
     Print LLM-optimized awareness message.
 
+    The message is assembled first and written to stdout in one call.
+
     Args:
         large_files: Sorted list of file metadata dicts.
 
@@ -271,26 +288,30 @@ def print_awareness(large_files: list[dict[str, any]]) -> None:
     """
     threshold = get_large_file_threshold()
 
-    # Header
-    print("\n## Large Files (symbolic navigation required)")
+    # Header (preceded by a blank line)
+    lines = ["", "## Large Files (symbolic navigation required)"]
 
     # Top 10 files
     shown = large_files[:10]
-    for file_info in shown:
-        print(
-            f"{file_info['path']} "
-            f"({file_info['lines']} lines, ~{file_info['tokens']} tokens) "
-            f"→ {file_info['tool']}"
-        )
+    lines.extend(
+        f"{file_info['path']} "
+        f"({file_info['lines']} lines, ~{file_info['tokens']} tokens) "
+        f"→ {file_info['tool']}"
+        for file_info in shown
+    )
 
     # Remainder count
     if len(large_files) > 10:
         remainder = len(large_files) - 10
-        print(f"(+{remainder} more files over {threshold} lines)")
+        lines.append(f"(+{remainder} more files over {threshold} lines)")
+
+    # Action guidance, separated by a blank line
+    guidance = format_action_guidance(shown)
+    if guidance:
+        lines.extend(["", guidance])
 
-    # Action guidance
-    print_action_guidance(shown)
-    print()  # Blank line for spacing
+    # Trailing blank line for spacing
+    sys.stdout.write("\n".join(lines) + "\n\n")
 
 
 def main() -> None:
@@ -299,7 +320,7 @@ def main() -> None:
 
     try:
         # Parse stdin
-        data = json.loads(sys.stdin.read())
+        data = json.loads(sys.stdin.buffer.read())
         event_name = data.get("hook_event_name", "")
 
         # Validate event type - only run on SessionStart
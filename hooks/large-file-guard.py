@@ -13,8 +13,8 @@ Configuration (priority order):
 3. Default: 500 lines
 
 Two-stage size detection:
-- Stage 1: Byte check (< 5KB instant allow, > 100KB instant block)
-- Stage 2: Accurate line counting for files 5-100KB
+- Stage 1: Byte check (< 5KB instant allow, > 10MB instant block)
+- Stage 2: Streaming line counting for files 5KB-10MB
 
 Skip conditions (exit 0 without blocking):
 - Binary file extension
@@ -26,23 +26,25 @@ Skip conditions (exit 0 without blocking):
 
 import json
 import os
+import stat
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from hook_utils import (
     Colors,
     classify_file,
     count_lines,
-    estimate_tokens,
     exit_if_disabled,
 )
 
 # Constants
 DEFAULT_THRESHOLD = 500
 INSTANT_ALLOW_BYTES = 5 * 1024  # 5KB
-INSTANT_BLOCK_BYTES = 100 * 1024  # 100KB
+INSTANT_BLOCK_BYTES = 10 * 1024 * 1024  # 10MB
 
 
+@lru_cache(maxsize=1)
 def get_threshold() -> int:
     """
     Get the large file threshold from configuration.
@@ -52,6 +54,9 @@ def get_threshold() -> int:
     2. ~/.claude/hook-large-file-guard-config file
     3. Default: 500 lines
 
+    Cached for the lifetime of the hook process, so the config file is
+    read at most once.
+
     Returns:
         Threshold in number of lines.
     """
@@ -86,7 +91,9 @@ def should_skip_check(tool_input: dict, file_path: str) -> bool:
     - Binary file extension
     - offset or limit parameter present (non-null)
     - ALLOW_LARGE_READ=1 env var
-    - File doesn't exist
+
+    Missing and non-regular files are already skipped by main(), which
+    stats the file before calling this.
 
     Args:
         tool_input: The tool_input dictionary from stdin.
@@ -110,10 +117,6 @@ def should_skip_check(tool_input: dict, file_path: str) -> bool:
     if tool_input.get("limit") is not None:
         return True
 
-    # Skip if file doesn't exist
-    if not Path(file_path).is_file():
-        return True
-
     return False
 
 
@@ -128,62 +131,72 @@ def get_file_size_bytes(file_path: str) -> int:
         File size in bytes, or 0 on error.
     """
     try:
-        return Path(file_path).stat().st_size
+        return os.stat(file_path).st_size
     except OSError:
         return 0
 
 
-def check_file_size(file_path: str, threshold: int) -> tuple[bool, int, int]:
+def check_file_size(
+    file_path: str, threshold: int, size_bytes: int | None = None
+) -> tuple[bool, int, int, bool]:
     """
     Check if file exceeds threshold using two-stage detection.
 
-    Stage 1: Byte check (< 5KB instant allow, > 100KB instant block)
-    Stage 2: Accurate line counting for files 5-100KB
+    Stage 1: Byte check (< 5KB instant allow, > 10MB instant block)
+    Stage 2: Streaming line counting for files 5KB-10MB
+
+    The token estimate is derived from the byte size, so the file content
+    is never decoded or held in memory. Counting stops once the threshold
+    is exceeded, so the returned line count is then a lower bound. Files
+    above 10MB are not read at all and get a line estimate instead.
 
     Args:
         file_path: Path to the file to check.
         threshold: Maximum allowed lines.
+        size_bytes: File size if already known, to avoid another stat call.
 
     Returns:
-        Tuple of (exceeds_threshold, line_count, token_estimate)
+        Tuple of (exceeds_threshold, line_count, token_estimate,
+        lines_estimated), where lines_estimated is True when line_count was
+        guessed from the byte size rather than counted.
     """
     # Stage 1: Byte check for quick decisions
-    size_bytes = get_file_size_bytes(file_path)
+    if size_bytes is None:
+        size_bytes = get_file_size_bytes(file_path)
 
     if size_bytes < INSTANT_ALLOW_BYTES:  # < 5KB - instant allow
-        return False, 0, 0
+        return False, 0, 0, False
+
+    # Byte-based token estimate (same 3.5 chars/token ratio as estimate_tokens)
+    tokens = size_bytes * 2 // 7
 
-    if size_bytes > INSTANT_BLOCK_BYTES:  # > 100KB - instant block
+    if size_bytes > INSTANT_BLOCK_BYTES:  # > 10MB - instant block
         # Estimate lines (assume ~80 chars per line)
         estimated_lines = size_bytes // 80
-        # Use byte-based token estimate (don't read file into memory)
-        tokens = int(size_bytes / 3.5)
-        return True, estimated_lines, tokens
+        return True, estimated_lines, tokens, True
 
-    # Stage 2: Accurate line counting for normal files (5-100KB)
-    line_count = count_lines(file_path)
+    # Stage 2: Streaming line count for normal files (5KB-10MB), stopping
+    # as soon as the running count exceeds the threshold
+    line_count = count_lines(file_path, limit=threshold)
 
     if line_count > threshold:
-        # Read content for token estimate (safe for files <= 100KB)
-        try:
-            with open(file_path, encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-            tokens = estimate_tokens(content)
-        except OSError:
-            tokens = int(size_bytes / 3.5)  # Fallback estimate
-        return True, line_count, tokens
+        return True, line_count, tokens, False
 
-    return False, line_count, 0
+    return False, line_count, 0, False
 
 
-def format_error_message(file_path: str, lines: int, tokens: int) -> str:
+def format_error_message(
+    file_path: str, lines: int, tokens: int, lines_estimated: bool = False
+) -> str:
     """
     Format the error message for large file blocking.
 
     Args:
         file_path: Path to the blocked file.
-        lines: Number of lines in the file.
+        lines: Number of lines counted, a lower bound on the file's lines.
         tokens: Estimated token count.
+        lines_estimated: True when lines is a byte-size estimate rather than
+                         a count.
 
     Returns:
         Formatted error message.
@@ -198,7 +211,13 @@ def format_error_message(file_path: str, lines: int, tokens: int) -> str:
 
     alternatives_str = " • ".join(alternatives)
 
-    error = f"{Colors.red('❌ Large file:')} {file_path} ({lines:,} lines, ~{tokens:,} tokens est.)\n\n"
+    # Counted lines are a lower bound; byte-size guesses are only estimates
+    if lines_estimated:
+        lines_str = f"~{lines:,} lines est."
+    else:
+        lines_str = f"at least {lines:,} lines"
+
+    error = f"{Colors.red('❌ Large file:')} {file_path} ({lines_str}, ~{tokens:,} tokens est.)\n\n"
     error += f"{Colors.yellow('📝 Alternatives:')} {alternatives_str}\n\n"
     error += f"{Colors.blue('💡 Bypass:')} ALLOW_LARGE_READ=1"
 
@@ -211,7 +230,7 @@ def main() -> None:
 
     try:
         # Read and parse stdin
-        stdin_data = sys.stdin.read()
+        stdin_data = sys.stdin.buffer.read()
         data = json.loads(stdin_data)
 
         # Extract tool name and input
@@ -227,6 +246,17 @@ def main() -> None:
         if not file_path:
             sys.exit(0)
 
+        # Stat first: most reads target small files that need no other checks
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            # File doesn't exist
+            sys.exit(0)
+        if not stat.S_ISREG(file_stat.st_mode):
+            sys.exit(0)
+        if file_stat.st_size < INSTANT_ALLOW_BYTES:
+            sys.exit(0)
+
         # Check skip conditions
         if should_skip_check(tool_input, file_path):
             sys.exit(0)
@@ -235,11 +265,13 @@ def main() -> None:
         threshold = get_threshold()
 
         # Check file size
-        exceeds, lines, tokens = check_file_size(file_path, threshold)
+        exceeds, lines, tokens, lines_estimated = check_file_size(
+            file_path, threshold, file_stat.st_size
+        )
 
         if exceeds:
             # Block the read
-            error_msg = format_error_message(file_path, lines, tokens)
+            error_msg = format_error_message(file_path, lines, tokens, lines_estimated)
             print(error_msg, file=sys.stderr)
             sys.exit(2)
 
@@ -48,6 +48,17 @@ from hook_utils import exit_if_disabled
 # Trigger prefix character
 TRIGGER_PREFIX = "+"
 
+# Number of trailing tokens split off the prompt per rsplit() call
+TRIGGER_SCAN_BATCH = 16
+
+# Prefix and suffix of session mode flag files (hook-<mode>-mode-on)
+MODE_FLAG_PREFIX = "hook-"
+MODE_FLAG_SUFFIX = "-mode-on"
+MODE_FLAG_MIN_LENGTH = len(MODE_FLAG_PREFIX) + len(MODE_FLAG_SUFFIX)
+
+# System configuration file next to this script, resolved once per process
+SYSTEM_CONFIG_PATH = Path(__file__).resolve().with_suffix(".toml")
+
 
 def load_config() -> dict[str, dict[str, Any]]:
     """
@@ -59,7 +70,8 @@ def load_config() -> dict[str, dict[str, Any]]:
     with the same key.
 
     Returns:
-        Dictionary mapping trigger names to their configuration (aliases, content).
+        Dictionary mapping trigger names to their configuration (aliases, content),
+        with surrounding whitespace stripped from each content string.
         Empty dict on load failure (fail open).
 
     Example:
@@ -70,10 +82,9 @@ def load_config() -> dict[str, dict[str, Any]]:
     config: dict[str, dict[str, Any]] = {}
 
     # Load system config
-    system_toml = Path(__file__).resolve().with_suffix(".toml")
-    if system_toml.is_file():
+    if SYSTEM_CONFIG_PATH.is_file():
         try:
-            with open(system_toml, "rb") as f:
+            with open(SYSTEM_CONFIG_PATH, "rb") as f:
                 config = tomllib.load(f)
         except tomllib.TOMLDecodeError as e:
             print(
@@ -99,6 +110,13 @@ def load_config() -> dict[str, dict[str, Any]]:
                 )
                 # Continue with system config
 
+    # Strip fragment content once here so lookups can return it as-is
+    for trigger_config in config.values():
+        if isinstance(trigger_config, dict):
+            content = trigger_config.get("content")
+            if isinstance(content, str):
+                trigger_config["content"] = content.strip()
+
     return config
 
 
@@ -132,35 +150,31 @@ def build_alias_map(config: dict[str, dict[str, Any]]) -> dict[str, str]:
     return alias_map
 
 
-def resolve_trigger(
-    trigger: str,
-    config: dict[str, dict[str, Any]],
-    alias_map: dict[str, str],
-) -> str | None:
+def build_trigger_lookup(config: dict[str, dict[str, Any]]) -> dict[str, str]:
     """
-    Resolve a trigger name to its canonical form.
+    Build a single mapping from every accepted trigger name to its canonical name.
 
-    Checks for direct match first, then alias lookup.
+    Canonical names map to themselves and aliases map to their canonical name,
+    so resolving a trigger is one dict lookup. Canonical names are inserted
+    last, so a direct match still takes precedence over a colliding alias.
 
     Args:
-        trigger: The trigger name without the + prefix.
         config: The loaded configuration dictionary.
-        alias_map: Mapping from aliases to canonical names.
 
     Returns:
-        The canonical trigger name, or None if not found.
+        Dictionary mapping trigger and alias names to canonical trigger names.
+        Skips reserved section names like "_always".
 
     Example:
-        >>> resolve_trigger("seqthi", config, alias_map)
-        "sequential-thinking"
+        >>> config = {"sequential-thinking": {"aliases": ["seqthi"], "content": "..."}}
+        >>> build_trigger_lookup(config)
+        {"seqthi": "sequential-thinking", "sequential-thinking": "sequential-thinking"}
     """
-    # Direct match
-    if trigger in config:
-        return trigger
-    # Alias lookup
-    if trigger in alias_map:
-        return alias_map[trigger]
-    return None
+    trigger_lookup = build_alias_map(config)
+    for trigger_name in config:
+        if not trigger_name.startswith("_"):
+            trigger_lookup[trigger_name] = trigger_name
+    return trigger_lookup
 
 
 def get_trigger_content(
@@ -170,6 +184,8 @@ def get_trigger_content(
     """
     Get the content for a canonical trigger name.
 
+    Content is returned as stored; load_config() has already stripped it.
+
     Args:
         trigger_name: The canonical trigger name.
         config: The loaded configuration dictionary.
@@ -182,7 +198,7 @@ def get_trigger_content(
         return None
     content = trigger_config.get("content")
     if isinstance(content, str):
-        return content.strip()
+        return content
     return None
 
 
@@ -209,7 +225,7 @@ def get_always_fragment(config: dict[str, dict[str, Any]]) -> str | None:
 
 def get_active_mode_fragments(
     config: dict[str, dict[str, Any]],
-    alias_map: dict[str, str],
+    trigger_lookup: dict[str, str],
 ) -> list[str]:
     """
     Scan project's .claude/ for hook-*-mode-on files and load corresponding fragments.
@@ -220,7 +236,7 @@ def get_active_mode_fragments(
 
     Args:
         config: The loaded configuration dictionary.
-        alias_map: Mapping from aliases to canonical names.
+        trigger_lookup: Mapping from trigger and alias names to canonical names.
 
     Returns:
         List of markdown fragment contents for active modes. Empty list if no
@@ -234,16 +250,27 @@ def get_active_mode_fragments(
     if not project_dir:
         return []
 
-    claude_dir = Path(project_dir) / ".claude"
     fragments: list[str] = []
 
-    if not claude_dir.is_dir():
+    # A missing .claude/ directory surfaces as an OSError from scandir
+    try:
+        with os.scandir(os.path.join(project_dir, ".claude")) as entries:
+            names = [entry.name for entry in entries]
+    except OSError:
         return fragments
 
-    for flag_file in claude_dir.glob("hook-*-mode-on"):
+    for name in names:
+        # Match "hook-*-mode-on" without building a glob regex
+        if not (
+            len(name) >= MODE_FLAG_MIN_LENGTH
+            and name.startswith(MODE_FLAG_PREFIX)
+            and name.endswith(MODE_FLAG_SUFFIX)
+        ):
+            continue
+
         # Extract mode name: hook-approval-mode-on -> approval
-        mode_name = flag_file.name[5:-8]  # strip "hook-" and "-mode-on"
-        canonical = resolve_trigger(mode_name, config, alias_map)
+        mode_name = name[len(MODE_FLAG_PREFIX) : -len(MODE_FLAG_SUFFIX)]
+        canonical = trigger_lookup.get(mode_name)
         if canonical:
             content = get_trigger_content(canonical, config)
             if content:
@@ -254,21 +281,19 @@ def get_active_mode_fragments(
 
 def split_prompt_and_triggers(
     prompt: str,
-    config: dict[str, dict[str, Any]],
-    alias_map: dict[str, str],
+    trigger_lookup: dict[str, str],
 ) -> tuple[str, list[str]]:
     """
     Extract trailing trigger tokens from prompt and return cleaned prompt with trigger list.
 
-    This function scans the prompt from right to left, collecting any trailing
+    This function splits tokens off the end of the prompt, collecting any trailing
     tokens that start with "+". Recognized triggers (direct or via alias) are
     collected for later processing, while unrecognized triggers are discarded.
     All trigger-like tokens are stripped from the output prompt.
 
     Args:
         prompt: The original user prompt, potentially with trailing triggers.
-        config: The loaded configuration dictionary.
-        alias_map: Mapping from aliases to canonical names.
+        trigger_lookup: Mapping from trigger and alias names to canonical names.
 
     Returns:
         A tuple of (cleaned_prompt, list_of_canonical_triggers) where:
@@ -276,53 +301,37 @@ def split_prompt_and_triggers(
         - list_of_canonical_triggers: Ordered list of canonical trigger names (deduplicated)
 
     Example:
-        >>> split_prompt_and_triggers("Fix this code +ultrathink +seqthi", config, alias_map)
+        >>> split_prompt_and_triggers("Fix this code +ultrathink +seqthi", trigger_lookup)
         ("Fix this code", ["ultrathink", "sequential-thinking"])
     """
+    # No trigger tokens possible; skip the tokenizer
+    if TRIGGER_PREFIX not in prompt:
+        return prompt.rstrip(), []
+
     text = prompt.rstrip()
     triggers: list[str] = []
-    last_keep = len(text)
-
-    while last_keep > 0:
-        # Trim whitespace before the current token
-        while last_keep > 0 and text[last_keep - 1].isspace():
-            last_keep -= 1
-
-        end = last_keep
-        # Find the start of the token
-        while last_keep > 0 and not text[last_keep - 1].isspace():
-            last_keep -= 1
-        start = last_keep
-
-        if start == end:
-            break
-
-        token = text[start:end]
-        if token.startswith(TRIGGER_PREFIX) and len(token) > 1:
-            trigger_name = token[1:]  # Remove + prefix
-            canonical = resolve_trigger(trigger_name, config, alias_map)
+    end = len(text)
+    scanning = True
+
+    while scanning:
+        parts = text[:end].rsplit(None, TRIGGER_SCAN_BATCH)
+        # A full batch leaves the unsplit rest of the prompt in parts[0]
+        scanning = len(parts) > TRIGGER_SCAN_BATCH
+        for token in reversed(parts[1:] if scanning else parts):
+            if len(token) < 2 or not token.startswith(TRIGGER_PREFIX):
+                # Non-trigger token encountered; stop scanning
+                scanning = False
+                break
+            canonical = trigger_lookup.get(token[1:])  # Remove + prefix
             if canonical:
                 triggers.append(canonical)
             # Drop all trailing trigger-like tokens (recognized or not) from output
-            continue
-        else:
-            # Non-trigger token encountered; stop scanning
-            last_keep = end
-            break
+            end = text.rindex(token, 0, end)
 
-    base_prompt = text[:last_keep].rstrip()
+    base_prompt = text[:end].rstrip()
 
-    triggers.reverse()
     # Deduplicate while preserving the original order (left-to-right)
-    seen: set[str] = set()
-    unique_triggers: list[str] = []
-    for trigger in triggers:
-        if trigger in seen:
-            continue
-        seen.add(trigger)
-        unique_triggers.append(trigger)
-
-    return base_prompt, unique_triggers
+    return base_prompt, list(dict.fromkeys(reversed(triggers)))
 
 
 def get_fragments_for_triggers(
@@ -384,23 +393,23 @@ def main() -> None:
     exit_if_disabled()
 
     try:
-        # Load configuration
-        config = load_config()
-        alias_map = build_alias_map(config)
-
-        input_data: dict[str, Any] = json.load(sys.stdin)
+        input_data: dict[str, Any] = json.loads(sys.stdin.buffer.read())
         prompt = input_data.get("prompt", "")
         if not isinstance(prompt, str):
             raise ValueError("prompt must be a string")
 
+        # Load configuration
+        config = load_config()
+        trigger_lookup = build_trigger_lookup(config)
+
         # Get always-on fragment (from [_always] section)
         always_fragment = get_always_fragment(config)
 
         # Get mode-based fragments (from flag files in .claude/)
-        mode_fragments = get_active_mode_fragments(config, alias_map)
+        mode_fragments = get_active_mode_fragments(config, trigger_lookup)
 
         # Get trigger-based fragments (from prompt triggers)
-        base_prompt, triggers = split_prompt_and_triggers(prompt, config, alias_map)
+        base_prompt, triggers = split_prompt_and_triggers(prompt, trigger_lookup)
         trigger_fragments = get_fragments_for_triggers(triggers, config)
 
         # Combine: always first, then mode fragments, then trigger fragments
@@ -15,6 +15,43 @@ from typing import Any
 
 from hook_utils import Colors, exit_if_disabled
 
+# Python tools that should be replaced with uv
+PYTHON_TOOLS = (
+    "pip",
+    "pip3",
+    "python",
+    "python3",
+    "pytest",
+    "pylint",
+    "flake8",
+    "black",
+    "mypy",
+    "isort",
+    "poetry",
+    "pipenv",
+    "conda",
+    "virtualenv",
+    "pyenv",
+)
+
+# Encoded tool names; raw input containing none of them can't be a Python tool call
+PYTHON_TOOL_MARKERS = tuple(tool.encode() for tool in PYTHON_TOOLS)
+
+# Regex pattern matching a command that starts with one of PYTHON_TOOLS
+PYTHON_TOOL_PATTERN = re.compile(r"^(" + "|".join(PYTHON_TOOLS) + r")\b")
+
+# uv replacement suggested for each leading tool; other tools get "uv run <command>"
+UV_SUGGESTIONS = {
+    "python": "uv run python ...",
+    "python3": "uv run python ...",
+    "pytest": "uv run pytest ...",
+    "black": "uv run black ...",
+    "mypy": "uv run mypy ...",
+}
+
+# Regex pattern matching Python commands that remain allowed (venv creation, uv)
+ALLOWED_COMMAND_PATTERN = re.compile(r"^(python3?\s+-m\s+venv|uv\s+)")
+
 
 def main() -> None:
     """Main entry point for the Python UV enforcer hook."""
@@ -23,7 +60,13 @@ def main() -> None:
 
     try:
         # Read input from Claude Code
-        input_data: dict[str, Any] = json.load(sys.stdin)
+        raw_input = sys.stdin.buffer.read()
+
+        # Most Bash commands mention no Python tool at all; skip the JSON parse
+        if not any(marker in raw_input for marker in PYTHON_TOOL_MARKERS):
+            sys.exit(0)
+
+        input_data: dict[str, Any] = json.loads(raw_input)
 
         tool_name = input_data.get("tool_name", "")
         tool_input = input_data.get("tool_input", {})
@@ -31,47 +74,21 @@ def main() -> None:
         if tool_name == "Bash":
             command = tool_input.get("command", "")
 
-            # List of Python tools that should be replaced with uv
-            python_tools = [
-                "pip",
-                "pip3",
-                "python",
-                "python3",
-                "pytest",
-                "pylint",
-                "flake8",
-                "black",
-                "mypy",
-                "isort",
-                "poetry",
-                "pipenv",
-                "conda",
-                "virtualenv",
-                "pyenv",
-            ]
-
             # Check if command uses Python tools (but not venv or uv)
-            pattern = r"^(" + "|".join(python_tools) + r")\b"
-            if re.match(pattern, command) and not re.match(
-                r"^(python3?\s+-m\s+venv|uv\s+)", command
-            ):
+            tool_match = PYTHON_TOOL_PATTERN.match(command)
+            if tool_match and not ALLOWED_COMMAND_PATTERN.match(command):
                 error_msg = f"""{Colors.red("❌ Direct Python tool usage detected!")}
 {Colors.yellow("📝 Command blocked:")} {command}
 {Colors.green("✨ Use uv instead:")}"""
 
                 # Provide specific suggestions based on the command
                 if "pip" in command and "install" in command:
-                    error_msg += "\n   uv pip install ..."
-                elif command.startswith("python"):
-                    error_msg += "\n   uv run python ..."
-                elif command.startswith("pytest"):
-                    error_msg += "\n   uv run pytest ..."
-                elif command.startswith("black"):
-                    error_msg += "\n   uv run black ..."
-                elif command.startswith("mypy"):
-                    error_msg += "\n   uv run mypy ..."
+                    suggestion = "uv pip install ..."
                 else:
-                    error_msg += f"\n   uv run {command}"
+                    suggestion = UV_SUGGESTIONS.get(
+                        tool_match.group(1), f"uv run {command}"
+                    )
+                error_msg += f"\n   {suggestion}"
 
                 error_msg += (
                     f"\n{Colors.blue('💡 Learn more:')} https://github.com/astral-sh/uv"
@@ -24,6 +24,17 @@ from typing import Any
 
 from hook_utils import Colors, exit_if_disabled
 
+# Regex pattern matching a git tag command and capturing its vX.Y.Z version
+TAG_VERSION_PATTERN = re.compile(r"git\s+tag\s+(?:-[a-z]\s+)?v(\d+\.\d+\.\d+)")
+
+# Regex pattern matching a gh release create command and capturing its version
+RELEASE_VERSION_PATTERN = re.compile(r"gh\s+release\s+create\s+v(\d+\.\d+\.\d+)")
+
+# Inline markers that skip all checks or confirm a tag or release
+SKIP_MARKER = "SKIP_RELEASE_CHECK=1"
+CONFIRM_TAG_MARKER = "CONFIRM_TAG=1"
+CONFIRM_RELEASE_MARKER = "CONFIRM_RELEASE=1"
+
 
 def extract_tag_version(command: str) -> str | None:
     """
@@ -35,7 +46,10 @@ def extract_tag_version(command: str) -> str | None:
     Returns:
         Version string (e.g., "0.1.4") or None if not found.
     """
-    match = re.search(r"git\s+tag\s+(?:-[a-z]\s+)?v(\d+\.\d+\.\d+)", command)
+    # Every match contains "tag"; skip the regex for unrelated commands
+    if "tag" not in command:
+        return None
+    match = TAG_VERSION_PATTERN.search(command)
     return match.group(1) if match else None
 
 
@@ -49,7 +63,10 @@ def extract_release_version(command: str) -> str | None:
     Returns:
         Version string (e.g., "0.1.4") or None if not found.
     """
-    match = re.search(r"gh\s+release\s+create\s+v(\d+\.\d+\.\d+)", command)
+    # Every match contains "release"; skip the regex for unrelated commands
+    if "release" not in command:
+        return None
+    match = RELEASE_VERSION_PATTERN.search(command)
     return match.group(1) if match else None
 
 
@@ -72,8 +89,9 @@ def check_version_in_changelog(version: str) -> bool:
         return True
 
     try:
-        with changelog_path.open("r", encoding="utf-8") as f:
-            return version in f.read()
+        # Stream lines so a version near the top (the usual case) stops early
+        with changelog_path.open("r", encoding="utf-8", errors="replace") as f:
+            return any(version in line for line in f)
     except OSError:
         return True
 
@@ -88,7 +106,7 @@ def main() -> None:
             sys.exit(0)
 
         # Read hook data from stdin
-        tool_use: dict[str, Any] = json.loads(sys.stdin.read())
+        tool_use: dict[str, Any] = json.loads(sys.stdin.buffer.read())
 
         # Only process Bash commands
         if tool_use.get("tool_name") != "Bash":
@@ -97,14 +115,14 @@ def main() -> None:
         command = tool_use.get("tool_input", {}).get("command", "")
 
         # Check for inline skip in command
-        if re.search(r"SKIP_RELEASE_CHECK=1", command):
+        if SKIP_MARKER in command:
             sys.exit(0)
 
         # Check for git tag v* command
         tag_version = extract_tag_version(command)
         if tag_version:
             # Check for confirmation bypass
-            if re.search(r"CONFIRM_TAG=1", command):
+            if CONFIRM_TAG_MARKER in command:
                 # Confirmed - still validate CHANGELOG
                 if not check_version_in_changelog(tag_version):
                     msg = f"{Colors.red(f'❌ Version {tag_version} not found in CHANGELOG.md!')}"
@@ -133,7 +151,7 @@ def main() -> None:
         release_version = extract_release_version(command)
         if release_version:
             # Check for confirmation bypass
-            if re.search(r"CONFIRM_RELEASE=1", command):
+            if CONFIRM_RELEASE_MARKER in command:
                 sys.exit(0)
 
             # No confirmation - require it
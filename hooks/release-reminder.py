@@ -24,18 +24,24 @@ from typing import Any
 
 from hook_utils import exit_if_disabled
 
-# Regex pattern matching release-related keywords
+# Literals (case-folded) of which every TRIGGER_KEYWORDS match contains one
+KEYWORD_LITERALS = ("release", "tag", "bump")
+
+# Regex pattern matching release-related keywords ("prepare release" is covered
+# by "release")
 TRIGGER_KEYWORDS = re.compile(
     r"\b("
     r"release|"
     r"tag\s+v|"
-    r"version\s+bump|"
-    r"prepare\s+release|"
-    r"v\d+\.\d+\."
+    r"version\s+bump"
     r")",
     re.IGNORECASE,
 )
 
+# Regex pattern matching version patterns like v0.1. or V1.0. at a word start;
+# leading with the [vV] class lets the regex engine skip ahead to candidates
+VERSION_PATTERN = re.compile(r"[vV](?<!\w[vV])\d+\.\d+\.")
+
 # The reminder text shown to Claude
 REMINDER = """---
 ## Release Verification Required
@@ -51,6 +57,28 @@ Confirm these checks before proceeding with git tag.
 ---"""
 
 
+def has_release_keyword(prompt: str) -> bool:
+    """
+    Check whether a prompt mentions a release keyword or version pattern.
+
+    The keyword regex only runs when a cheap substring test finds one of its
+    literals, so prompts without any release vocabulary (the common case)
+    cost one casefold plus a version pattern scan.
+
+    Args:
+        prompt: The user prompt text.
+
+    Returns:
+        True if a release keyword or version pattern is present.
+    """
+    folded = prompt.casefold()
+    if any(literal in folded for literal in KEYWORD_LITERALS) and (
+        TRIGGER_KEYWORDS.search(prompt)
+    ):
+        return True
+    return VERSION_PATTERN.search(prompt) is not None
+
+
 def main() -> None:
     """
     Main entry point for the release reminder hook.
@@ -64,14 +92,14 @@ def main() -> None:
     exit_if_disabled()
 
     try:
-        input_data: dict[str, Any] = json.load(sys.stdin)
+        input_data: dict[str, Any] = json.loads(sys.stdin.buffer.read())
         event_name = input_data.get("hook_event_name", "")
 
         if event_name == "UserPromptSubmit":
             # UserPromptSubmit stdout is injected as context
             # Only output reminder if trigger keywords found
             prompt = input_data.get("prompt", "")
-            if TRIGGER_KEYWORDS.search(prompt):
+            if has_release_keyword(prompt):
                 print(REMINDER)
             # If no keywords, output nothing (don't bloat context)
 
@@ -25,19 +25,26 @@ from typing import Any
 
 from hook_utils import exit_if_disabled
 
-# Regex pattern matching keywords that indicate Claude is about to make changes
-# or plan implementation work
-TRIGGER_KEYWORDS = re.compile(
-    r"\b("
-    r"implement|add|create|build|develop|write|make|introduce|setup|set up|"
-    r"fix|refactor|update|change|modify|edit|adjust|improve|enhance|optimize|rewrite|rework|"
-    r"remove|delete|clean ?up|deprecate|drop|"
-    r"restructure|reorganize|redesign|migrate|convert|integrate|connect|configure|"
-    r"brainstorm|design|plan|propose|architect|draft|outline|sketch|spec|specify|prototype"
-    r")\b",
-    re.IGNORECASE,
+# Keywords that indicate Claude is about to make changes or plan implementation
+# work, matched case-insensitively as whole words
+TRIGGER_KEYWORDS = frozenset(
+    (
+        "implement add create build develop write make introduce setup "
+        "fix refactor update change modify edit adjust improve enhance optimize rewrite "
+        "rework remove delete cleanup deprecate drop "
+        "restructure reorganize redesign migrate convert integrate connect configure "
+        "brainstorm design plan propose architect draft outline sketch spec specify "
+        "prototype"
+    ).split()
 )
 
+# Regex pattern matching one word, with the same boundaries as \b in a regex
+WORD_PATTERN = re.compile(r"\w+")
+
+# Regex pattern matching the two-word trigger phrases ("set up", "clean up")
+TRIGGER_PHRASES = re.compile(r"\b(?:set|clean) up\b", re.IGNORECASE)
+
+
 # The reminder text shown to Claude
 REMINDER = """## Project Rules Reminder
 
@@ -48,6 +55,25 @@ This project may have rules defined in:
 Review and follow all project rules strictly before making changes."""
 
 
+def has_trigger_keyword(prompt: str) -> bool:
+    """
+    Check whether a prompt contains any trigger keyword or phrase.
+
+    Splits the prompt into words once and tests them against a frozenset,
+    which is much faster than a large regex alternation on prompts that
+    contain no keyword (the common case).
+
+    Args:
+        prompt: The user prompt text.
+
+    Returns:
+        True if a trigger keyword or phrase appears as a whole word.
+    """
+    if not TRIGGER_KEYWORDS.isdisjoint(WORD_PATTERN.findall(prompt.lower())):
+        return True
+    return TRIGGER_PHRASES.search(prompt) is not None
+
+
 def main() -> None:
     """
     Main entry point for the rules reminder hook.
@@ -61,7 +87,7 @@ def main() -> None:
     exit_if_disabled()
 
     try:
-        input_data: dict[str, Any] = json.load(sys.stdin)
+        input_data: dict[str, Any] = json.loads(sys.stdin.buffer.read())
         event_name = input_data.get("hook_event_name", "")
 
         if event_name == "SessionStart":
@@ -72,7 +98,7 @@ def main() -> None:
             # UserPromptSubmit stdout is injected as context (per docs)
             # Only output reminder if trigger keywords found
             prompt = input_data.get("prompt", "")
-            if TRIGGER_KEYWORDS.search(prompt):
+            if has_trigger_keyword(prompt):
                 print(REMINDER)
             # If no keywords, output nothing (don't bloat context)
 
@@ -24,6 +24,13 @@ from pathlib import Path
 # Maximum age for session markers before cleanup (in days)
 SESSION_MARKER_MAX_AGE_DAYS = 7
 
+# Regex pattern matching "project_name: value" in .serena/project.yml, with
+# optional quotes and whitespace. Only alphanumeric, dash, underscore and dot
+# characters are accepted to avoid malformed YAML.
+PROJECT_NAME_PATTERN = re.compile(
+    r'^\s*project_name\s*:\s*["\']?([a-zA-Z0-9_.-]+)["\']?\s*$', re.MULTILINE
+)
+
 
 def get_session_markers_dir() -> Path:
     """
@@ -60,23 +67,27 @@ def cleanup_old_session_markers(current_session_id: str) -> None:
     Args:
         current_session_id: The session ID to preserve (never delete)
     """
-    markers_dir = get_session_markers_dir()
-    if not markers_dir.exists():
-        return
-
     cutoff = time.time() - (SESSION_MARKER_MAX_AGE_DAYS * 86400)
+    current_marker = f"{current_session_id}.seen"
 
-    for marker in markers_dir.glob("*.seen"):
-        # Never clean current session
-        if marker.stem == current_session_id:
-            continue
-        # Remove if older than cutoff
-        try:
-            if marker.stat().st_mtime < cutoff:
-                marker.unlink()
-        except OSError:
-            # Ignore errors (file may have been deleted by another process)
-            pass
+    try:
+        entries = os.scandir(get_session_markers_dir())
+    except OSError:
+        # Markers directory doesn't exist (yet)
+        return
+
+    with entries:
+        for entry in entries:
+            # Never clean current session
+            if not entry.name.endswith(".seen") or entry.name == current_marker:
+                continue
+            # Remove if older than cutoff
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                # Ignore errors (file may have been deleted by another process)
+                pass
 
 
 def is_first_prompt_in_session(session_id: str) -> bool:
@@ -84,7 +95,8 @@ def is_first_prompt_in_session(session_id: str) -> bool:
     Check if this is the first prompt in the session.
 
     Uses marker files to track seen sessions. Creates marker on first
-    prompt, returns False on subsequent prompts.
+    prompt, returns False on subsequent prompts. Later prompts only refresh
+    the marker's mtime; stale-marker cleanup runs once per new session.
 
     Args:
         session_id: The session ID from UserPromptSubmit input
@@ -93,18 +105,23 @@ def is_first_prompt_in_session(session_id: str) -> bool:
         True if this is the first prompt, False otherwise
     """
     markers_dir = get_session_markers_dir()
-    markers_dir.mkdir(parents=True, exist_ok=True)
-
     marker = markers_dir / f"{session_id}.seen"
-    is_first = not marker.exists()
 
-    # Mark session as seen (touch creates or updates mtime)
+    try:
+        # Seen session: refresh the mtime so cleanup keeps the marker
+        os.utime(marker)
+        return False
+    except FileNotFoundError:
+        pass
+
+    # First prompt: mark session as seen
+    markers_dir.mkdir(parents=True, exist_ok=True)
     marker.touch()
 
     # Self-clean old markers (except current)
     cleanup_old_session_markers(session_id)
 
-    return is_first
+    return True
 
 
 def is_aggressive_mode_enabled() -> bool:
@@ -156,11 +173,11 @@ def parse_project_name(config_path: str) -> str | None:
         with open(config_path, encoding="utf-8") as f:
             content = f.read()
 
-        # Match: project_name: value (with optional quotes and whitespace)
-        # Pattern: project_name: followed by optional whitespace, optional quotes, value, optional quotes
-        # Only accept alphanumeric, dash, underscore, and dot characters to avoid malformed YAML
-        pattern = r'^\s*project_name\s*:\s*["\']?([a-zA-Z0-9_.-]+)["\']?\s*$'
-        match = re.search(pattern, content, re.MULTILINE)
+        # Cheap literal check before running the multiline regex
+        if "project_name" not in content:
+            return None
+
+        match = PROJECT_NAME_PATTERN.search(content)
 
         if match:
             project_name = match.group(1).strip()
@@ -339,7 +356,7 @@ def main() -> None:
         exit_if_disabled()
 
         # Read and parse JSON input from stdin
-        stdin_data = sys.stdin.read()
+        stdin_data = sys.stdin.buffer.read()
         try:
             input_data = json.loads(stdin_data)
         except json.JSONDecodeError:
@@ -18,10 +18,22 @@ if str(hooks_dir) not in sys.path:
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def reset_hook_utils_caches():
+    """Clear the per-process hook_utils caches before each test."""
+    import hook_utils
+
+    hook_utils.get_large_file_threshold.cache_clear()
+    hook_utils.load_claude_settings.cache_clear()
+    hook_utils.get_current_branch.cache_clear()
+    hook_utils.read_tool_input.cache_clear()
+    hook_utils.find_executable.cache_clear()
+
+
 @pytest.fixture
 def mock_stdin(monkeypatch):
     """
-    Mock sys.stdin.read to return JSON data.
+    Mock sys.stdin.buffer.read to return JSON data.
 
     Usage:
         def test_example(mock_stdin):
@@ -31,7 +43,7 @@ def mock_stdin(monkeypatch):
     import json
 
     def _mock(data: dict[str, Any]) -> None:
-        monkeypatch.setattr("sys.stdin.read", lambda: json.dumps(data))
+        monkeypatch.setattr("sys.stdin.buffer.read", lambda: json.dumps(data).encode())
 
     return _mock
 
@@ -11,6 +11,7 @@ Tests all functions and edge cases:
 """
 
 import importlib.util
+import io
 import json
 import os
 import subprocess
@@ -113,6 +114,26 @@ class TestIsMeaningfulFile:
         assert is_meaningful_file("docs/guide.md") is False
         assert is_meaningful_file("CONTRIBUTING.md") is False
 
+    def test_returns_false_for_uppercase_markdown_extension(self) -> None:
+        """Should treat markdown extensions case-insensitively."""
+        assert is_meaningful_file("NOTES.MD") is False
+        assert is_meaningful_file("docs/Guide.Md") is False
+
+    def test_does_not_exclude_lookalike_names(self) -> None:
+        """Should only exclude exact directory and file names."""
+        assert is_meaningful_file("mytests/helper.py") is True
+        assert is_meaningful_file("src/not_conftest.py") is True
+        assert is_meaningful_file("hooks/readme.md.py") is True
+
+    def test_caches_decisions_per_path(self) -> None:
+        """Should answer repeated lookups for the same path from the cache."""
+        is_meaningful_file.cache_clear()
+        is_meaningful_file("src/cached.py")
+        is_meaningful_file("src/cached.py")
+        info = is_meaningful_file.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
     def test_returns_false_for_changelog(self) -> None:
         """Should return False for CHANGELOG.md (checked separately)."""
         assert is_meaningful_file("CHANGELOG.md") is False
@@ -144,7 +165,7 @@ class TestGetStagedFiles:
         """Should return list of staged files when git command succeeds."""
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "hooks/new-hook.py\nREADME.md\ntests/test.py\n"
+        mock_result.stdout = b"hooks/new-hook.py\nREADME.md\ntests/test.py\n"
 
         with patch("subprocess.run", return_value=mock_result) as mock_run:
             result = get_staged_files()
@@ -152,8 +173,10 @@ class TestGetStagedFiles:
             assert result == ["hooks/new-hook.py", "README.md", "tests/test.py"]
             mock_run.assert_called_once_with(
                 ["git", "diff", "--cached", "--name-only"],
-                capture_output=True,
-                text=True,
+                executable=changelog_reminder.find_executable("git"),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                close_fds=False,
                 timeout=5,
             )
 
@@ -188,7 +211,7 @@ class TestGetStagedFiles:
         """Should strip whitespace from filenames."""
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "  hooks/new.py  \n  README.md\n"
+        mock_result.stdout = b"  hooks/new.py  \n  README.md\n"
 
         with patch("subprocess.run", return_value=mock_result):
             result = get_staged_files()
@@ -198,7 +221,7 @@ class TestGetStagedFiles:
         """Should handle empty output from git diff."""
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = ""
+        mock_result.stdout = b""
 
         with patch("subprocess.run", return_value=mock_result):
             result = get_staged_files()
@@ -208,7 +231,17 @@ class TestGetStagedFiles:
         """Should filter out empty lines from output."""
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "hooks/new.py\n\n\nREADME.md\n"
+        mock_result.stdout = b"hooks/new.py\n\n\nREADME.md\n"
+
+        with patch("subprocess.run", return_value=mock_result):
+            result = get_staged_files()
+            assert result == ["hooks/new.py", "README.md"]
+
+    def test_handles_crlf_line_endings(self) -> None:
+        """Should split CRLF-terminated output without leaving carriage returns."""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = b"hooks/new.py\r\nREADME.md\r\n"
 
         with patch("subprocess.run", return_value=mock_result):
             result = get_staged_files()
@@ -258,6 +291,12 @@ class TestIsChangelogStaged:
         assert is_changelog_staged(["docs/CHANGELOG.md"]) is True
         assert is_changelog_staged(["project/docs/CHANGELOG.md"]) is True
 
+    def test_rejects_lookalike_file_names(self) -> None:
+        """Should only match files named exactly CHANGELOG.md."""
+        assert is_changelog_staged(["CHANGELOG.md.bak"]) is False
+        assert is_changelog_staged(["OLD-CHANGELOG.md"]) is False
+        assert is_changelog_staged(["CHANGELOG.md/notes.txt"]) is False
+
 
 # =============================================================================
 # Tests for is_git_commit_command()
@@ -319,16 +358,28 @@ class TestMain:
         self, mock_tool_use: dict[str, Any]
     ) -> None:
         """Should exit 0 when SKIP_CHANGELOG_CHECK=1 in environment."""
-        stdin_data = json.dumps(mock_tool_use)
+        stdin_data = json.dumps(mock_tool_use).encode()
 
         with patch("changelog_reminder.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with patch.dict(os.environ, {"SKIP_CHANGELOG_CHECK": "1"}):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
         assert exc_info.value.code == 0
 
+    def test_skip_env_exits_before_any_io(self) -> None:
+        """Should exit on SKIP_CHANGELOG_CHECK=1 without checking settings or reading stdin."""
+        with patch("changelog_reminder.exit_if_disabled") as mock_disabled:
+            with patch("hook_utils.read_stdin_bytes") as mock_read:
+                with patch.dict(os.environ, {"SKIP_CHANGELOG_CHECK": "1"}):
+                    with pytest.raises(SystemExit) as exc_info:
+                        main()
+
+        assert exc_info.value.code == 0
+        mock_disabled.assert_not_called()
+        mock_read.assert_not_called()
+
     def test_exits_when_skip_changelog_check_in_command(
         self, mock_tool_use: dict[str, Any]
     ) -> None:
@@ -336,10 +387,10 @@ class TestMain:
         mock_tool_use["tool_input"]["command"] = (
             "SKIP_CHANGELOG_CHECK=1 git commit -m 'Add hook'"
         )
-        stdin_data = json.dumps(mock_tool_use)
+        stdin_data = json.dumps(mock_tool_use).encode()
 
         with patch("changelog_reminder.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -352,10 +403,10 @@ class TestMain:
         mock_tool_use["tool_input"]["command"] = (
             "git add . && SKIP_CHANGELOG_CHECK=1 git commit -m 'message'"
         )
-        stdin_data = json.dumps(mock_tool_use)
+        stdin_data = json.dumps(mock_tool_use).encode()
 
         with patch("changelog_reminder.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -363,10 +414,10 @@ class TestMain:
 
     def test_exits_for_non_bash_tool(self, non_bash_tool_use: dict[str, Any]) -> None:
         """Should exit 0 for non-Bash tool invocations."""
-        stdin_data = json.dumps(non_bash_tool_use)
+        stdin_data = json.dumps(non_bash_tool_use).encode()
 
         with patch("changelog_reminder.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -375,10 +426,10 @@ class TestMain:
     def test_exits_when_not_git_commit(self, mock_tool_use: dict[str, Any]) -> None:
         """Should exit 0 when command is not git commit."""
         mock_tool_use["tool_input"]["command"] = "git status"
-        stdin_data = json.dumps(mock_tool_use)
+        stdin_data = json.dumps(mock_tool_use).encode()
 
         with patch("changelog_reminder.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -388,10 +439,10 @@ class TestMain:
         self, mock_tool_use: dict[str, Any]
     ) -> None:
         """Should exit 0 when only non-meaningful files are staged."""
-        stdin_data = json.dumps(mock_tool_use)
+        stdin_data = json.dumps(mock_tool_use).encode()
 
         with patch("changelog_reminder.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with patch(
                     "changelog_reminder.get_staged_files",
                     return_value=["tests/test.py", ".gitignore"],
@@ -405,10 +456,10 @@ class TestMain:
         self, mock_tool_use: dict[str, Any]
     ) -> None:
         """Should exit 0 when CHANGELOG.md is staged with meaningful files."""
-        stdin_data = json.dumps(mock_tool_use)
+        stdin_data = json.dumps(mock_tool_use).encode()
 
         with patch("changelog_reminder.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with patch(
                     "changelog_reminder.get_staged_files",
                     return_value=["hooks/new.py", "CHANGELOG.md"],
@@ -422,10 +473,10 @@ class TestMain:
         self, mock_tool_use: dict[str, Any], capsys
     ) -> None:
         """Should exit 2 and print error when meaningful files staged without CHANGELOG.md."""
-        stdin_data = json.dumps(mock_tool_use)
+        stdin_data = json.dumps(mock_tool_use).encode()
 
         with patch("changelog_reminder.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with patch(
                     "changelog_reminder.get_staged_files",
                     return_value=["hooks/new-hook.py", "hooks/utils.py"],
@@ -440,14 +491,30 @@ class TestMain:
         assert "hooks/utils.py" in captured.err
         assert "SKIP_CHANGELOG_CHECK=1" in captured.err
 
+    def test_blocks_oversized_payload(self, mock_tool_use: dict[str, Any]) -> None:
+        """Should read hook input past 64 KiB and still block the commit."""
+        mock_tool_use["tool_input"]["command"] = "git commit -m '" + "x" * 100_000 + "'"
+        stdin = io.BytesIO(json.dumps(mock_tool_use).encode())
+
+        with patch("changelog_reminder.exit_if_disabled"):
+            with patch("os.read", side_effect=lambda fd, size: stdin.read(size)):
+                with patch(
+                    "changelog_reminder.get_staged_files",
+                    return_value=["hooks/new-hook.py"],
+                ):
+                    with pytest.raises(SystemExit) as exc_info:
+                        main()
+
+        assert exc_info.value.code == 2
+
     def test_shows_meaningful_files_in_error_message(
         self, mock_tool_use: dict[str, Any], capsys
     ) -> None:
         """Should show only meaningful files in error message."""
-        stdin_data = json.dumps(mock_tool_use)
+        stdin_data = json.dumps(mock_tool_use).encode()
 
         with patch("changelog_reminder.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with patch(
                     "changelog_reminder.get_staged_files",
                     return_value=[
@@ -475,7 +542,9 @@ class TestMain:
         """Should exit 0 on unexpected exceptions (silent failure)."""
         # mock_tool_use fixture provides context but stdin.read raises before using it
         with patch("changelog_reminder.exit_if_disabled"):
-            with patch("sys.stdin.read", side_effect=Exception("Unexpected")):
+            with patch(
+                "hook_utils.read_stdin_bytes", side_effect=Exception("Unexpected")
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -484,7 +553,7 @@ class TestMain:
     def test_handles_malformed_json(self) -> None:
         """Should exit 0 when stdin contains malformed JSON."""
         with patch("changelog_reminder.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value="not valid json"):
+            with patch("hook_utils.read_stdin_bytes", return_value=b"not valid json"):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -493,10 +562,10 @@ class TestMain:
     def test_handles_missing_tool_input(self) -> None:
         """Should exit 0 when tool_input is missing from JSON."""
         tool_use = {"tool_name": "Bash"}  # Missing tool_input
-        stdin_data = json.dumps(tool_use)
+        stdin_data = json.dumps(tool_use).encode()
 
         with patch("changelog_reminder.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -505,10 +574,10 @@ class TestMain:
     def test_handles_missing_command(self) -> None:
         """Should exit 0 when command is missing from tool_input."""
         tool_use = {"tool_name": "Bash", "tool_input": {}}
-        stdin_data = json.dumps(tool_use)
+        stdin_data = json.dumps(tool_use).encode()
 
         with patch("changelog_reminder.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -529,14 +598,14 @@ class TestIntegration:
             "tool_name": "Bash",
             "tool_input": {"command": "git commit -m 'Add new hook'"},
         }
-        stdin_data = json.dumps(tool_use)
+        stdin_data = json.dumps(tool_use).encode()
 
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "hooks/new-hook.py\nCHANGELOG.md\n"
+        mock_result.stdout = b"hooks/new-hook.py\nCHANGELOG.md\n"
 
         with patch("changelog_reminder.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with patch("subprocess.run", return_value=mock_result):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
@@ -549,14 +618,14 @@ class TestIntegration:
             "tool_name": "Bash",
             "tool_input": {"command": "git commit -m 'Add new hook'"},
         }
-        stdin_data = json.dumps(tool_use)
+        stdin_data = json.dumps(tool_use).encode()
 
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "hooks/new-hook.py\nREADME.md\n"
+        mock_result.stdout = b"hooks/new-hook.py\nREADME.md\n"
 
         with patch("changelog_reminder.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with patch("subprocess.run", return_value=mock_result):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
@@ -571,14 +640,14 @@ class TestIntegration:
             "tool_name": "Bash",
             "tool_input": {"command": "git commit -m 'Add tests'"},
         }
-        stdin_data = json.dumps(tool_use)
+        stdin_data = json.dumps(tool_use).encode()
 
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "tests/test_new.py\ntests/conftest.py\n"
+        mock_result.stdout = b"tests/test_new.py\ntests/conftest.py\n"
 
         with patch("changelog_reminder.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with patch("subprocess.run", return_value=mock_result):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
@@ -593,10 +662,10 @@ class TestIntegration:
                 "command": "SKIP_CHANGELOG_CHECK=1 git commit -m 'Add hook'"
             },
         }
-        stdin_data = json.dumps(tool_use)
+        stdin_data = json.dumps(tool_use).encode()
 
         with patch("changelog_reminder.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
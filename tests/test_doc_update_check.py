@@ -3,27 +3,30 @@
 Comprehensive tests for doc-update-check hook targeting 100% code coverage.
 
 Tests all functions and edge cases:
-- get_current_branch()
 - extract_merge_target()
 - is_merge_to_main_regex()
 - is_merge_to_main_ai()
 - is_ai_mode_enabled()
 - is_merge_to_main()
 - load_doc_check_ignore_patterns()
+- compile_ignore_patterns()
 - is_ignored()
-- get_modified_docs()
+- has_modified_docs()
 - main()
 """
 
 import importlib.util
+import io
 import json
 import os
 import subprocess
 import sys
+import time
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, mock_open, patch
 
+import hook_utils
 import pytest
 
 # Import module with hyphenated name using importlib
@@ -35,7 +38,6 @@ doc_update_check = importlib.util.module_from_spec(spec)
 sys.modules["doc_update_check"] = doc_update_check
 spec.loader.exec_module(doc_update_check)
 
-get_current_branch = doc_update_check.get_current_branch
 extract_merge_target = doc_update_check.extract_merge_target
 is_merge_to_main_regex = doc_update_check.is_merge_to_main_regex
 is_merge_to_main_ai = doc_update_check.is_merge_to_main_ai
@@ -43,7 +45,8 @@ is_ai_mode_enabled = doc_update_check.is_ai_mode_enabled
 is_merge_to_main = doc_update_check.is_merge_to_main
 load_doc_check_ignore_patterns = doc_update_check.load_doc_check_ignore_patterns
 is_ignored = doc_update_check.is_ignored
-get_modified_docs = doc_update_check.get_modified_docs
+compile_ignore_patterns = doc_update_check.compile_ignore_patterns
+has_modified_docs = doc_update_check.has_modified_docs
 main = doc_update_check.main
 
 
@@ -52,6 +55,12 @@ main = doc_update_check.main
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def no_head_file(monkeypatch) -> None:
+    """Force the git subprocess branch lookup that these tests mock."""
+    monkeypatch.setattr(hook_utils, "read_head_branch", lambda: None)
+
+
 @pytest.fixture
 def mock_tool_use() -> dict[str, Any]:
     """Fixture for basic Bash tool use JSON."""
@@ -82,69 +91,6 @@ temp/*.md
 """
 
 
-# =============================================================================
-# Tests for get_current_branch()
-# =============================================================================
-
-
-class TestGetCurrentBranch:
-    """Test get_current_branch() function."""
-
-    def test_returns_branch_name_on_success(self) -> None:
-        """Should return current branch name when git command succeeds."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "feature-branch\n"
-
-        with patch("subprocess.run", return_value=mock_result) as mock_run:
-            result = get_current_branch()
-
-            assert result == "feature-branch"
-            mock_run.assert_called_once_with(
-                ["git", "branch", "--show-current"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-    def test_returns_none_on_git_error(self) -> None:
-        """Should return None when git command fails."""
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-
-        with patch("subprocess.run", return_value=mock_result):
-            result = get_current_branch()
-            assert result is None
-
-    def test_returns_none_on_timeout(self) -> None:
-        """Should return None when git command times out."""
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("git", 5)):
-            result = get_current_branch()
-            assert result is None
-
-    def test_returns_none_on_file_not_found(self) -> None:
-        """Should return None when git is not installed."""
-        with patch("subprocess.run", side_effect=FileNotFoundError):
-            result = get_current_branch()
-            assert result is None
-
-    def test_returns_none_on_os_error(self) -> None:
-        """Should return None on OS errors."""
-        with patch("subprocess.run", side_effect=OSError):
-            result = get_current_branch()
-            assert result is None
-
-    def test_strips_whitespace_from_branch_name(self) -> None:
-        """Should strip whitespace from branch name."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "  main  \n"
-
-        with patch("subprocess.run", return_value=mock_result):
-            result = get_current_branch()
-            assert result == "main"
-
-
 # =============================================================================
 # Tests for extract_merge_target()
 # =============================================================================
@@ -259,6 +205,78 @@ class TestIsMergeToMainRegex:
         assert is_merge_to_main_regex("git checkout main") is False
         assert is_merge_to_main_regex("git status") is False
 
+    def test_skips_branch_lookup_for_non_merge_commands(self) -> None:
+        """Should not spawn git for commands that only mention merge."""
+        with patch("doc_update_check.get_current_branch") as mock_branch:
+            is_merge_to_main_regex('git commit -m "merge fix"')
+            is_merge_to_main_regex("git log --oneline | grep merge")
+        mock_branch.assert_not_called()
+
+    def test_skips_branch_lookup_when_checkout_main_matches(self) -> None:
+        """Should detect checkout-main chains without a branch lookup."""
+        command = "git merge feature; git checkout main && git merge other"
+        with patch("doc_update_check.get_current_branch") as mock_branch:
+            assert is_merge_to_main_regex(command) is True
+        mock_branch.assert_not_called()
+
+    def test_rejects_merging_main_into_feature_branch(self) -> None:
+        """Should reject merges whose destination is a feature branch."""
+        commands = [
+            "git checkout feature && git merge main",
+            "git switch feature; git merge --no-ff master",
+            "git checkout -b hotfix main && git merge other",
+        ]
+        with patch("doc_update_check.get_current_branch") as mock_branch:
+            for cmd in commands:
+                assert is_merge_to_main_regex(cmd) is False
+        mock_branch.assert_not_called()
+
+    def test_tracks_last_checkout_in_chain(self) -> None:
+        """Should use the branch checked out most recently before the merge."""
+        command = (
+            "git checkout feature && git pull && git checkout main && git merge feature"
+        )
+        assert is_merge_to_main_regex(command) is True
+
+        command = "git checkout main && git pull; git checkout dev && git merge x"
+        assert is_merge_to_main_regex(command) is False
+
+    def test_detects_switch_to_master_then_merge(self) -> None:
+        """Should treat master like main."""
+        assert is_merge_to_main_regex("git switch master && git merge feature") is True
+
+    def test_detects_git_merge_on_master_branch(self) -> None:
+        """Should detect git merge when on master branch."""
+        with patch("doc_update_check.get_current_branch", return_value="master"):
+            assert is_merge_to_main_regex("git merge feature") is True
+
+    def test_rejects_checkout_main_then_commit_mentioning_merge(self) -> None:
+        """Should not treat merge text after a checkout as a merge."""
+        command = "git checkout main && git commit -m 'merge cleanup'"
+        assert is_merge_to_main_regex(command) is False
+
+    def test_detects_gh_pr_merge_later_in_chain(self) -> None:
+        """Should detect gh pr merge in any chain segment."""
+        assert is_merge_to_main_regex("git push && gh pr merge 12") is True
+
+    def test_segment_pattern_names_the_matched_action(self) -> None:
+        """Should classify each segment kind with one combined pattern."""
+        pattern = doc_update_check.MERGE_SEGMENT_PATTERN
+        assert pattern.match("gh pr merge 12").group("gh_merge")
+        assert pattern.match(" git checkout -b new main").group("checkout") == "new"
+        assert pattern.match("git switch feature").group("checkout") == "feature"
+        assert pattern.match("git merge --squash x").group("merge")
+        assert pattern.match("git commit -m 'merge'") is None
+        assert pattern.match("git mergetool") is None
+
+    def test_looks_up_branch_once_for_multiple_merges(self) -> None:
+        """Should resolve all merges on the current branch with one lookup."""
+        with patch(
+            "doc_update_check.get_current_branch", return_value="feature"
+        ) as mock_branch:
+            assert is_merge_to_main_regex("git merge a && git merge b") is False
+        mock_branch.assert_called_once()
+
 
 # =============================================================================
 # Tests for is_merge_to_main_ai()
@@ -351,41 +369,27 @@ class TestIsMergeToMainAI:
 class TestIsAiModeEnabled:
     """Tests for is_ai_mode_enabled function."""
 
-    def test_returns_true_when_env_var_set(self) -> None:
-        """Environment variable enables AI mode."""
-        with patch.dict(os.environ, {"DOC_CHECK_USE_AI": "1"}):
+    def test_returns_true_when_force_env_var_set(self) -> None:
+        """DOC_CHECK_FORCE_AI=1 forces the AI fallback."""
+        with patch.dict(os.environ, {"DOC_CHECK_FORCE_AI": "1"}):
             assert is_ai_mode_enabled() is True
 
     def test_returns_false_when_env_var_not_set(self) -> None:
-        """No env var and no flag file means regex mode."""
-        with patch.dict(os.environ, {"CLAUDE_PROJECT_DIR": ""}, clear=True):
+        """No env var means local parsing only."""
+        with patch.dict(os.environ, {}, clear=True):
             assert is_ai_mode_enabled() is False
 
-    def test_returns_true_when_flag_file_exists(self) -> None:
-        """Flag file in project dir enables AI mode."""
-        with patch.dict(os.environ, {"CLAUDE_PROJECT_DIR": "/project"}, clear=True):
-            with patch("pathlib.Path.exists", return_value=True):
-                assert is_ai_mode_enabled() is True
+    def test_ignores_legacy_env_var(self) -> None:
+        """DOC_CHECK_USE_AI no longer enables the AI fallback."""
+        with patch.dict(os.environ, {"DOC_CHECK_USE_AI": "1"}, clear=True):
+            assert is_ai_mode_enabled() is False
 
-    def test_returns_false_when_flag_file_missing(self) -> None:
-        """Missing flag file means regex mode."""
+    def test_ignores_legacy_flag_file(self) -> None:
+        """The project flag file no longer enables the AI fallback."""
         with patch.dict(os.environ, {"CLAUDE_PROJECT_DIR": "/project"}, clear=True):
-            with patch("pathlib.Path.exists", return_value=False):
+            with patch("pathlib.Path.exists", return_value=True):
                 assert is_ai_mode_enabled() is False
 
-    def test_env_var_takes_precedence_over_flag_file(self) -> None:
-        """Env var should work even without checking flag file."""
-        with patch.dict(
-            os.environ, {"DOC_CHECK_USE_AI": "1", "CLAUDE_PROJECT_DIR": ""}
-        ):
-            # Even without project dir, env var should enable AI mode
-            assert is_ai_mode_enabled() is True
-
-    def test_returns_false_when_no_project_dir(self) -> None:
-        """No CLAUDE_PROJECT_DIR means can't check flag file."""
-        with patch.dict(os.environ, {}, clear=True):
-            assert is_ai_mode_enabled() is False
-
 
 # =============================================================================
 # Tests for is_merge_to_main() - Toggle Function
@@ -464,9 +468,22 @@ class TestLoadDocCheckIgnorePatterns:
 
     def test_returns_empty_list_when_file_not_exists(self) -> None:
         """Should return empty list when .doc-check-ignore doesn't exist."""
-        with patch.object(Path, "exists", return_value=False):
-            result = load_doc_check_ignore_patterns()
-            assert result == []
+        with patch.dict(os.environ, {"CLAUDE_PROJECT_DIR": "/fake"}):
+            with patch("builtins.open", side_effect=FileNotFoundError) as mock_file:
+                result = load_doc_check_ignore_patterns()
+
+        assert result == []
+        mock_file.assert_called_once_with(
+            os.path.join("/fake", ".doc-check-ignore"), encoding="utf-8"
+        )
+
+    def test_returns_empty_list_without_project_dir(self) -> None:
+        """Should not touch the filesystem without CLAUDE_PROJECT_DIR."""
+        with patch.dict(os.environ, {}, clear=True):
+            with patch("builtins.open") as mock_file:
+                assert load_doc_check_ignore_patterns() == []
+
+        mock_file.assert_not_called()
 
     def test_loads_patterns_from_file(self) -> None:
         """Should load patterns from .doc-check-ignore file."""
@@ -474,9 +491,8 @@ class TestLoadDocCheckIgnorePatterns:
         mock_file = mock_open(read_data=content)
 
         with patch.dict(os.environ, {"CLAUDE_PROJECT_DIR": "/fake"}):
-            with patch.object(Path, "exists", return_value=True):
-                with patch.object(Path, "open", mock_file):
-                    result = load_doc_check_ignore_patterns()
+            with patch("builtins.open", mock_file):
+                result = load_doc_check_ignore_patterns()
 
         assert result == ["docs/**", "*-todo.md", "temp/*.md"]
 
@@ -487,24 +503,23 @@ class TestLoadDocCheckIgnorePatterns:
         mock_file = mock_open(read_data=doc_check_ignore_content)
 
         with patch.dict(os.environ, {"CLAUDE_PROJECT_DIR": "/fake"}):
-            with patch.object(Path, "exists", return_value=True):
-                with patch.object(Path, "open", mock_file):
-                    result = load_doc_check_ignore_patterns()
+            with patch("builtins.open", mock_file):
+                result = load_doc_check_ignore_patterns()
 
         assert result == ["docs/**", "*-todo.md", "temp/*.md"]
 
     def test_handles_file_read_error_gracefully(self) -> None:
         """Should return empty list on file read errors."""
-        with patch.object(Path, "exists", return_value=True):
-            with patch.object(Path, "open", side_effect=OSError):
+        with patch.dict(os.environ, {"CLAUDE_PROJECT_DIR": "/fake"}):
+            with patch("builtins.open", side_effect=OSError):
                 result = load_doc_check_ignore_patterns()
 
         assert result == []
 
     def test_handles_io_error_gracefully(self) -> None:
         """Should return empty list on IO errors."""
-        with patch.object(Path, "exists", return_value=True):
-            with patch.object(Path, "open", side_effect=IOError):
+        with patch.dict(os.environ, {"CLAUDE_PROJECT_DIR": "/fake"}):
+            with patch("builtins.open", side_effect=IOError):
                 result = load_doc_check_ignore_patterns()
 
         assert result == []
@@ -515,9 +530,8 @@ class TestLoadDocCheckIgnorePatterns:
         mock_file = mock_open(read_data=content)
 
         with patch.dict(os.environ, {"CLAUDE_PROJECT_DIR": "/fake"}):
-            with patch.object(Path, "exists", return_value=True):
-                with patch.object(Path, "open", mock_file):
-                    result = load_doc_check_ignore_patterns()
+            with patch("builtins.open", mock_file):
+                result = load_doc_check_ignore_patterns()
 
         assert result == ["docs/**", "*-todo.md"]
 
@@ -583,130 +597,176 @@ class TestIsIgnored:
         patterns2 = ["test-*.md"]
         assert is_ignored("test-notes.md", patterns2) is True
 
+    def test_reuses_compiled_patterns(self) -> None:
+        """Should compile each pattern set once and reuse the result."""
+        first = compile_ignore_patterns(("docs/**", "*-todo.md"))
+        second = compile_ignore_patterns(("docs/**", "*-todo.md"))
+        assert first is second
+
+    def test_compiles_patterns_into_single_alternation(self) -> None:
+        """Should combine all patterns into one anchored regex."""
+        compiled = compile_ignore_patterns(("docs/**", "temp/*.md"))
+        assert compiled.match("docs/api/guide.md")
+        assert compiled.match("temp/draft.md")
+        assert not compiled.match("temp/nested/draft.md")
+        assert not compiled.match("src/docs/guide.md")
+
+    def test_returns_none_for_no_patterns(self) -> None:
+        """Should return None when there is nothing to compile."""
+        assert compile_ignore_patterns(()) is None
+
 
 # =============================================================================
-# Tests for get_modified_docs()
+# Tests for has_modified_docs()
 # =============================================================================
 
 
-class TestGetModifiedDocs:
-    """Test get_modified_docs() function."""
+def make_diff_process(output: bytes) -> MagicMock:
+    """Build a mock git diff process streaming the given output."""
+    proc = MagicMock()
+    proc.stdout = io.BytesIO(output)
+    return proc
 
-    def test_returns_modified_md_files_on_feature_branch(self) -> None:
-        """Should return .md files modified in branch vs main."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "README.md\nCHANGELOG.md\nsrc/code.py\n"
 
-        with patch("subprocess.run", return_value=mock_result) as mock_run:
+class TestHasModifiedDocs:
+    """Test has_modified_docs() function."""
+
+    def test_detects_modified_md_files_on_feature_branch(self) -> None:
+        """Should detect .md files modified in branch vs main."""
+        proc = make_diff_process(b"src/code.py\nREADME.md\n")
+
+        with patch("subprocess.Popen", return_value=proc) as mock_popen:
             with patch(
                 "doc_update_check.load_doc_check_ignore_patterns",
                 return_value=[],
             ):
-                result = get_modified_docs()
+                result = has_modified_docs()
 
-        assert result == ["README.md", "CHANGELOG.md"]
-        mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
+        assert result is True
+        mock_popen.assert_called_once()
+        args = mock_popen.call_args[0][0]
         assert args[:2] == ["git", "diff"]
         assert "main...HEAD" in args
 
-    def test_returns_modified_md_files_with_merge_target(self) -> None:
+    def test_diffs_against_merge_target_when_provided(self) -> None:
         """Should diff against merge target when provided."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "docs/guide.md\n"
+        proc = make_diff_process(b"docs/guide.md\n")
 
-        with patch("subprocess.run", return_value=mock_result) as mock_run:
+        with patch("subprocess.Popen", return_value=proc) as mock_popen:
             with patch(
                 "doc_update_check.load_doc_check_ignore_patterns",
                 return_value=[],
             ):
-                result = get_modified_docs(merge_target="feature")
+                result = has_modified_docs(merge_target="feature")
 
-        assert result == ["docs/guide.md"]
-        args = mock_run.call_args[0][0]
+        assert result is True
+        args = mock_popen.call_args[0][0]
         assert "feature" in args
         assert "main...HEAD" not in args
 
-    def test_filters_md_files_case_insensitive(self) -> None:
+    def test_matches_md_files_case_insensitive(self) -> None:
         """Should match .md, .MD, .Md etc."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "README.md\nCHANGELOG.MD\nGuide.Md\ncode.py\n"
+        for output in (b"CHANGELOG.MD\n", b"Guide.Md\n", b"README.md\n"):
+            with patch("subprocess.Popen", return_value=make_diff_process(output)):
+                with patch(
+                    "doc_update_check.load_doc_check_ignore_patterns",
+                    return_value=[],
+                ):
+                    assert has_modified_docs() is True
 
-        with patch("subprocess.run", return_value=mock_result):
+    def test_applies_ignore_patterns(self) -> None:
+        """Should not count files matching ignore patterns."""
+        ignore_patterns = ["docs/**", "*-todo.md"]
+
+        proc = make_diff_process(b"docs/guide.md\nplan-todo.md\nsrc/code.py\n")
+        with patch("subprocess.Popen", return_value=proc):
             with patch(
                 "doc_update_check.load_doc_check_ignore_patterns",
-                return_value=[],
+                return_value=ignore_patterns,
             ):
-                result = get_modified_docs()
-
-        assert result == ["README.md", "CHANGELOG.MD", "Guide.Md"]
-
-    def test_applies_ignore_patterns(self) -> None:
-        """Should filter out files matching ignore patterns."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "README.md\ndocs/guide.md\nplan-todo.md\n"
-
-        ignore_patterns = ["docs/**", "*-todo.md"]
+                assert has_modified_docs() is False
 
-        with patch("subprocess.run", return_value=mock_result):
+        proc = make_diff_process(b"docs/guide.md\nREADME.md\n")
+        with patch("subprocess.Popen", return_value=proc):
             with patch(
                 "doc_update_check.load_doc_check_ignore_patterns",
                 return_value=ignore_patterns,
             ):
-                result = get_modified_docs()
+                assert has_modified_docs() is True
 
-        assert result == ["README.md"]
+    def test_stops_reading_after_first_doc(self) -> None:
+        """Should stop consuming git output and kill git on the first hit."""
+        lines = iter([b"README.md\n", b"src/code.py\n"])
+        proc = MagicMock()
+        proc.stdout.__iter__.return_value = lines
 
-    def test_returns_empty_list_on_git_error(self) -> None:
-        """Should return empty list when git command fails."""
-        mock_result = MagicMock()
-        mock_result.returncode = 1
+        with patch("subprocess.Popen", return_value=proc):
+            with patch(
+                "doc_update_check.load_doc_check_ignore_patterns",
+                return_value=[],
+            ):
+                assert has_modified_docs() is True
 
-        with patch("subprocess.run", return_value=mock_result):
-            result = get_modified_docs()
+        assert next(lines) == b"src/code.py\n"
+        proc.kill.assert_called_once()
+        proc.wait.assert_called_once()
 
-        assert result == []
+    def test_returns_false_when_no_docs_modified(self) -> None:
+        """Should return False when only non-doc files changed."""
+        proc = make_diff_process(b"src/code.py\ntests/test.py\n")
 
-    def test_returns_empty_list_on_timeout(self) -> None:
-        """Should return empty list when git command times out."""
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("git", 10)):
-            result = get_modified_docs()
+        with patch("subprocess.Popen", return_value=proc):
+            with patch(
+                "doc_update_check.load_doc_check_ignore_patterns",
+                return_value=[],
+            ):
+                assert has_modified_docs() is False
 
-        assert result == []
+    def test_returns_false_on_file_not_found(self) -> None:
+        """Should return False when git is not installed."""
+        with patch("subprocess.Popen", side_effect=FileNotFoundError):
+            with patch(
+                "doc_update_check.load_doc_check_ignore_patterns",
+                return_value=[],
+            ):
+                assert has_modified_docs() is False
 
-    def test_returns_empty_list_on_file_not_found(self) -> None:
-        """Should return empty list when git is not installed."""
-        with patch("subprocess.run", side_effect=FileNotFoundError):
-            result = get_modified_docs()
+    def test_returns_false_on_os_error(self) -> None:
+        """Should return False on OS errors."""
+        with patch("subprocess.Popen", side_effect=OSError):
+            with patch(
+                "doc_update_check.load_doc_check_ignore_patterns",
+                return_value=[],
+            ):
+                assert has_modified_docs() is False
 
-        assert result == []
+    def test_returns_false_when_git_diff_times_out(self) -> None:
+        """Should kill a hung git diff and fail open after the timeout."""
+        hung_git = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(20)"],
+            stdout=subprocess.PIPE,
+        )
 
-    def test_returns_empty_list_on_os_error(self) -> None:
-        """Should return empty list on OS errors."""
-        with patch("subprocess.run", side_effect=OSError):
-            result = get_modified_docs()
+        with patch("subprocess.Popen", return_value=hung_git):
+            with patch.object(doc_update_check, "GIT_DIFF_TIMEOUT", 0.2):
+                with patch(
+                    "doc_update_check.load_doc_check_ignore_patterns",
+                    return_value=[],
+                ):
+                    started = time.monotonic()
+                    assert has_modified_docs() is False
 
-        assert result == []
+        assert time.monotonic() - started < 10
+        assert hung_git.returncode is not None
 
     def test_handles_empty_git_output(self) -> None:
-        """Should handle empty output from git diff."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = ""
-
-        with patch("subprocess.run", return_value=mock_result):
+        """Should return False for empty output (e.g. git error)."""
+        with patch("subprocess.Popen", return_value=make_diff_process(b"")):
             with patch(
                 "doc_update_check.load_doc_check_ignore_patterns",
                 return_value=[],
             ):
-                result = get_modified_docs()
-
-        # Empty string split produces [""], filtering for .md gives []
-        assert result == []
+                assert has_modified_docs() is False
 
 
 # =============================================================================
@@ -721,25 +781,37 @@ class TestMain:
         self, mock_tool_use: dict[str, Any]
     ) -> None:
         """Should exit 0 when SKIP_DOC_CHECK=1 in environment."""
-        stdin_data = json.dumps(mock_tool_use)
+        stdin_data = json.dumps(mock_tool_use).encode()
 
         with patch("doc_update_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
+                with patch.dict(os.environ, {"SKIP_DOC_CHECK": "1"}):
+                    with pytest.raises(SystemExit) as exc_info:
+                        main()
+
+        assert exc_info.value.code == 0
+
+    def test_skip_env_exits_before_any_io(self) -> None:
+        """Should exit on SKIP_DOC_CHECK=1 without checking settings or reading stdin."""
+        with patch("doc_update_check.exit_if_disabled") as mock_disabled:
+            with patch("hook_utils.read_stdin_bytes") as mock_read:
                 with patch.dict(os.environ, {"SKIP_DOC_CHECK": "1"}):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
         assert exc_info.value.code == 0
+        mock_disabled.assert_not_called()
+        mock_read.assert_not_called()
 
     def test_exits_when_skip_doc_check_in_command(
         self, mock_tool_use: dict[str, Any]
     ) -> None:
         """Should exit 0 when SKIP_DOC_CHECK=1 in command string."""
         mock_tool_use["tool_input"]["command"] = "SKIP_DOC_CHECK=1 git merge feature"
-        stdin_data = json.dumps(mock_tool_use)
+        stdin_data = json.dumps(mock_tool_use).encode()
 
         with patch("doc_update_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -752,10 +824,10 @@ class TestMain:
         mock_tool_use["tool_input"]["command"] = (
             "git checkout main && SKIP_DOC_CHECK=1 git merge feature"
         )
-        stdin_data = json.dumps(mock_tool_use)
+        stdin_data = json.dumps(mock_tool_use).encode()
 
         with patch("doc_update_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -763,10 +835,10 @@ class TestMain:
 
     def test_exits_for_non_bash_tool(self, non_bash_tool_use: dict[str, Any]) -> None:
         """Should exit 0 for non-Bash tool invocations."""
-        stdin_data = json.dumps(non_bash_tool_use)
+        stdin_data = json.dumps(non_bash_tool_use).encode()
 
         with patch("doc_update_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -775,10 +847,10 @@ class TestMain:
     def test_exits_when_not_merge_to_main(self, mock_tool_use: dict[str, Any]) -> None:
         """Should exit 0 when command is not merge-to-main."""
         mock_tool_use["tool_input"]["command"] = "git status"
-        stdin_data = json.dumps(mock_tool_use)
+        stdin_data = json.dumps(mock_tool_use).encode()
 
         with patch("doc_update_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -788,40 +860,63 @@ class TestMain:
         self, mock_tool_use: dict[str, Any]
     ) -> None:
         """Should exit 0 when documentation files were modified."""
-        stdin_data = json.dumps(mock_tool_use)
+        stdin_data = json.dumps(mock_tool_use).encode()
 
         with patch("doc_update_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with patch("doc_update_check.is_merge_to_main", return_value=True):
                     with patch(
                         "doc_update_check.get_current_branch",
                         return_value="feature",
                     ):
                         with patch(
-                            "doc_update_check.get_modified_docs",
-                            return_value=["README.md"],
+                            "doc_update_check.has_modified_docs",
+                            return_value=True,
                         ):
                             with pytest.raises(SystemExit) as exc_info:
                                 main()
 
         assert exc_info.value.code == 0
 
+    def test_blocks_oversized_payload(self, mock_tool_use: dict[str, Any]) -> None:
+        """Should read hook input past 64 KiB and still block the merge."""
+        mock_tool_use["tool_input"]["command"] = (
+            "git merge -m '" + "x" * 100_000 + "' feature"
+        )
+        stdin = io.BytesIO(json.dumps(mock_tool_use).encode())
+
+        with patch("doc_update_check.exit_if_disabled"):
+            with patch("os.read", side_effect=lambda fd, size: stdin.read(size)):
+                with patch("doc_update_check.is_merge_to_main", return_value=True):
+                    with patch(
+                        "doc_update_check.get_current_branch",
+                        return_value="feature",
+                    ):
+                        with patch(
+                            "doc_update_check.has_modified_docs",
+                            return_value=False,
+                        ):
+                            with pytest.raises(SystemExit) as exc_info:
+                                main()
+
+        assert exc_info.value.code == 2
+
     def test_blocks_when_no_docs_modified(
         self, mock_tool_use: dict[str, Any], capsys
     ) -> None:
         """Should exit 2 and print error when no docs modified."""
-        stdin_data = json.dumps(mock_tool_use)
+        stdin_data = json.dumps(mock_tool_use).encode()
 
         with patch("doc_update_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with patch("doc_update_check.is_merge_to_main", return_value=True):
                     with patch(
                         "doc_update_check.get_current_branch",
                         return_value="feature",
                     ):
                         with patch(
-                            "doc_update_check.get_modified_docs",
-                            return_value=[],
+                            "doc_update_check.has_modified_docs",
+                            return_value=False,
                         ):
                             with pytest.raises(SystemExit) as exc_info:
                                 main()
@@ -836,18 +931,18 @@ class TestMain:
     ) -> None:
         """Should extract merge target when already on main branch."""
         mock_tool_use["tool_input"]["command"] = "git merge feature-branch"
-        stdin_data = json.dumps(mock_tool_use)
+        stdin_data = json.dumps(mock_tool_use).encode()
 
         with patch("doc_update_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with patch("doc_update_check.is_merge_to_main", return_value=True):
                     with patch(
                         "doc_update_check.get_current_branch",
                         return_value="main",
                     ):
                         with patch(
-                            "doc_update_check.get_modified_docs",
-                            return_value=["README.md"],
+                            "doc_update_check.has_modified_docs",
+                            return_value=True,
                         ) as mock_get_docs:
                             with pytest.raises(SystemExit) as exc_info:
                                 main()
@@ -860,18 +955,18 @@ class TestMain:
         self, mock_tool_use: dict[str, Any]
     ) -> None:
         """Should not extract merge target when on feature branch."""
-        stdin_data = json.dumps(mock_tool_use)
+        stdin_data = json.dumps(mock_tool_use).encode()
 
         with patch("doc_update_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with patch("doc_update_check.is_merge_to_main", return_value=True):
                     with patch(
                         "doc_update_check.get_current_branch",
                         return_value="feature",
                     ):
                         with patch(
-                            "doc_update_check.get_modified_docs",
-                            return_value=["README.md"],
+                            "doc_update_check.has_modified_docs",
+                            return_value=True,
                         ) as mock_get_docs:
                             with pytest.raises(SystemExit) as exc_info:
                                 main()
@@ -886,7 +981,9 @@ class TestMain:
         """Should exit 0 on unexpected exceptions (silent failure)."""
         # mock_tool_use fixture provides context but stdin.read raises before using it
         with patch("doc_update_check.exit_if_disabled"):
-            with patch("sys.stdin.read", side_effect=Exception("Unexpected")):
+            with patch(
+                "hook_utils.read_stdin_bytes", side_effect=Exception("Unexpected")
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -895,7 +992,7 @@ class TestMain:
     def test_handles_malformed_json(self) -> None:
         """Should exit 0 when stdin contains malformed JSON."""
         with patch("doc_update_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value="not valid json"):
+            with patch("hook_utils.read_stdin_bytes", return_value=b"not valid json"):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -904,10 +1001,10 @@ class TestMain:
     def test_handles_missing_tool_input(self) -> None:
         """Should exit 0 when tool_input is missing from JSON."""
         tool_use = {"tool_name": "Bash"}  # Missing tool_input
-        stdin_data = json.dumps(tool_use)
+        stdin_data = json.dumps(tool_use).encode()
 
         with patch("doc_update_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -916,10 +1013,10 @@ class TestMain:
     def test_handles_missing_command(self) -> None:
         """Should exit 0 when command is missing from tool_input."""
         tool_use = {"tool_name": "Bash", "tool_input": {}}
-        stdin_data = json.dumps(tool_use)
+        stdin_data = json.dumps(tool_use).encode()
 
         with patch("doc_update_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -940,21 +1037,19 @@ class TestIntegration:
             "tool_name": "Bash",
             "tool_input": {"command": "git merge feature-123"},
         }
-        stdin_data = json.dumps(tool_use)
+        stdin_data = json.dumps(tool_use).encode()
 
         mock_git_branch = MagicMock()
         mock_git_branch.returncode = 0
-        mock_git_branch.stdout = "main"
+        mock_git_branch.stdout = b"main"
 
-        mock_git_diff = MagicMock()
-        mock_git_diff.returncode = 0
-        mock_git_diff.stdout = "README.md\nCHANGELOG.md\nsrc/code.py\n"
+        mock_git_diff = make_diff_process(b"README.md\nCHANGELOG.md\nsrc/code.py\n")
 
         with patch("doc_update_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
-                with patch(
-                    "subprocess.run",
-                    side_effect=[mock_git_branch, mock_git_diff],
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
+                with (
+                    patch("subprocess.run", return_value=mock_git_branch),
+                    patch("subprocess.Popen", return_value=mock_git_diff),
                 ):
                     with patch(
                         "doc_update_check.load_doc_check_ignore_patterns",
@@ -971,22 +1066,19 @@ class TestIntegration:
             "tool_name": "Bash",
             "tool_input": {"command": "git merge feature-123"},
         }
-        stdin_data = json.dumps(tool_use)
+        stdin_data = json.dumps(tool_use).encode()
 
         mock_git_branch = MagicMock()
         mock_git_branch.returncode = 0
-        mock_git_branch.stdout = "main"
+        mock_git_branch.stdout = b"main"
 
-        mock_git_diff = MagicMock()
-        mock_git_diff.returncode = 0
-        mock_git_diff.stdout = "src/code.py\ntests/test.py\n"
+        mock_git_diff = make_diff_process(b"src/code.py\ntests/test.py\n")
 
         with patch("doc_update_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
-                # Need two git branch calls (is_merge_to_main_regex, main) + one git diff
-                with patch(
-                    "subprocess.run",
-                    side_effect=[mock_git_branch, mock_git_branch, mock_git_diff],
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
+                with (
+                    patch("subprocess.run", return_value=mock_git_branch),
+                    patch("subprocess.Popen", return_value=mock_git_diff),
                 ):
                     with patch(
                         "doc_update_check.load_doc_check_ignore_patterns",
@@ -1005,32 +1097,28 @@ class TestIntegration:
             "tool_name": "Bash",
             "tool_input": {"command": "git merge feature"},
         }
-        stdin_data = json.dumps(tool_use)
+        stdin_data = json.dumps(tool_use).encode()
 
         mock_git_branch = MagicMock()
         mock_git_branch.returncode = 0
-        mock_git_branch.stdout = "main"
+        mock_git_branch.stdout = b"main"
 
-        mock_git_diff = MagicMock()
-        mock_git_diff.returncode = 0
         # Only docs/** files modified, which are ignored
-        mock_git_diff.stdout = "docs/internal.md\nplan-todo.md\n"
+        mock_git_diff = make_diff_process(b"docs/internal.md\nplan-todo.md\n")
 
         ignore_content = "docs/**\n*-todo.md"
         mock_file = mock_open(read_data=ignore_content)
 
         with patch("doc_update_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
-                # Need two git branch calls (is_merge_to_main_regex, main) + one git diff
-                with patch(
-                    "subprocess.run",
-                    side_effect=[mock_git_branch, mock_git_branch, mock_git_diff],
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
+                with (
+                    patch("subprocess.run", return_value=mock_git_branch),
+                    patch("subprocess.Popen", return_value=mock_git_diff),
                 ):
                     with patch.dict(os.environ, {"CLAUDE_PROJECT_DIR": "/fake"}):
-                        with patch.object(Path, "exists", return_value=True):
-                            with patch.object(Path, "open", mock_file):
-                                with pytest.raises(SystemExit) as exc_info:
-                                    main()
+                        with patch("builtins.open", mock_file):
+                            with pytest.raises(SystemExit) as exc_info:
+                                main()
 
         # All docs ignored, should block
         assert exc_info.value.code == 2
@@ -1041,16 +1129,20 @@ class TestIntegration:
             "tool_name": "Bash",
             "tool_input": {"command": "gh pr merge 123 --squash"},
         }
-        stdin_data = json.dumps(tool_use)
+        stdin_data = json.dumps(tool_use).encode()
 
-        # gh pr merge doesn't need current branch check
-        mock_git_diff = MagicMock()
-        mock_git_diff.returncode = 0
-        mock_git_diff.stdout = "CHANGELOG.md\n"
+        mock_git_branch = MagicMock()
+        mock_git_branch.returncode = 0
+        mock_git_branch.stdout = b"feature"
+
+        mock_git_diff = make_diff_process(b"CHANGELOG.md\n")
 
         with patch("doc_update_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
-                with patch("subprocess.run", return_value=mock_git_diff):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
+                with (
+                    patch("subprocess.run", return_value=mock_git_branch),
+                    patch("subprocess.Popen", return_value=mock_git_diff),
+                ):
                     with patch(
                         "doc_update_check.load_doc_check_ignore_patterns",
                         return_value=[],
@@ -1066,11 +1158,11 @@ class TestIntegration:
             "tool_name": "Read",
             "tool_input": {"file_path": "/some/file.txt"},
         }
-        stdin_data = json.dumps(tool_use)
+        stdin_data = json.dumps(tool_use).encode()
 
         # Test by importing and checking __name__ == "__main__" path
         with patch("doc_update_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=stdin_data):
+            with patch("hook_utils.read_stdin_bytes", return_value=stdin_data):
                 # Simulate module execution via __main__
                 with patch.object(doc_update_check, "__name__", "__main__"):
                     with pytest.raises(SystemExit) as exc_info:
@@ -3,6 +3,8 @@
 Comprehensive tests for environment-awareness hook.
 
 Tests all functions:
+- get_os_string()
+- get_home_dir()
 - get_environment_context()
 - main()
 """
@@ -25,9 +27,53 @@ sys.modules["environment_awareness"] = environment_awareness
 spec.loader.exec_module(environment_awareness)
 
 get_environment_context = environment_awareness.get_environment_context
+get_os_string = environment_awareness.get_os_string
+get_home_dir = environment_awareness.get_home_dir
 main = environment_awareness.main
 
 
+@pytest.fixture(autouse=True)
+def clear_cached_environment() -> None:
+    """Clear per-process caches so each test sees its own mocks."""
+    get_os_string.cache_clear()
+    get_home_dir.cache_clear()
+
+
+# =============================================================================
+# Tests for get_os_string() and get_home_dir()
+# =============================================================================
+
+
+class TestCachedEnvironmentValues:
+    """Test per-process cached OS and home directory lookups."""
+
+    def test_os_string_is_computed_once(self) -> None:
+        """Should query platform only once for repeated lookups."""
+        with patch("platform.system", return_value="Linux") as mock_system:
+            with patch("platform.release", return_value="6.2.0"):
+                assert get_os_string() == "Linux 6.2.0"
+                assert get_os_string() == "Linux 6.2.0"
+
+        mock_system.assert_called_once()
+
+    def test_home_dir_matches_path_home(self) -> None:
+        """Should return the user's home directory."""
+        assert get_home_dir() == str(Path.home())
+
+    def test_home_dir_prefers_home_env_var(self, monkeypatch) -> None:
+        """Should use $HOME without consulting the password database."""
+        monkeypatch.setenv("HOME", "/home/tester")
+        with patch("pathlib.Path.home") as mock_home:
+            assert get_home_dir() == "/home/tester"
+        mock_home.assert_not_called()
+
+    def test_home_dir_falls_back_when_home_unset(self, monkeypatch) -> None:
+        """Should fall back to Path.home() when $HOME is empty."""
+        monkeypatch.setenv("HOME", "")
+        with patch("pathlib.Path.home", return_value=Path("/home/fallback")):
+            assert get_home_dir() == str(Path("/home/fallback"))
+
+
 # =============================================================================
 # Tests for get_environment_context()
 # =============================================================================
@@ -46,10 +92,8 @@ class TestGetEnvironmentContext:
 
         with patch("environment_awareness.datetime") as mock_dt:
             mock_dt.now.return_value.astimezone.return_value = mock_now
-            with patch("environment_awareness.platform.system", return_value="Darwin"):
-                with patch(
-                    "environment_awareness.platform.release", return_value="24.0.0"
-                ):
+            with patch("platform.system", return_value="Darwin"):
+                with patch("platform.release", return_value="24.0.0"):
                     monkeypatch.setenv("CLAUDE_PROJECT_DIR", "/home/user/project")
 
                     result = get_environment_context()
@@ -67,10 +111,8 @@ class TestGetEnvironmentContext:
 
         with patch("environment_awareness.datetime") as mock_dt:
             mock_dt.now.return_value.astimezone.return_value = mock_now
-            with patch("environment_awareness.platform.system", return_value="Darwin"):
-                with patch(
-                    "environment_awareness.platform.release", return_value="24.0.0"
-                ):
+            with patch("platform.system", return_value="Darwin"):
+                with patch("platform.release", return_value="24.0.0"):
                     monkeypatch.setenv("CLAUDE_PROJECT_DIR", "/home/user/project")
 
                     result = get_environment_context()
@@ -87,10 +129,8 @@ class TestGetEnvironmentContext:
 
         with patch("environment_awareness.datetime") as mock_dt:
             mock_dt.now.return_value.astimezone.return_value = mock_now
-            with patch("environment_awareness.platform.system", return_value="Linux"):
-                with patch(
-                    "environment_awareness.platform.release", return_value="6.2.0"
-                ):
+            with patch("platform.system", return_value="Linux"):
+                with patch("platform.release", return_value="6.2.0"):
                     monkeypatch.setenv("CLAUDE_PROJECT_DIR", "/home/user/project")
 
                     result = get_environment_context()
@@ -110,10 +150,8 @@ class TestGetEnvironmentContext:
 
         with patch("environment_awareness.datetime") as mock_dt:
             mock_dt.now.return_value.astimezone.return_value = mock_now
-            with patch("environment_awareness.platform.system", return_value="Linux"):
-                with patch(
-                    "environment_awareness.platform.release", return_value="6.2.0"
-                ):
+            with patch("platform.system", return_value="Linux"):
+                with patch("platform.release", return_value="6.2.0"):
                     monkeypatch.setenv("CLAUDE_PROJECT_DIR", project_dir)
 
                     result = get_environment_context()
@@ -130,16 +168,33 @@ class TestGetEnvironmentContext:
 
         with patch("environment_awareness.datetime") as mock_dt:
             mock_dt.now.return_value.astimezone.return_value = mock_now
-            with patch("environment_awareness.platform.system", return_value="Linux"):
-                with patch(
-                    "environment_awareness.platform.release", return_value="6.2.0"
-                ):
+            with patch("platform.system", return_value="Linux"):
+                with patch("platform.release", return_value="6.2.0"):
                     monkeypatch.setenv("CLAUDE_PROJECT_DIR", "/opt/project")
 
                     result = get_environment_context()
 
         assert "Directory: /opt/project" in result
 
+    def test_does_not_collapse_sibling_of_home_directory(self, monkeypatch) -> None:
+        """Should not collapse directories that only share the home prefix."""
+        mock_now = MagicMock()
+        mock_now.strftime.side_effect = lambda fmt: {
+            "%Y-%m-%d (%A)": "2025-12-21 (Saturday)",
+            "%H:%M %Z": "14:30 PST",
+        }[fmt]
+
+        with patch("environment_awareness.datetime") as mock_dt:
+            mock_dt.now.return_value.astimezone.return_value = mock_now
+            with patch("platform.system", return_value="Linux"):
+                with patch("platform.release", return_value="6.2.0"):
+                    monkeypatch.setenv("HOME", "/home/user")
+                    monkeypatch.setenv("CLAUDE_PROJECT_DIR", "/home/user2/app")
+
+                    result = get_environment_context()
+
+        assert "Directory: /home/user2/app" in result
+
     def test_uses_cwd_when_no_claude_project_dir(self, monkeypatch) -> None:
         """Should use current working directory when CLAUDE_PROJECT_DIR not set."""
         mock_now = MagicMock()
@@ -152,10 +207,8 @@ class TestGetEnvironmentContext:
 
         with patch("environment_awareness.datetime") as mock_dt:
             mock_dt.now.return_value.astimezone.return_value = mock_now
-            with patch("environment_awareness.platform.system", return_value="Linux"):
-                with patch(
-                    "environment_awareness.platform.release", return_value="6.2.0"
-                ):
+            with patch("platform.system", return_value="Linux"):
+                with patch("platform.release", return_value="6.2.0"):
                     with patch(
                         "environment_awareness.os.getcwd", return_value="/tmp/test"
                     ):
@@ -173,10 +226,8 @@ class TestGetEnvironmentContext:
 
         with patch("environment_awareness.datetime") as mock_dt:
             mock_dt.now.return_value.astimezone.return_value = mock_now
-            with patch("environment_awareness.platform.system", return_value="Linux"):
-                with patch(
-                    "environment_awareness.platform.release", return_value="6.2.0"
-                ):
+            with patch("platform.system", return_value="Linux"):
+                with patch("platform.release", return_value="6.2.0"):
                     monkeypatch.setenv("CLAUDE_PROJECT_DIR", "/tmp/test")
 
                     result = get_environment_context()
@@ -202,7 +253,7 @@ class TestMain:
 
         with patch("environment_awareness.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -216,7 +267,7 @@ class TestMain:
 
         with patch("environment_awareness.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with patch(
                         "environment_awareness.get_environment_context",
                         return_value="## Test Output",
@@ -232,7 +283,7 @@ class TestMain:
         """Should exit 0 on unexpected exceptions (silent failure)."""
         with patch("environment_awareness.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", side_effect=Exception("Unexpected error")):
+                with patch("json.loads", side_effect=Exception("Unexpected error")):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -241,9 +292,9 @@ class TestMain:
     def test_handles_malformed_json(self) -> None:
         """Should exit 0 when stdin contains malformed JSON."""
         with patch("environment_awareness.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value="not valid json"):
+            with patch("sys.stdin.buffer.read", return_value=b"not valid json"):
                 with patch(
-                    "json.load", side_effect=json.JSONDecodeError("msg", "doc", 0)
+                    "json.loads", side_effect=json.JSONDecodeError("msg", "doc", 0)
                 ):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
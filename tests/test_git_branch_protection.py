@@ -3,7 +3,6 @@
 Comprehensive tests for git-branch-protection hook.
 
 Tests all functions:
-- get_current_branch()
 - detect_file_write_patterns()
 - main()
 """
@@ -11,10 +10,9 @@ Tests all functions:
 # Import using importlib for hyphenated name
 import importlib.util
 import json
-import subprocess
 import sys
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -26,75 +24,11 @@ git_branch_protection = importlib.util.module_from_spec(spec)
 sys.modules["git_branch_protection"] = git_branch_protection
 spec.loader.exec_module(git_branch_protection)
 
-get_current_branch = git_branch_protection.get_current_branch
 detect_file_write_patterns = git_branch_protection.detect_file_write_patterns
 main = git_branch_protection.main
 PROTECTED_BRANCHES = git_branch_protection.PROTECTED_BRANCHES
 
 
-# =============================================================================
-# Tests for get_current_branch()
-# =============================================================================
-
-
-class TestGetCurrentBranch:
-    """Test get_current_branch() function."""
-
-    def test_returns_branch_name_on_success(self) -> None:
-        """Should return current branch name when git command succeeds."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "feature-branch\n"
-
-        with patch("subprocess.run", return_value=mock_result) as mock_run:
-            result = get_current_branch()
-
-            assert result == "feature-branch"
-            mock_run.assert_called_once_with(
-                ["git", "branch", "--show-current"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-    def test_returns_none_on_git_error(self) -> None:
-        """Should return None when git command fails."""
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-
-        with patch("subprocess.run", return_value=mock_result):
-            result = get_current_branch()
-            assert result is None
-
-    def test_returns_none_on_timeout(self) -> None:
-        """Should return None when git command times out."""
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("git", 5)):
-            result = get_current_branch()
-            assert result is None
-
-    def test_returns_none_on_file_not_found(self) -> None:
-        """Should return None when git is not installed."""
-        with patch("subprocess.run", side_effect=FileNotFoundError):
-            result = get_current_branch()
-            assert result is None
-
-    def test_returns_none_on_os_error(self) -> None:
-        """Should return None on OS errors."""
-        with patch("subprocess.run", side_effect=OSError):
-            result = get_current_branch()
-            assert result is None
-
-    def test_strips_whitespace_from_branch_name(self) -> None:
-        """Should strip whitespace from branch name."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "  main  \n"
-
-        with patch("subprocess.run", return_value=mock_result):
-            result = get_current_branch()
-            assert result == "main"
-
-
 # =============================================================================
 # Tests for detect_file_write_patterns()
 # =============================================================================
@@ -166,17 +100,43 @@ class TestDetectFileWritePatterns:
 
     def test_ignores_quoted_redirect_in_string(self) -> None:
         """Should not be confused by > in quoted strings."""
-        # Note: Pattern matching can't reliably distinguish this
-        # This test documents current behavior - may have false positives
-        detect_file_write_patterns('git commit -m "x > y"')
-        # We accept that this might trigger a question (false positive)
-        # because reliable detection is impossible without parsing
+        assert detect_file_write_patterns('git commit -m "x > y"') == []
 
     def test_ignores_comparison_operators(self) -> None:
         """Should not be confused by comparison operators."""
-        # Note: Pattern matching can't reliably distinguish this
-        detect_file_write_patterns("awk '{if($1>5) print}'")
-        # We accept that this might trigger a question (false positive)
+        assert detect_file_write_patterns("awk '{if($1>5) print}'") == []
+
+    def test_ignores_heredoc_commit_message_body(self) -> None:
+        """Should skip > inside a heredoc commit message."""
+        command = "git commit -m \"$(cat <<'EOF'\nfix: handle a > b\n\nEOF\n)\""
+        assert detect_file_write_patterns(command) == []
+
+    def test_ignores_unquoted_heredoc_body(self) -> None:
+        """Should skip heredoc body lines but still see the heredoc redirect."""
+        command = "cat <<EOF > notes.txt\na > b\nEOF\necho done"
+        names = [p[0] for p in detect_file_write_patterns(command)]
+        assert names == ["redirect >", "heredoc redirect"]
+
+    def test_ignores_file_descriptor_duplication(self) -> None:
+        """Should not treat 2>&1 as a file write."""
+        assert detect_file_write_patterns("make 2>&1 | grep error") == []
+
+    def test_later_safe_redirect_does_not_hide_write(self) -> None:
+        """Should report a file write even if a later redirect is safe."""
+        patterns = detect_file_write_patterns("echo a > out.txt; echo b > /dev/null")
+        assert [p[0] for p in patterns] == ["redirect >"]
+
+    def test_ignores_quoted_inplace_edit(self) -> None:
+        """Should ignore sed -i text inside quotes."""
+        assert detect_file_write_patterns("echo 'run sed -i later'") == []
+
+    def test_ignores_tee_to_dev_null_with_options(self) -> None:
+        """Should skip tee options when checking the target."""
+        assert detect_file_write_patterns("cmd | tee -a /dev/null") == []
+
+    def test_handles_unterminated_quote(self) -> None:
+        """Should stop scanning at an unterminated quote."""
+        assert detect_file_write_patterns('echo "oops > file') == []
 
     def test_detects_multiple_patterns(self) -> None:
         """Should detect multiple patterns in one command."""
@@ -210,8 +170,8 @@ class TestMain:
         input_data = {"tool_name": "Edit", "tool_input": {"file_path": "/test.py"}}
 
         with patch("git_branch_protection.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("hook_utils.read_stdin_bytes"):
+                with patch("json.loads", return_value=input_data):
                     with patch(
                         "git_branch_protection.get_current_branch", return_value="main"
                     ):
@@ -228,8 +188,8 @@ class TestMain:
         input_data = {"tool_name": "Edit", "tool_input": {"file_path": "/test.py"}}
 
         with patch("git_branch_protection.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("hook_utils.read_stdin_bytes"):
+                with patch("json.loads", return_value=input_data):
                     with patch(
                         "git_branch_protection.get_current_branch",
                         return_value="master",
@@ -246,8 +206,8 @@ class TestMain:
         input_data = {"tool_name": "Edit", "tool_input": {"file_path": "/test.py"}}
 
         with patch("git_branch_protection.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("hook_utils.read_stdin_bytes"):
+                with patch("json.loads", return_value=input_data):
                     with patch(
                         "git_branch_protection.get_current_branch",
                         return_value="production",
@@ -264,8 +224,8 @@ class TestMain:
         input_data = {"tool_name": "Edit", "tool_input": {"file_path": "/test.py"}}
 
         with patch("git_branch_protection.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("hook_utils.read_stdin_bytes"):
+                with patch("json.loads", return_value=input_data):
                     with patch(
                         "git_branch_protection.get_current_branch", return_value="prod"
                     ):
@@ -281,8 +241,8 @@ class TestMain:
         input_data = {"tool_name": "Edit", "tool_input": {"file_path": "/test.py"}}
 
         with patch("git_branch_protection.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("hook_utils.read_stdin_bytes"):
+                with patch("json.loads", return_value=input_data):
                     with patch(
                         "git_branch_protection.get_current_branch",
                         return_value="feature/new-ui",
@@ -297,8 +257,8 @@ class TestMain:
         input_data = {"tool_name": "Edit", "tool_input": {"file_path": "/test.py"}}
 
         with patch("git_branch_protection.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("hook_utils.read_stdin_bytes"):
+                with patch("json.loads", return_value=input_data):
                     with patch(
                         "git_branch_protection.get_current_branch", return_value=None
                     ):
@@ -310,8 +270,8 @@ class TestMain:
     def test_exits_successfully_on_exception(self) -> None:
         """Should exit 0 on unexpected exceptions (silent failure)."""
         with patch("git_branch_protection.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", side_effect=Exception("Unexpected error")):
+            with patch("hook_utils.read_stdin_bytes"):
+                with patch("json.loads", side_effect=Exception("Unexpected error")):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -320,9 +280,9 @@ class TestMain:
     def test_handles_malformed_json(self) -> None:
         """Should exit 0 when stdin contains malformed JSON."""
         with patch("git_branch_protection.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
+            with patch("hook_utils.read_stdin_bytes"):
                 with patch(
-                    "json.load", side_effect=json.JSONDecodeError("msg", "doc", 0)
+                    "json.loads", side_effect=json.JSONDecodeError("msg", "doc", 0)
                 ):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
@@ -331,7 +291,7 @@ class TestMain:
 
     def test_protected_branches_list_is_correct(self) -> None:
         """Should have correct list of protected branches."""
-        assert PROTECTED_BRANCHES == ["main", "master", "production", "prod"]
+        assert PROTECTED_BRANCHES == frozenset({"main", "master", "production", "prod"})
 
 
 # =============================================================================
@@ -352,8 +312,8 @@ class TestMainBashPatternDetection:
         }
 
         with patch("git_branch_protection.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("hook_utils.read_stdin_bytes"):
+                with patch("json.loads", return_value=input_data):
                     with patch(
                         "git_branch_protection.get_current_branch", return_value="main"
                     ):
@@ -378,8 +338,8 @@ class TestMainBashPatternDetection:
         }
 
         with patch("git_branch_protection.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("hook_utils.read_stdin_bytes"):
+                with patch("json.loads", return_value=input_data):
                     with patch(
                         "git_branch_protection.get_current_branch", return_value="main"
                     ):
@@ -401,8 +361,8 @@ class TestMainBashPatternDetection:
         }
 
         with patch("git_branch_protection.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("hook_utils.read_stdin_bytes"):
+                with patch("json.loads", return_value=input_data):
                     with patch(
                         "git_branch_protection.get_current_branch", return_value="main"
                     ):
@@ -421,8 +381,8 @@ class TestMainBashPatternDetection:
         input_data = {"tool_name": "Bash", "tool_input": {"command": "ls -la"}}
 
         with patch("git_branch_protection.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("hook_utils.read_stdin_bytes"):
+                with patch("json.loads", return_value=input_data):
                     with patch(
                         "git_branch_protection.get_current_branch", return_value="main"
                     ):
@@ -441,8 +401,8 @@ class TestMainBashPatternDetection:
         }
 
         with patch("git_branch_protection.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("hook_utils.read_stdin_bytes"):
+                with patch("json.loads", return_value=input_data):
                     with patch(
                         "git_branch_protection.get_current_branch", return_value="main"
                     ):
@@ -461,8 +421,8 @@ class TestMainBashPatternDetection:
         }
 
         with patch("git_branch_protection.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("hook_utils.read_stdin_bytes"):
+                with patch("json.loads", return_value=input_data):
                     with patch(
                         "git_branch_protection.get_current_branch",
                         return_value="feature/test",
@@ -482,8 +442,8 @@ class TestMainBashPatternDetection:
         }
 
         with patch("git_branch_protection.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("hook_utils.read_stdin_bytes"):
+                with patch("json.loads", return_value=input_data):
                     with patch(
                         "git_branch_protection.get_current_branch", return_value="main"
                     ):
@@ -501,8 +461,8 @@ class TestMainBashPatternDetection:
         input_data = {"tool_name": "Bash", "tool_input": {}}
 
         with patch("git_branch_protection.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("hook_utils.read_stdin_bytes"):
+                with patch("json.loads", return_value=input_data):
                     with patch(
                         "git_branch_protection.get_current_branch", return_value="main"
                     ):
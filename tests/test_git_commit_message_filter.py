@@ -119,6 +119,33 @@ EOF
 
         assert exc_info.value.code == 2
 
+    def test_blocked_pattern_matches_each_marker(self) -> None:
+        """Should match every marker with the single combined pattern."""
+        pattern = git_commit_message_filter.BLOCKED_MESSAGE_PATTERN
+        assert pattern.search("🤖 Generated with [Claude Code]")
+        assert pattern.search("Co-Authored-By: Claude <noreply@anthropic.com>")
+        assert pattern.search("generated with claude code")
+        assert pattern.search("Claude <noreply@anthropic.com>")
+        assert pattern.search("Fix typo in README") is None
+
+    def test_skips_regex_without_claude_literal(self) -> None:
+        """Should not run the marker regex when "claude" never appears."""
+        with patch.object(
+            git_commit_message_filter, "BLOCKED_MESSAGE_PATTERN"
+        ) as mock_pattern:
+            check_commit_message('git commit -m "Generated with care"')
+
+        mock_pattern.search.assert_not_called()
+
+    def test_literal_prefilter_is_case_insensitive(self) -> None:
+        """Should still block lowercase markers after the literal check."""
+        with pytest.raises(SystemExit) as exc_info:
+            check_commit_message(
+                'git commit -m "co-authored-by: claude <noreply@anthropic.com>"'
+            )
+
+        assert exc_info.value.code == 2
+
 
 # =============================================================================
 # Tests for main()
@@ -138,7 +165,10 @@ class TestMain:
         }
 
         with patch("git_commit_message_filter.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "hook_utils.read_stdin_bytes",
+                return_value=json.dumps(input_data).encode(),
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -154,7 +184,10 @@ class TestMain:
         }
 
         with patch("git_commit_message_filter.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "hook_utils.read_stdin_bytes",
+                return_value=json.dumps(input_data).encode(),
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -168,7 +201,10 @@ class TestMain:
         }
 
         with patch("git_commit_message_filter.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "hook_utils.read_stdin_bytes",
+                return_value=json.dumps(input_data).encode(),
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -179,7 +215,10 @@ class TestMain:
         input_data = {"tool_name": "Bash", "tool_input": {"command": "npm install"}}
 
         with patch("git_commit_message_filter.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "hook_utils.read_stdin_bytes",
+                return_value=json.dumps(input_data).encode(),
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -190,7 +229,10 @@ class TestMain:
         input_data = {"tool_name": "Bash", "tool_input": {}}
 
         with patch("git_commit_message_filter.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "hook_utils.read_stdin_bytes",
+                return_value=json.dumps(input_data).encode(),
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -68,6 +68,33 @@ EOF
         # Should not raise SystemExit
         check_git_command(command)
 
+    def test_allows_no_verify_in_heredoc_with_custom_delimiter(self) -> None:
+        """Should allow --no-verify inside any heredoc body, not just EOF."""
+        command = "git commit -F - <<MSG\nDrop --no-verify from scripts\nMSG"
+        # Should not raise SystemExit
+        check_git_command(command)
+
+    def test_blocks_no_verify_on_heredoc_operator_line(self) -> None:
+        """Should block --no-verify on the line that opens the heredoc."""
+        command = "cat <<EOF | git commit --no-verify -F -\nmessage\nEOF"
+        with pytest.raises(SystemExit) as exc_info:
+            check_git_command(command)
+
+        assert exc_info.value.code == 2
+
+    def test_blocks_no_verify_after_heredoc_ends(self) -> None:
+        """Should block --no-verify that follows a closed heredoc."""
+        command = "git commit -F - <<EOF\nmessage\nEOF\ngit push --no-verify"
+        with pytest.raises(SystemExit) as exc_info:
+            check_git_command(command)
+
+        assert exc_info.value.code == 2
+
+    def test_heredoc_check_is_linear_for_unterminated_input(self) -> None:
+        """Should handle many unterminated heredoc operators quickly."""
+        command = "<<EOF " * 5000 + "\n" + "x\n" * 5000 + "--no-verify"
+        assert git_safety_check.is_in_heredoc(command, len(command) - 3)
+
     def test_blocks_main_branch_deletion_remote(self, capsys) -> None:
         """Should block deletion of main branch on remote."""
         with pytest.raises(SystemExit) as exc_info:
@@ -151,6 +178,52 @@ EOF
         # Should not raise SystemExit
         check_git_command("git branch -d feature && git push origin main")
 
+    def test_deletion_patterns_capture_protected_branch(self) -> None:
+        """Should match every protected branch with one alternation regex."""
+        local_pattern = git_safety_check.LOCAL_DELETE_PATTERN
+        remote_pattern = git_safety_check.REMOTE_DELETE_PATTERN
+        for branch in git_safety_check.PROTECTED_BRANCHES:
+            assert local_pattern.search(f"git branch -D {branch}").group(1) == branch
+            assert (
+                remote_pattern.search(f"git push origin :{branch}").group(1) == branch
+            )
+        assert local_pattern.search("git branch -D prod-feature") is None
+
+    def test_preformats_blocking_message_per_protected_branch(self) -> None:
+        """Should format one deletion message for every protected branch."""
+        messages = git_safety_check.BRANCH_DELETE_MESSAGES
+        assert set(messages) == set(git_safety_check.PROTECTED_BRANCHES)
+        assert b"Cannot delete protected branch 'prod'" in messages["prod"]
+
+    def test_skips_regexes_without_literal_matches(self) -> None:
+        """Should not run any regex for commands lacking the trigger literals."""
+        with (
+            patch.object(git_safety_check, "NO_VERIFY_PATTERN") as mock_verify,
+            patch.object(git_safety_check, "REMOTE_DELETE_PATTERN") as mock_remote,
+            patch.object(git_safety_check, "LOCAL_DELETE_PATTERN") as mock_local,
+        ):
+            check_git_command("git status && git log --oneline")
+
+        mock_verify.search.assert_not_called()
+        mock_remote.search.assert_not_called()
+        mock_local.search.assert_not_called()
+
+    def test_reports_branch_for_remote_and_local_deletion(self, capsys) -> None:
+        """Should name the deleted branch when both deletion kinds appear."""
+        with pytest.raises(SystemExit) as exc_info:
+            check_git_command("git branch -d main && git push origin :production")
+
+        assert exc_info.value.code == 2
+        captured = capsys.readouterr()
+        assert "Cannot delete protected branch 'production'" in captured.err
+
+    def test_blocks_branch_deletion_with_extra_whitespace(self) -> None:
+        """Should still block deletions spelled with repeated whitespace."""
+        with pytest.raises(SystemExit) as exc_info:
+            check_git_command("git  branch   -D  master")
+
+        assert exc_info.value.code == 2
+
 
 # =============================================================================
 # Tests for main()
@@ -168,7 +241,10 @@ class TestMain:
         }
 
         with patch("git_safety_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "hook_utils.read_stdin_bytes",
+                return_value=json.dumps(input_data).encode(),
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -181,7 +257,10 @@ class TestMain:
         input_data = {"tool_name": "Bash", "tool_input": {"command": "git status"}}
 
         with patch("git_safety_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "hook_utils.read_stdin_bytes",
+                return_value=json.dumps(input_data).encode(),
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -195,7 +274,10 @@ class TestMain:
         }
 
         with patch("git_safety_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "hook_utils.read_stdin_bytes",
+                return_value=json.dumps(input_data).encode(),
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -206,7 +288,10 @@ class TestMain:
         input_data = {"tool_name": "Bash", "tool_input": {"command": "npm install"}}
 
         with patch("git_safety_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "hook_utils.read_stdin_bytes",
+                return_value=json.dumps(input_data).encode(),
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -215,7 +300,10 @@ class TestMain:
     def test_exits_successfully_on_exception(self) -> None:
         """Should exit 0 on unexpected exceptions (silent failure)."""
         with patch("git_safety_check.exit_if_disabled"):
-            with patch("sys.stdin.read", side_effect=Exception("Unexpected error")):
+            with patch(
+                "hook_utils.read_stdin_bytes",
+                side_effect=Exception("Unexpected error"),
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -224,7 +312,7 @@ class TestMain:
     def test_handles_malformed_json(self) -> None:
         """Should exit 0 when stdin contains malformed JSON."""
         with patch("git_safety_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value="not valid json"):
+            with patch("hook_utils.read_stdin_bytes", return_value=b"not valid json"):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -235,7 +323,10 @@ class TestMain:
         input_data = {"tool_name": "Bash", "tool_input": {}}
 
         with patch("git_safety_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "hook_utils.read_stdin_bytes",
+                return_value=json.dumps(input_data).encode(),
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -7,19 +7,34 @@ Tests all utility functions:
 - get_hook_name()
 - is_hook_disabled()
 - exit_if_disabled()
+- read_stdin_bytes()
+- write_stderr()
+- read_tool_input()
+- find_executable()
+- find_git_dir()
+- read_head_branch()
+- get_current_branch()
 - classify_file()
 - estimate_tokens()
 - count_lines()
 - get_large_file_threshold()
+- get_claude_settings()
 - FilenameMatcher class
 - Language enum
+- build_language_extensions()
+- iter_files()
 - detect_project_languages()
+- module import cost
 """
 
+import fnmatch
+import importlib.util
 import json
+import os
+import subprocess
 import sys
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import hook_utils
 import pytest
@@ -66,6 +81,24 @@ class TestColors:
         assert hook_utils.Colors.CYAN == "\033[1;36m"
         assert hook_utils.Colors.RESET == "\033[0m"
 
+    def test_returns_plain_text_when_disabled(self, monkeypatch) -> None:
+        """Should skip ANSI codes entirely when colors are disabled."""
+        monkeypatch.setattr(hook_utils.Colors, "ENABLED", False)
+        assert hook_utils.Colors.red("error") == "error"
+        assert hook_utils.Colors.cyan("highlight") == "highlight"
+
+    def test_no_color_env_disables_colors_at_import(self, monkeypatch) -> None:
+        """Should read NO_COLOR once when the module is imported."""
+        monkeypatch.setenv("NO_COLOR", "1")
+        spec = importlib.util.spec_from_file_location(
+            "hook_utils_no_color", hook_utils.__file__
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        assert module.Colors.ENABLED is False
+        assert module.Colors.yellow("warning") == "warning"
+
 
 # =============================================================================
 # Tests for get_hook_name()
@@ -181,7 +214,7 @@ class TestIsHookDisabled:
         disabled_file.write_text("git-safety-check\n")
         monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(temp_project_dir))
 
-        with patch.object(Path, "open", side_effect=OSError):
+        with patch("builtins.open", side_effect=OSError):
             result = hook_utils.is_hook_disabled("git-safety-check")
             assert result is False
 
@@ -197,6 +230,57 @@ class TestIsHookDisabled:
             result = hook_utils.is_hook_disabled(None)
             assert result is True
 
+    def test_all_enabled_env_var_skips_file_lookup(
+        self, temp_project_dir, monkeypatch
+    ) -> None:
+        """Should treat every hook as enabled without touching the file."""
+        disabled_file = temp_project_dir / ".claude" / "disabled-hooks"
+        disabled_file.write_text("git-safety-check\n")
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(temp_project_dir))
+        monkeypatch.setenv("CLAUDE_HOOKS_ALL_ENABLED", "1")
+
+        with patch("os.stat") as mock_stat:
+            assert hook_utils.is_hook_disabled("git-safety-check") is False
+
+        mock_stat.assert_not_called()
+
+    def test_returns_false_when_path_is_directory(
+        self, temp_project_dir, monkeypatch
+    ) -> None:
+        """Should ignore a directory named disabled-hooks."""
+        (temp_project_dir / ".claude" / "disabled-hooks").mkdir()
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(temp_project_dir))
+
+        assert hook_utils.is_hook_disabled("git-safety-check") is False
+
+    def test_parses_file_once_for_repeated_checks(
+        self, temp_project_dir, monkeypatch
+    ) -> None:
+        """Should reuse the parsed set while the file is unchanged."""
+        disabled_file = temp_project_dir / ".claude" / "disabled-hooks"
+        disabled_file.write_text("git-safety-check\n")
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(temp_project_dir))
+        hook_utils.load_disabled_hooks.cache_clear()
+
+        assert hook_utils.is_hook_disabled("git-safety-check") is True
+        assert hook_utils.is_hook_disabled("other-hook") is False
+
+        info = hook_utils.load_disabled_hooks.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_rereads_file_after_modification(
+        self, temp_project_dir, monkeypatch
+    ) -> None:
+        """Should pick up changes to the disabled-hooks file."""
+        disabled_file = temp_project_dir / ".claude" / "disabled-hooks"
+        disabled_file.write_text("git-safety-check\n")
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(temp_project_dir))
+
+        assert hook_utils.is_hook_disabled("other-hook") is False
+        disabled_file.write_text("git-safety-check\nother-hook\n")
+        assert hook_utils.is_hook_disabled("other-hook") is True
+
 
 # =============================================================================
 # Tests for exit_if_disabled()
@@ -245,6 +329,288 @@ class TestExitIfDisabled:
             assert exc_info.value.code == 0
 
 
+# =============================================================================
+# Tests for read_stdin_bytes()
+# =============================================================================
+
+
+class TestReadStdinBytes:
+    """Test read_stdin_bytes() function."""
+
+    def test_reads_from_file_descriptor_zero(self) -> None:
+        """Should read fd 0 directly until os.read() signals EOF."""
+        with patch("os.read", side_effect=[b'{"tool_name": "Bash"}', b""]) as mock:
+            result = hook_utils.read_stdin_bytes()
+
+        assert result == b'{"tool_name": "Bash"}'
+        mock.assert_called_with(0, hook_utils.STDIN_READ_SIZE)
+
+    def test_joins_chunks_of_large_input(self) -> None:
+        """Should accumulate every chunk instead of truncating large input."""
+        chunks = [b"a" * hook_utils.STDIN_READ_SIZE, b"b" * 10, b""]
+        with patch("os.read", side_effect=chunks):
+            result = hook_utils.read_stdin_bytes()
+
+        assert result == b"a" * hook_utils.STDIN_READ_SIZE + b"b" * 10
+
+    def test_returns_empty_bytes_for_empty_stdin(self) -> None:
+        """Should return empty bytes when stdin is already at EOF."""
+        with patch("os.read", return_value=b""):
+            assert hook_utils.read_stdin_bytes() == b""
+
+
+# =============================================================================
+# Tests for write_stderr()
+# =============================================================================
+
+
+class TestWriteStderr:
+    """Test write_stderr() function."""
+
+    def test_writes_encoded_message_line(self, capsys) -> None:
+        """Should write the bytes followed by a newline to stderr."""
+        hook_utils.write_stderr("❌ Blocked".encode())
+
+        assert capsys.readouterr().err == "❌ Blocked\n"
+
+    def test_keeps_order_after_text_output(self, capsys) -> None:
+        """Should flush earlier print() output before writing bytes."""
+        print("first", file=sys.stderr)
+        hook_utils.write_stderr(b"second")
+
+        assert capsys.readouterr().err == "first\nsecond\n"
+
+
+# =============================================================================
+# Tests for read_tool_input()
+# =============================================================================
+
+
+class TestReadToolInput:
+    """Test read_tool_input() function."""
+
+    def test_parses_stdin_json(self) -> None:
+        """Should parse the raw stdin bytes as JSON."""
+        with patch(
+            "hook_utils.read_stdin_bytes", return_value=b'{"tool_name": "Bash"}'
+        ):
+            assert hook_utils.read_tool_input() == {"tool_name": "Bash"}
+
+    def test_reads_stdin_once_per_process(self) -> None:
+        """Should return the cached payload on repeated calls."""
+        with patch("hook_utils.read_stdin_bytes", return_value=b"{}") as mock_read:
+            hook_utils.read_tool_input()
+            hook_utils.read_tool_input()
+
+        mock_read.assert_called_once()
+
+    def test_raises_on_invalid_json(self) -> None:
+        """Should raise ValueError so hooks can fail silently."""
+        with patch("hook_utils.read_stdin_bytes", return_value=b"not json"):
+            with pytest.raises(ValueError):
+                hook_utils.read_tool_input()
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path, monkeypatch) -> Path:
+    """Create a minimal repository layout and chdir into a subdirectory."""
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "src").mkdir()
+    monkeypatch.chdir(tmp_path / "src")
+    return tmp_path
+
+
+# =============================================================================
+# Tests for find_executable()
+# =============================================================================
+
+
+class TestFindExecutable:
+    """Test find_executable() function."""
+
+    def test_resolves_command_on_path(self, monkeypatch, tmp_path: Path) -> None:
+        """Should return the path of the first executable match on PATH."""
+        tool = tmp_path / "bin" / "tool"
+        tool.parent.mkdir()
+        tool.write_text("#!/bin/sh\n")
+        tool.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path / 'missing'}{os.pathsep}{tool.parent}")
+
+        assert hook_utils.find_executable("tool") == str(tool)
+
+    def test_skips_non_executable_files(self, monkeypatch, tmp_path: Path) -> None:
+        """Should ignore files without execute permission."""
+        (tmp_path / "tool").write_text("not a program")
+        (tmp_path / "tool").chmod(0o644)
+        monkeypatch.setenv("PATH", str(tmp_path))
+
+        assert hook_utils.find_executable("tool") == "tool"
+
+    def test_returns_bare_name_when_not_found(self, monkeypatch, tmp_path) -> None:
+        """Should fall back to the bare name so subprocess reports the error."""
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert hook_utils.find_executable("no-such-tool") == "no-such-tool"
+
+
+# =============================================================================
+# Tests for find_git_dir() and read_head_branch()
+# =============================================================================
+
+
+class TestReadHeadBranch:
+    """Test reading the branch name from the HEAD file."""
+
+    def test_finds_git_dir_in_parent(self, git_repo: Path) -> None:
+        """Should walk upward to the nearest .git directory."""
+        assert hook_utils.find_git_dir(str(git_repo / "src")) == str(git_repo / ".git")
+
+    def test_returns_none_outside_repository(self, tmp_path: Path) -> None:
+        """Should return None when no .git entry exists up to the root."""
+        with patch("os.path.isdir", return_value=False):
+            with patch("os.path.isfile", return_value=False):
+                assert hook_utils.find_git_dir(str(tmp_path)) is None
+
+    def test_resolves_worktree_gitdir_file(self, tmp_path: Path) -> None:
+        """Should follow the gitdir pointer of a .git file."""
+        worktree_git = tmp_path / "repo" / ".git" / "worktrees" / "wt"
+        worktree_git.mkdir(parents=True)
+        (worktree_git / "HEAD").write_text("ref: refs/heads/feature/wt\n")
+        (tmp_path / "wt").mkdir()
+        (tmp_path / "wt" / ".git").write_text(f"gitdir: {worktree_git}\n")
+
+        assert hook_utils.find_git_dir(str(tmp_path / "wt")) == str(worktree_git)
+
+    def test_reads_branch_from_head(self, git_repo: Path) -> None:
+        """Should return the branch named by a symbolic ref."""
+        (git_repo / ".git" / "HEAD").write_text("ref: refs/heads/feature/x\n")
+        assert hook_utils.read_head_branch() == "feature/x"
+
+    def test_returns_empty_string_for_detached_head(self, git_repo: Path) -> None:
+        """Should mirror git branch --show-current for a detached HEAD."""
+        (git_repo / ".git" / "HEAD").write_text("a" * 40 + "\n")
+        assert hook_utils.read_head_branch() == ""
+
+    def test_returns_none_for_unparseable_head(self, git_repo: Path) -> None:
+        """Should return None when HEAD has unexpected contents."""
+        (git_repo / ".git" / "HEAD").write_text("garbage\n")
+        assert hook_utils.read_head_branch() is None
+
+    def test_returns_none_for_reftable_placeholder_head(self, git_repo: Path) -> None:
+        """Should defer to git when HEAD is the reftable placeholder."""
+        (git_repo / ".git" / "HEAD").write_text("ref: refs/heads/.invalid\n")
+        assert hook_utils.read_head_branch() is None
+
+    def test_returns_none_when_git_dir_env_set(
+        self, git_repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should defer to git when $GIT_DIR overrides repository discovery."""
+        (git_repo / ".git" / "HEAD").write_text("ref: refs/heads/feature/x\n")
+        monkeypatch.setenv("GIT_DIR", str(git_repo / "elsewhere.git"))
+        assert hook_utils.read_head_branch() is None
+
+    def test_returns_none_when_head_missing(self, git_repo: Path) -> None:
+        """Should return None when the HEAD file cannot be read."""
+        assert hook_utils.read_head_branch() is None
+
+
+# =============================================================================
+# Tests for get_current_branch()
+# =============================================================================
+
+
+class TestGetCurrentBranch:
+    """Test get_current_branch() function."""
+
+    @pytest.fixture(autouse=True)
+    def no_head_file(self, monkeypatch) -> None:
+        """Force the git subprocess fallback for the tests below."""
+        monkeypatch.setattr(hook_utils, "read_head_branch", lambda: None)
+
+    def test_prefers_head_file_over_git(self) -> None:
+        """Should not spawn git when HEAD can be parsed."""
+        with patch("hook_utils.read_head_branch", return_value="main"):
+            with patch("subprocess.run") as mock_run:
+                assert hook_utils.get_current_branch() == "main"
+
+        mock_run.assert_not_called()
+
+    def test_caches_result_for_process(self) -> None:
+        """Should look up the branch only once per process."""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = b"main\n"
+
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            assert hook_utils.get_current_branch() == "main"
+            assert hook_utils.get_current_branch() == "main"
+
+        mock_run.assert_called_once()
+
+    def test_caches_failed_lookup(self) -> None:
+        """Should not retry git after a failed lookup in the same process."""
+        with patch("subprocess.run", side_effect=FileNotFoundError) as mock_run:
+            assert hook_utils.get_current_branch() is None
+            assert hook_utils.get_current_branch() is None
+
+        mock_run.assert_called_once()
+
+    def test_returns_branch_name_on_success(self) -> None:
+        """Should return current branch name when git command succeeds."""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = b"feature-branch\n"
+
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            result = hook_utils.get_current_branch()
+
+            assert result == "feature-branch"
+            mock_run.assert_called_once_with(
+                ["git", "branch", "--show-current"],
+                executable=hook_utils.find_executable("git"),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                close_fds=False,
+                timeout=5,
+            )
+
+    def test_returns_none_on_git_error(self) -> None:
+        """Should return None when git command fails."""
+        mock_result = MagicMock()
+        mock_result.returncode = 1
+
+        with patch("subprocess.run", return_value=mock_result):
+            result = hook_utils.get_current_branch()
+            assert result is None
+
+    def test_returns_none_on_timeout(self) -> None:
+        """Should return None when git command times out."""
+        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("git", 5)):
+            result = hook_utils.get_current_branch()
+            assert result is None
+
+    def test_returns_none_on_file_not_found(self) -> None:
+        """Should return None when git is not installed."""
+        with patch("subprocess.run", side_effect=FileNotFoundError):
+            result = hook_utils.get_current_branch()
+            assert result is None
+
+    def test_returns_none_on_os_error(self) -> None:
+        """Should return None on OS errors."""
+        with patch("subprocess.run", side_effect=OSError):
+            result = hook_utils.get_current_branch()
+            assert result is None
+
+    def test_strips_whitespace_from_branch_name(self) -> None:
+        """Should strip whitespace from branch name."""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = b"  main  \n"
+
+        with patch("subprocess.run", return_value=mock_result):
+            result = hook_utils.get_current_branch()
+            assert result == "main"
+
+
 # =============================================================================
 # Tests for get_large_file_threshold()
 # =============================================================================
@@ -336,6 +702,67 @@ class TestGetLargeFileThreshold:
 
         assert hook_utils.get_large_file_threshold() == 600
 
+    def test_caches_threshold_for_process(self, monkeypatch, tmp_path) -> None:
+        """Should read settings.json only once per process."""
+        claude_dir = tmp_path / ".claude"
+        claude_dir.mkdir()
+        settings_file = claude_dir / "settings.json"
+        settings_file.write_text(json.dumps({"largeFileThreshold": 1000}))
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        assert hook_utils.get_large_file_threshold() == 1000
+        settings_file.write_text(json.dumps({"largeFileThreshold": 2000}))
+        assert hook_utils.get_large_file_threshold() == 1000
+
+
+# =============================================================================
+# Tests for get_claude_settings()
+# =============================================================================
+
+
+class TestGetClaudeSettings:
+    """Test get_claude_settings() cached settings.json loading."""
+
+    def write_settings(self, tmp_path, monkeypatch, content: str):
+        """Write ~/.claude/settings.json under a temporary HOME."""
+        claude_dir = tmp_path / ".claude"
+        claude_dir.mkdir(exist_ok=True)
+        settings_file = claude_dir / "settings.json"
+        settings_file.write_text(content)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        return settings_file
+
+    def test_returns_parsed_settings(self, monkeypatch, tmp_path) -> None:
+        """Should return the settings object."""
+        self.write_settings(tmp_path, monkeypatch, '{"largeFileThreshold": 10}')
+        assert hook_utils.get_claude_settings() == {"largeFileThreshold": 10}
+
+    def test_returns_empty_for_missing_or_invalid_file(
+        self, monkeypatch, tmp_path
+    ) -> None:
+        """Should return {} for missing, malformed or non-object settings."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert hook_utils.get_claude_settings() == {}
+
+        self.write_settings(tmp_path, monkeypatch, "{not json")
+        assert hook_utils.get_claude_settings() == {}
+
+        self.write_settings(tmp_path, monkeypatch, "[1, 2]")
+        assert hook_utils.get_claude_settings() == {}
+
+    def test_parses_unchanged_file_once(self, monkeypatch, tmp_path) -> None:
+        """Should reuse the parsed settings until the file changes."""
+        settings_file = self.write_settings(tmp_path, monkeypatch, '{"a": 1}')
+
+        with patch("json.load", wraps=json.load) as mock_load:
+            hook_utils.get_claude_settings()
+            hook_utils.get_claude_settings()
+            assert mock_load.call_count == 1
+
+            settings_file.write_text('{"a": 22}')
+            assert hook_utils.get_claude_settings() == {"a": 22}
+            assert mock_load.call_count == 2
+
 
 # =============================================================================
 # Tests for FilenameMatcher class
@@ -376,6 +803,14 @@ class TestFilenameMatcher:
         matcher = hook_utils.FilenameMatcher([])
         assert matcher.matches("any.file") is False
 
+    def test_matches_like_fnmatch(self) -> None:
+        """Should agree with fnmatch for wildcard and character-class patterns."""
+        patterns = ["*.py", "test_?.txt", "[A-Z]*.md"]
+        matcher = hook_utils.FilenameMatcher(patterns)
+        for name in ["a.py", "test_1.txt", "test_12.txt", "README.md", "readme.md"]:
+            expected = any(fnmatch.fnmatchcase(name, p) for p in patterns)
+            assert matcher.matches(name) is expected
+
 
 # =============================================================================
 # Tests for Language enum
@@ -437,6 +872,70 @@ class TestLanguageEnum:
         assert hook_utils.Language.CSHARP.display_name == "C#"
         assert hook_utils.Language.CPP.display_name == "C++"
 
+    def test_reuses_source_matcher(self) -> None:
+        """Should build each language's matcher only once."""
+        python = hook_utils.Language.PYTHON
+        assert python.get_source_fn_matcher() is python.get_source_fn_matcher()
+
+    def test_extension_index_covers_non_experimental_languages(self) -> None:
+        """Should map every plain extension glob to its language."""
+        extensions = hook_utils.LANGUAGE_BY_EXTENSION
+        assert extensions[".rs"] is hook_utils.Language.RUST
+        assert extensions[".h"] is hook_utils.Language.C
+        assert extensions[".r"] is hook_utils.Language.R
+        assert ".md" not in extensions
+
+    def test_language_patterns_are_extension_globs(self) -> None:
+        """Should only use plain "*.ext" globs, which the index covers fully."""
+        for language in hook_utils.Language:
+            if language.is_experimental:
+                continue
+            for pattern in language.patterns:
+                assert hook_utils.EXTENSION_GLOB_PATTERN.fullmatch(pattern), pattern
+
+
+# =============================================================================
+# Tests for iter_files()
+# =============================================================================
+
+
+class TestIterFiles:
+    """Test iter_files() scandir-based traversal."""
+
+    def test_yields_nested_files_and_prunes_skipped_dirs(self, tmp_path) -> None:
+        """Should yield files at every depth except below skipped directories."""
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        (tmp_path / "src" / "pkg" / "mod.py").touch()
+        (tmp_path / "top.txt").touch()
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "dep.js").touch()
+
+        paths = {e.path for e in hook_utils.iter_files(str(tmp_path), {"node_modules"})}
+
+        assert paths == {
+            str(tmp_path / "src" / "pkg" / "mod.py"),
+            str(tmp_path / "top.txt"),
+        }
+
+    def test_does_not_descend_into_symlinked_dirs(self, tmp_path) -> None:
+        """Should list symlinked files but not traverse symlinked directories."""
+        real_dir = tmp_path / "real"
+        real_dir.mkdir()
+        (real_dir / "a.py").touch()
+        try:
+            (tmp_path / "linked_dir").symlink_to(real_dir)
+            (tmp_path / "linked.py").symlink_to(real_dir / "a.py")
+        except OSError:
+            pytest.skip("Symlink creation not supported")
+
+        names = sorted(e.name for e in hook_utils.iter_files(str(tmp_path), set()))
+
+        assert names == ["a.py", "linked.py"]
+
+    def test_skips_unreadable_or_missing_directories(self) -> None:
+        """Should yield nothing for a directory that cannot be listed."""
+        assert list(hook_utils.iter_files("/nonexistent/path", set())) == []
+
 
 # =============================================================================
 # Tests for detect_project_languages()
@@ -509,6 +1008,13 @@ class TestDetectProjectLanguages:
         assert hook_utils.Language.MARKDOWN not in languages
         assert hook_utils.Language.PYTHON in languages
 
+    def test_detects_uppercase_extensions(self, tmp_path) -> None:
+        """Should look extensions up case-insensitively."""
+        (tmp_path / "LEGACY.C").touch()
+
+        languages = hook_utils.detect_project_languages(str(tmp_path))
+        assert languages == [hook_utils.Language.C]
+
     def test_handles_symlinks(self, tmp_path) -> None:
         """Should handle symlinks gracefully."""
         real_file = tmp_path / "real.py"
@@ -521,3 +1027,37 @@ class TestDetectProjectLanguages:
 
         languages = hook_utils.detect_project_languages(str(tmp_path))
         assert hook_utils.Language.PYTHON in languages
+
+
+# =============================================================================
+# Tests for module import cost
+# =============================================================================
+
+
+class TestModuleImport:
+    """Test which modules hook_utils pulls in at import time."""
+
+    def test_import_does_not_load_deferred_modules(self) -> None:
+        """Should not import json, pathlib or subprocess at module import."""
+        script = (
+            "import sys; import hook_utils; "
+            "print(sorted(m for m in ('json', 'pathlib', 'subprocess') "
+            "if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-S", "-c", script],
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(hook_utils.__file__),
+            timeout=10,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "[]"
+
+    def test_all_lists_defined_public_names(self) -> None:
+        """Should export only names defined in the module, none private."""
+        for name in hook_utils.__all__:
+            assert hasattr(hook_utils, name), name
+            assert not name.startswith("_")
+        assert len(set(hook_utils.__all__)) == len(hook_utils.__all__)
@@ -147,6 +147,42 @@ class TestGetProjectFiles:
         assert "file1.py" in files
         assert "file2.js" in files
 
+    def test_lists_tracked_names_verbatim(self, tmp_path, monkeypatch) -> None:
+        """Should return tracked paths containing newlines or quotes unmangled."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
+        (tmp_path / "line\nbreak.py").write_text("code")
+        (tmp_path / 'say "hi".md').write_text("text")
+        subprocess.run(["git", "add", "."], cwd=tmp_path, capture_output=True)
+
+        files = lfa.get_project_files()
+
+        assert sorted(files) == ["line\nbreak.py", 'say "hi".md']
+
+    def test_spawns_single_git_process(self, tmp_path, monkeypatch) -> None:
+        """Should list files with one git call and no repository precheck."""
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+        completed = subprocess.CompletedProcess([], 0, stdout=b"a.py\0b.js\0")
+
+        with patch("subprocess.run", return_value=completed) as mock_run:
+            files = lfa.get_project_files()
+
+        assert files == ["a.py", "b.js"]
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0] == ["git", "ls-files", "-z"]
+
+    def test_falls_back_when_git_ls_files_fails(self, tmp_path, monkeypatch) -> None:
+        """Should walk the project when git ls-files exits non-zero."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+        (tmp_path / "file1.py").write_text("code")
+
+        files = lfa.get_project_files()
+
+        assert files == ["file1.py"]
+
     def test_falls_back_to_walk_when_not_git_repo(self, tmp_path, monkeypatch) -> None:
         """Should use os.walk when not in git repository."""
         monkeypatch.chdir(tmp_path)
@@ -275,6 +311,43 @@ class TestRecommendTool:
 # =============================================================================
 
 
+class TestAnalyzeFile:
+    """Test analyze_file() single-file analysis."""
+
+    def test_reads_file_once(self, tmp_path, monkeypatch) -> None:
+        """Should count lines in one pass and estimate tokens from the size."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "large.py").write_text("line\n" * 700)  # 3500 bytes
+
+        with patch.object(lfa, "count_lines", return_value=700) as mock_count:
+            result = lfa.analyze_file("large.py", 500)
+
+        mock_count.assert_called_once_with("large.py")
+        assert result["lines"] == 700
+        assert result["tokens"] == 1000
+
+    def test_skips_files_smaller_than_threshold_bytes(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        """Should not count lines when the byte size rules out the threshold."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "small.py").write_text("\n" * 499)
+
+        with patch.object(lfa, "count_lines") as mock_count:
+            result = lfa.analyze_file("small.py", 500)
+
+        assert result is None
+        mock_count.assert_not_called()
+
+    def test_skips_missing_files_and_directories(self, tmp_path, monkeypatch) -> None:
+        """Should return None for paths that are not regular files."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "pkg.py").mkdir()
+
+        assert lfa.analyze_file("missing.py", 1) is None
+        assert lfa.analyze_file("pkg.py", 1) is None
+
+
 class TestAnalyzeFiles:
     """Test analyze_files() function."""
 
@@ -318,6 +391,31 @@ class TestAnalyzeFiles:
         assert result[1]["path"] == "large.py"
         assert result[2]["path"] == "medium.py"
 
+    def test_does_not_dispatch_binary_files(self, mock_env) -> None:
+        """Should filter binary files out before analyzing in worker threads."""
+        mock_env({"LARGE_FILE_THRESHOLD": "1"})
+
+        with patch.object(lfa, "analyze_file", return_value=None) as mock_analyze:
+            result = lfa.analyze_files(["image.png", "main.py", "archive.zip"])
+
+        assert result == []
+        mock_analyze.assert_called_once_with("main.py", 1)
+
+    def test_collects_results_from_many_files(
+        self, tmp_path, monkeypatch, mock_env
+    ) -> None:
+        """Should gather and sort results from concurrently analyzed files."""
+        monkeypatch.chdir(tmp_path)
+        mock_env({"LARGE_FILE_THRESHOLD": "10"})
+        files = []
+        for i in range(100):
+            (tmp_path / f"f{i}.py").write_text("x\n" * (i + 5))
+            files.append(f"f{i}.py")
+
+        result = lfa.analyze_files(files)
+
+        assert [f["lines"] for f in result] == list(range(104, 9, -1))
+
     def test_estimates_tokens_correctly(self, tmp_path, monkeypatch, mock_env) -> None:
         """Should estimate tokens from file content."""
         monkeypatch.chdir(tmp_path)
@@ -393,46 +491,46 @@ class TestAnalyzeFiles:
 # =============================================================================
 
 
-class TestPrintActionGuidance:
-    """Test print_action_guidance() function."""
+class TestFormatActionGuidance:
+    """Test format_action_guidance() function."""
 
-    def test_shows_serena_guidance_for_code(self, capsys) -> None:
+    def test_shows_serena_guidance_for_code(self) -> None:
         """Should show Serena guidance when code files present."""
         shown = [{"tool": "Serena", "path": "file.py"}]
-        lfa.print_action_guidance(shown)
+        guidance = lfa.format_action_guidance(shown)
 
-        captured = capsys.readouterr()
-        assert "find_symbol for code" in captured.out
+        assert "find_symbol for code" in guidance
 
-    def test_shows_grep_guidance_for_data(self, capsys) -> None:
+    def test_shows_grep_guidance_for_data(self) -> None:
         """Should show Grep guidance when data files present."""
         shown = [{"tool": "Grep", "path": "file.json"}]
-        lfa.print_action_guidance(shown)
+        guidance = lfa.format_action_guidance(shown)
 
-        captured = capsys.readouterr()
-        assert "Grep for patterns" in captured.out
+        assert "Grep for patterns" in guidance
 
-    def test_shows_read_guidance_for_text(self, capsys) -> None:
+    def test_shows_read_guidance_for_text(self) -> None:
         """Should show Read guidance when text files present."""
         shown = [{"tool": "Read offset/limit", "path": "file.txt"}]
-        lfa.print_action_guidance(shown)
+        guidance = lfa.format_action_guidance(shown)
 
-        captured = capsys.readouterr()
-        assert "Read offset/limit for sections" in captured.out
+        assert "Read offset/limit for sections" in guidance
 
-    def test_shows_multiple_guidance_items(self, capsys) -> None:
+    def test_shows_multiple_guidance_items(self) -> None:
         """Should show all relevant guidance when multiple file types present."""
         shown = [
             {"tool": "Serena", "path": "file.py"},
             {"tool": "Grep", "path": "file.json"},
             {"tool": "Read offset/limit", "path": "file.txt"},
         ]
-        lfa.print_action_guidance(shown)
+        guidance = lfa.format_action_guidance(shown)
 
-        captured = capsys.readouterr()
-        assert "find_symbol for code" in captured.out
-        assert "Grep for patterns" in captured.out
-        assert "Read offset/limit for sections" in captured.out
+        assert "find_symbol for code" in guidance
+        assert "Grep for patterns" in guidance
+        assert "Read offset/limit for sections" in guidance
+
+    def test_returns_empty_without_known_tools(self) -> None:
+        """Should return an empty string when no guidance applies."""
+        assert lfa.format_action_guidance([]) == ""
 
 
 class TestPrintAwareness:
@@ -456,6 +554,28 @@ class TestPrintAwareness:
         captured = capsys.readouterr()
         assert "Large Files (symbolic navigation required)" in captured.out
 
+    def test_writes_message_in_one_call(self, mock_env) -> None:
+        """Should write the whole message with a single stdout write."""
+        mock_env({"LARGE_FILE_THRESHOLD": "500"})
+        files = [
+            {
+                "path": "file.py",
+                "lines": 600,
+                "tokens": 2000,
+                "type": "code",
+                "tool": "Serena",
+            }
+        ]
+
+        with patch("sys.stdout") as mock_stdout:
+            lfa.print_awareness(files)
+
+        mock_stdout.write.assert_called_once_with(
+            "\n## Large Files (symbolic navigation required)\n"
+            "file.py (600 lines, ~2000 tokens) → Serena\n"
+            "\nAction: find_symbol for code.\n\n"
+        )
+
     def test_shows_top_10_files(self, capsys, mock_env) -> None:
         """Should show top 10 files when more than 10 large files exist."""
         mock_env({"LARGE_FILE_THRESHOLD": "500"})
@@ -636,7 +756,7 @@ class TestMain:
 
     def test_fails_silently_on_malformed_json(self, monkeypatch) -> None:
         """Should exit with 0 on malformed JSON input."""
-        monkeypatch.setattr("sys.stdin.read", lambda: "{invalid json")
+        monkeypatch.setattr("sys.stdin.buffer.read", lambda: b"{invalid json")
 
         with pytest.raises(SystemExit) as exc_info:
             lfa.main()
@@ -6,6 +6,7 @@ Tests all functions:
 - classify_file()
 - estimate_tokens()
 - count_lines()
+- get_threshold()
 - should_skip_check()
 - check_file_size()
 - main()
@@ -14,6 +15,7 @@ Tests all functions:
 import importlib.util
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 # Import hook_utils for shared utilities
 import hook_utils
@@ -31,6 +33,12 @@ spec.loader.exec_module(large_file_guard)
 main = large_file_guard.main
 
 
+@pytest.fixture(autouse=True)
+def reset_threshold_cache():
+    """Clear the cached large-file-guard threshold before each test."""
+    large_file_guard.get_threshold.cache_clear()
+
+
 # =============================================================================
 # Tests for classify_file() in hook_utils
 # =============================================================================
@@ -99,6 +107,12 @@ class TestClassifyFile:
         result = hook_utils.classify_file("image.PNG")
         assert result == "binary"
 
+    def test_uses_module_level_extension_sets(self, monkeypatch) -> None:
+        """Should look extensions up in the module-level frozensets."""
+        assert isinstance(hook_utils.CODE_EXTENSIONS, frozenset)
+        monkeypatch.setattr(hook_utils, "DATA_EXTENSIONS", frozenset({".txt"}))
+        assert hook_utils.classify_file("readme.txt") == "data"
+
 
 # =============================================================================
 # Tests for estimate_tokens() in hook_utils
@@ -132,6 +146,11 @@ class TestEstimateTokens:
         result = hook_utils.estimate_tokens(text)
         assert result == int(17 / 3.5)
 
+    def test_matches_float_ratio_for_all_lengths(self) -> None:
+        """Should agree with len / 3.5 truncation without using floats."""
+        for length in range(1, 2000):
+            assert hook_utils.estimate_tokens("a" * length) == int(length / 3.5)
+
 
 # =============================================================================
 # Tests for count_lines() in hook_utils
@@ -188,6 +207,65 @@ class TestCountLines:
         assert isinstance(result, int)
         assert result >= 0
 
+    def test_counts_lines_across_chunk_boundaries(self, tmp_path, monkeypatch) -> None:
+        """Should count lines correctly when the file spans several chunks."""
+        monkeypatch.setattr(hook_utils, "COUNT_LINES_CHUNK_SIZE", 4)
+        test_file = tmp_path / "test.txt"
+        test_file.write_bytes(b"line1\nline2\n\nline4")
+
+        result = hook_utils.count_lines(str(test_file))
+        assert result == 4
+
+    def test_stops_once_limit_exceeded(self, tmp_path, monkeypatch) -> None:
+        """Should stop reading and return the lines counted once past the limit."""
+        monkeypatch.setattr(hook_utils, "COUNT_LINES_CHUNK_SIZE", 4)
+        test_file = tmp_path / "test.txt"
+        test_file.write_bytes(b"a\nb\nc\nd\ne\nf\n")
+
+        assert hook_utils.count_lines(str(test_file), limit=2) == 4
+        assert hook_utils.count_lines(str(test_file), limit=10) == 6
+
+    def test_counts_lines_in_file_larger_than_chunk(self, tmp_path) -> None:
+        """Should count every line of a file spanning several default chunks."""
+        test_file = tmp_path / "test.txt"
+        line = b"x" * 99 + b"\n"
+        repeats = 3 * hook_utils.COUNT_LINES_CHUNK_SIZE // len(line) + 1
+        test_file.write_bytes(line * repeats)
+
+        result = hook_utils.count_lines(str(test_file))
+        assert result == repeats
+
+
+# =============================================================================
+# Tests for get_threshold()
+# =============================================================================
+
+
+class TestGetThreshold:
+    """Test get_threshold() configuration lookup."""
+
+    def test_reads_env_threshold(self, monkeypatch) -> None:
+        """Should use LARGE_FILE_THRESHOLD when set."""
+        monkeypatch.setenv("LARGE_FILE_THRESHOLD", "42")
+        assert large_file_guard.get_threshold() == 42
+
+    def test_reads_config_file(self, tmp_path, monkeypatch) -> None:
+        """Should fall back to the guard config file in the home directory."""
+        monkeypatch.delenv("LARGE_FILE_THRESHOLD", raising=False)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        (tmp_path / ".claude").mkdir()
+        (tmp_path / ".claude" / "hook-large-file-guard-config").write_text("250\n")
+
+        assert large_file_guard.get_threshold() == 250
+
+    def test_caches_threshold(self, monkeypatch) -> None:
+        """Should resolve the threshold only once per process."""
+        monkeypatch.setenv("LARGE_FILE_THRESHOLD", "42")
+        assert large_file_guard.get_threshold() == 42
+
+        monkeypatch.setenv("LARGE_FILE_THRESHOLD", "99")
+        assert large_file_guard.get_threshold() == 42
+
 
 # =============================================================================
 # Tests for main() - Small files
@@ -249,7 +327,7 @@ class TestMainLargeFiles:
 
         captured = capsys.readouterr()
         assert "Large file" in captured.err
-        assert "600 lines" in captured.err
+        assert "at least 600 lines" in captured.err
         assert "Serena find_symbol" in captured.err or "Grep patterns" in captured.err
 
     def test_includes_token_estimate_in_error(
@@ -544,10 +622,56 @@ class TestMainTwoStageDetection:
 
         assert exc_info.value.code == 0
 
-    def test_instant_block_for_huge_files(self, mock_stdin, tmp_path, capsys) -> None:
-        """Should instantly block files > 100KB without line counting."""
+    def test_tiny_files_skip_classification(self, mock_stdin, tmp_path) -> None:
+        """Should allow files < 5KB on the stat alone, before any other check."""
+        test_file = tmp_path / "tiny.py"
+        test_file.write_text("x" * 100)
+
+        mock_stdin({"tool_name": "Read", "tool_input": {"file_path": str(test_file)}})
+
+        with (
+            patch.object(large_file_guard, "should_skip_check") as mock_skip,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            main()
+
+        assert exc_info.value.code == 0
+        mock_skip.assert_not_called()
+
+    def test_allows_directories(self, mock_stdin, tmp_path) -> None:
+        """Should exit 0 when file_path names a directory."""
+        mock_stdin({"tool_name": "Read", "tool_input": {"file_path": str(tmp_path)}})
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 0
+
+    def test_instant_block_for_huge_files(
+        self, mock_stdin, tmp_path, monkeypatch
+    ) -> None:
+        """Should instantly block files above the upper bound without counting."""
+        monkeypatch.setattr(large_file_guard, "INSTANT_BLOCK_BYTES", 100 * 1024)
+        test_file = tmp_path / "huge.py"
+        test_file.write_text("x" * 110000)  # > patched 100KB bound
+
+        mock_stdin({"tool_name": "Read", "tool_input": {"file_path": str(test_file)}})
+
+        with (
+            patch("builtins.open", side_effect=AssertionError("content read")),
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            main()
+
+        assert exc_info.value.code == 2
+
+    def test_huge_file_message_marks_line_estimate(
+        self, mock_stdin, tmp_path, monkeypatch, capsys
+    ) -> None:
+        """Should word the byte-size line guess as an estimate, not a bound."""
+        monkeypatch.setattr(large_file_guard, "INSTANT_BLOCK_BYTES", 100 * 1024)
         test_file = tmp_path / "huge.py"
-        test_file.write_text("x" * 110000)  # > 100KB
+        test_file.write_text("x" * 110000)  # one line, > patched 100KB bound
 
         mock_stdin({"tool_name": "Read", "tool_input": {"file_path": str(test_file)}})
 
@@ -555,10 +679,59 @@ class TestMainTwoStageDetection:
             main()
 
         assert exc_info.value.code == 2
+        captured = capsys.readouterr()
+        assert "~1,375 lines est." in captured.err
+        assert "at least" not in captured.err
+
+    def test_counts_lines_for_files_over_100kb(self, tmp_path) -> None:
+        """Should report the exact line count for files above 100KB."""
+        test_file = tmp_path / "big.py"
+        test_file.write_text("x" * 199 + "\n" + "y" * 109800 + "\n")
+
+        exceeds, lines, tokens, _ = large_file_guard.check_file_size(
+            str(test_file), 500
+        )
+
+        assert (exceeds, lines) == (False, 2)
+        assert tokens == 0
+
+    def test_estimates_tokens_from_byte_size(self, tmp_path) -> None:
+        """Should estimate tokens from the file size rather than decoded content."""
+        test_file = tmp_path / "long.py"
+        test_file.write_text("line\n" * 2000)  # 10000 bytes
+
+        exceeds, lines, tokens, _ = large_file_guard.check_file_size(
+            str(test_file), 500
+        )
+
+        assert (exceeds, lines) == (True, 2000)
+        assert tokens == int(10000 / 3.5)
+
+    def test_stops_counting_once_threshold_exceeded(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        """Should stop reading after the threshold and report lines counted."""
+        monkeypatch.setattr(hook_utils, "COUNT_LINES_CHUNK_SIZE", 100)
+        test_file = tmp_path / "front_loaded.py"
+        test_file.write_text("a\n" * 50 + "x" * 9900)  # 10000 bytes
+
+        exceeds, lines, _, _ = large_file_guard.check_file_size(str(test_file), 40)
+
+        # Only the first 100-byte chunk is read, holding all 50 lines
+        assert (exceeds, lines) == (True, 50)
+
+    def test_counts_unterminated_last_line(self, tmp_path) -> None:
+        """Should count a final line without newline against the threshold."""
+        test_file = tmp_path / "unterminated.py"
+        test_file.write_text("line\n" * 499 + "x" * 3000)
+
+        exceeds, lines, _, _ = large_file_guard.check_file_size(str(test_file), 499)
+
+        assert (exceeds, lines) == (True, 500)
 
     def test_accurate_line_count_for_medium_files(self, mock_stdin, tmp_path) -> None:
-        """Should perform accurate line count for 5-100KB files."""
-        # Create a file in the 5-100KB range
+        """Should perform accurate line count for 5KB-10MB files."""
+        # Create a file in the 5KB-10MB range
         test_file = tmp_path / "medium.py"
         test_file.write_text("\n".join([f"line {i}" for i in range(400)]))  # ~5-10KB
 
@@ -581,7 +754,7 @@ class TestMainErrorHandling:
 
     def test_allows_on_malformed_json(self, monkeypatch) -> None:
         """Should exit 0 on malformed JSON input."""
-        monkeypatch.setattr("sys.stdin.read", lambda: "not json")
+        monkeypatch.setattr("sys.stdin.buffer.read", lambda: b"not json")
 
         with pytest.raises(SystemExit) as exc_info:
             main()
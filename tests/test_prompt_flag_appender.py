@@ -5,7 +5,7 @@ Comprehensive tests for prompt-flag-appender hook.
 Tests all functions:
 - load_config()
 - build_alias_map()
-- resolve_trigger()
+- build_trigger_lookup()
 - get_trigger_content()
 - get_always_fragment()
 - get_active_mode_fragments()
@@ -35,7 +35,7 @@ spec.loader.exec_module(prompt_flag_appender)
 
 load_config = prompt_flag_appender.load_config
 build_alias_map = prompt_flag_appender.build_alias_map
-resolve_trigger = prompt_flag_appender.resolve_trigger
+build_trigger_lookup = prompt_flag_appender.build_trigger_lookup
 get_trigger_content = prompt_flag_appender.get_trigger_content
 get_always_fragment = prompt_flag_appender.get_always_fragment
 get_active_mode_fragments = prompt_flag_appender.get_active_mode_fragments
@@ -83,6 +83,12 @@ def sample_alias_map():
     }
 
 
+@pytest.fixture
+def sample_trigger_lookup(sample_config):
+    """Sample trigger lookup (canonical names plus aliases) for testing."""
+    return build_trigger_lookup(sample_config)
+
+
 # =============================================================================
 # Tests for load_config()
 # =============================================================================
@@ -97,16 +103,13 @@ class TestLoadConfig:
         toml_file = tmp_path / "prompt-flag-appender.toml"
         toml_file.write_bytes(toml_content)
 
-        # Mock the script path to point to tmp_path
-        with patch.object(
-            Path, "resolve", return_value=tmp_path / "prompt-flag-appender.py"
-        ):
-            with patch.object(Path, "with_suffix", return_value=toml_file):
-                with patch.object(Path, "is_file", return_value=True):
-                    with patch("builtins.open", return_value=open(toml_file, "rb")):
-                        # Actually read the file
-                        with open(toml_file, "rb") as f:
-                            result = tomllib.load(f)
+        # Point the system config path at tmp_path
+        with patch.object(prompt_flag_appender, "SYSTEM_CONFIG_PATH", toml_file):
+            with patch.object(Path, "is_file", return_value=True):
+                with patch("builtins.open", return_value=open(toml_file, "rb")):
+                    # Actually read the file
+                    with open(toml_file, "rb") as f:
+                        result = tomllib.load(f)
 
         assert "test" in result
         assert result["test"]["content"] == "Test content"
@@ -127,12 +130,9 @@ class TestLoadConfig:
 
         monkeypatch.delenv("CLAUDE_PROJECT_DIR", raising=False)
 
-        with patch.object(
-            Path, "resolve", return_value=tmp_path / "prompt-flag-appender.py"
-        ):
-            with patch.object(Path, "with_suffix", return_value=malformed_toml):
-                with patch.object(Path, "is_file", return_value=True):
-                    result = load_config()
+        with patch.object(prompt_flag_appender, "SYSTEM_CONFIG_PATH", malformed_toml):
+            with patch.object(Path, "is_file", return_value=True):
+                result = load_config()
 
         captured = capsys.readouterr()
         assert "warning" in captured.err.lower() or result == {}
@@ -158,11 +158,8 @@ class TestLoadConfig:
         monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(project_dir))
 
         # Mock system TOML loading
-        with patch.object(
-            Path, "resolve", return_value=system_toml.parent / "prompt-flag-appender.py"
-        ):
-            with patch.object(Path, "with_suffix", return_value=system_toml):
-                result = load_config()
+        with patch.object(prompt_flag_appender, "SYSTEM_CONFIG_PATH", system_toml):
+            result = load_config()
 
         # Project should override system
         assert result["ultrathink"]["content"] == "Project ultrathink"
@@ -187,11 +184,8 @@ class TestLoadConfig:
 
         monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(project_dir))
 
-        with patch.object(
-            Path, "resolve", return_value=tmp_path / "prompt-flag-appender.py"
-        ):
-            with patch.object(Path, "with_suffix", return_value=system_toml):
-                result = load_config()
+        with patch.object(prompt_flag_appender, "SYSTEM_CONFIG_PATH", system_toml):
+            result = load_config()
 
         # System config should still be loaded
         assert result["ultrathink"]["content"] == "System content"
@@ -254,36 +248,43 @@ class TestBuildAliasMap:
 
 
 # =============================================================================
-# Tests for resolve_trigger()
+# Tests for build_trigger_lookup()
 # =============================================================================
 
 
-class TestResolveTrigger:
-    """Test resolve_trigger() function."""
+class TestBuildTriggerLookup:
+    """Test build_trigger_lookup() function."""
 
-    def test_resolves_direct_match(self, sample_config, sample_alias_map) -> None:
-        """Should resolve direct trigger name."""
-        result = resolve_trigger("ultrathink", sample_config, sample_alias_map)
-        assert result == "ultrathink"
+    def test_maps_canonical_names_to_themselves(self, sample_config) -> None:
+        """Should resolve direct trigger names in one lookup."""
+        result = build_trigger_lookup(sample_config)
+        assert result["ultrathink"] == "ultrathink"
 
-    def test_resolves_alias(self, sample_config, sample_alias_map) -> None:
-        """Should resolve alias to canonical name."""
-        result = resolve_trigger("seqthi", sample_config, sample_alias_map)
-        assert result == "sequential-thinking"
+    def test_maps_aliases_to_canonical(self, sample_config) -> None:
+        """Should resolve aliases to canonical names in one lookup."""
+        result = build_trigger_lookup(sample_config)
+        assert result["seqthi"] == "sequential-thinking"
 
-    def test_returns_none_for_unknown(self, sample_config, sample_alias_map) -> None:
-        """Should return None for unknown trigger."""
-        result = resolve_trigger("unknown", sample_config, sample_alias_map)
-        assert result is None
+    def test_unknown_trigger_is_absent(self, sample_config) -> None:
+        """Should not contain unknown triggers."""
+        assert "unknown" not in build_trigger_lookup(sample_config)
 
     def test_direct_match_takes_precedence(self) -> None:
-        """Should prefer direct match over alias."""
-        config = {"direct": {"aliases": [], "content": "Direct"}}
-        alias_map = {"direct": "other"}  # Alias collision
-        result = resolve_trigger("direct", config, alias_map)
-        assert result == "direct"
+        """Should prefer direct match over a colliding alias."""
+        config = {
+            "direct": {"aliases": [], "content": "Direct"},
+            "other": {"aliases": ["direct"], "content": "Other"},
+        }
+        result = build_trigger_lookup(config)
+        assert result["direct"] == "direct"
+
+    def test_skips_reserved_sections(self) -> None:
+        """Should not make reserved sections triggerable."""
+        config = {"_always": {"content": "Always content"}}
+        assert build_trigger_lookup(config) == {}
 
 
+# =============================================================================
 # =============================================================================
 # Tests for get_trigger_content()
 # =============================================================================
@@ -297,11 +298,11 @@ class TestGetTriggerContent:
         result = get_trigger_content("ultrathink", sample_config)
         assert result == "ULTRATHINK MODE ACTIVATED"
 
-    def test_strips_whitespace(self) -> None:
-        """Should strip whitespace from content."""
-        config = {"test": {"content": "  Content with whitespace  \n"}}
+    def test_returns_loaded_content_verbatim(self) -> None:
+        """Should return content as stored, leaving stripping to load_config()."""
+        config = {"test": {"content": "Content\n\nwith paragraphs"}}
         result = get_trigger_content("test", config)
-        assert result == "Content with whitespace"
+        assert result == "Content\n\nwith paragraphs"
 
     def test_returns_none_for_missing_trigger(self, sample_config) -> None:
         """Should return None for missing trigger."""
@@ -346,11 +347,16 @@ class TestGetAlwaysFragment:
         result = get_always_fragment(config)
         assert result is None
 
-    def test_strips_whitespace_from_content(self) -> None:
-        """Should strip leading/trailing whitespace from content."""
-        config = {"_always": {"content": "\n  Always on content  \n"}}
-        result = get_always_fragment(config)
-        assert result == "Always on content"
+    def test_returns_content_stripped_at_load(self, tmp_path, monkeypatch) -> None:
+        """Should return [_always] content stripped once by load_config()."""
+        system_toml = tmp_path / "prompt-flag-appender.toml"
+        system_toml.write_bytes(b'[_always]\ncontent = """\n  Always on content  \n"""')
+        monkeypatch.delenv("CLAUDE_PROJECT_DIR", raising=False)
+
+        with patch.object(prompt_flag_appender, "SYSTEM_CONFIG_PATH", system_toml):
+            config = load_config()
+
+        assert get_always_fragment(config) == "Always on content"
 
 
 # =============================================================================
@@ -362,63 +368,86 @@ class TestGetActiveModeFragments:
     """Test get_active_mode_fragments() function."""
 
     def test_returns_empty_list_when_no_project_dir(
-        self, monkeypatch, sample_config, sample_alias_map
+        self, monkeypatch, sample_config, sample_trigger_lookup
     ) -> None:
         """Should return empty list when CLAUDE_PROJECT_DIR not set."""
         monkeypatch.delenv("CLAUDE_PROJECT_DIR", raising=False)
-        result = get_active_mode_fragments(sample_config, sample_alias_map)
+        result = get_active_mode_fragments(sample_config, sample_trigger_lookup)
         assert result == []
 
     def test_returns_empty_list_when_claude_dir_not_exists(
-        self, temp_project_dir, monkeypatch, sample_config, sample_alias_map
+        self, temp_project_dir, monkeypatch, sample_config, sample_trigger_lookup
     ) -> None:
         """Should return empty list when .claude directory doesn't exist."""
         (temp_project_dir / ".claude").rmdir()
         monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(temp_project_dir))
-        result = get_active_mode_fragments(sample_config, sample_alias_map)
+        result = get_active_mode_fragments(sample_config, sample_trigger_lookup)
+        assert result == []
+
+    def test_returns_empty_list_when_claude_path_is_file(
+        self, tmp_path, monkeypatch, sample_config, sample_trigger_lookup
+    ) -> None:
+        """Should return empty list when .claude is a regular file."""
+        (tmp_path / ".claude").write_text("not a directory")
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+        result = get_active_mode_fragments(sample_config, sample_trigger_lookup)
+        assert result == []
+
+    def test_ignores_names_not_matching_flag_pattern(
+        self, temp_project_dir, monkeypatch, sample_config, sample_trigger_lookup
+    ) -> None:
+        """Should only consider names of the form hook-<mode>-mode-on."""
+        claude_dir = temp_project_dir / ".claude"
+        (claude_dir / "hook-mode-on").touch()
+        (claude_dir / "hook-approval-mode-on.bak").touch()
+        (claude_dir / "xhook-approval-mode-on").touch()
+
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(temp_project_dir))
+        result = get_active_mode_fragments(sample_config, sample_trigger_lookup)
+
         assert result == []
 
     def test_loads_fragment_for_mode_flag_file(
-        self, temp_project_dir, monkeypatch, sample_config, sample_alias_map
+        self, temp_project_dir, monkeypatch, sample_config, sample_trigger_lookup
     ) -> None:
         """Should load fragment when hook-*-mode-on file exists."""
         flag_file = temp_project_dir / ".claude" / "hook-approval-mode-on"
         flag_file.touch()
 
         monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(temp_project_dir))
-        result = get_active_mode_fragments(sample_config, sample_alias_map)
+        result = get_active_mode_fragments(sample_config, sample_trigger_lookup)
 
         assert len(result) == 1
         assert result[0] == "Human-in-the-Loop Mode"
 
     def test_skips_mode_without_config_entry(
-        self, temp_project_dir, monkeypatch, sample_config, sample_alias_map
+        self, temp_project_dir, monkeypatch, sample_config, sample_trigger_lookup
     ) -> None:
         """Should skip modes that don't have config entries."""
         flag_file = temp_project_dir / ".claude" / "hook-unknown-mode-on"
         flag_file.touch()
 
         monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(temp_project_dir))
-        result = get_active_mode_fragments(sample_config, sample_alias_map)
+        result = get_active_mode_fragments(sample_config, sample_trigger_lookup)
 
         assert result == []
 
     def test_loads_multiple_mode_fragments(
-        self, temp_project_dir, monkeypatch, sample_config, sample_alias_map
+        self, temp_project_dir, monkeypatch, sample_config, sample_trigger_lookup
     ) -> None:
         """Should load fragments for multiple active modes."""
         (temp_project_dir / ".claude" / "hook-approval-mode-on").touch()
         (temp_project_dir / ".claude" / "hook-ultrathink-mode-on").touch()
 
         monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(temp_project_dir))
-        result = get_active_mode_fragments(sample_config, sample_alias_map)
+        result = get_active_mode_fragments(sample_config, sample_trigger_lookup)
 
         assert len(result) == 2
         assert "Human-in-the-Loop Mode" in result
         assert "ULTRATHINK MODE ACTIVATED" in result
 
     def test_resolves_alias_mode_files(
-        self, temp_project_dir, monkeypatch, sample_config, sample_alias_map
+        self, temp_project_dir, monkeypatch, sample_config, sample_trigger_lookup
     ) -> None:
         """Should resolve mode names via aliases."""
         # Using alias "seqthi" for sequential-thinking
@@ -426,7 +455,7 @@ class TestGetActiveModeFragments:
         flag_file.touch()
 
         monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(temp_project_dir))
-        result = get_active_mode_fragments(sample_config, sample_alias_map)
+        result = get_active_mode_fragments(sample_config, sample_trigger_lookup)
 
         assert len(result) == 1
         assert result[0] == "Use sequential thinking"
@@ -440,109 +469,120 @@ class TestGetActiveModeFragments:
 class TestSplitPromptAndTriggers:
     """Test split_prompt_and_triggers() function."""
 
-    def test_extracts_single_trigger(self, sample_config, sample_alias_map) -> None:
+    def test_extracts_single_trigger(self, sample_trigger_lookup) -> None:
         """Should extract single trailing trigger."""
         prompt = "Fix this code +ultrathink"
-        base, triggers = split_prompt_and_triggers(
-            prompt, sample_config, sample_alias_map
-        )
+        base, triggers = split_prompt_and_triggers(prompt, sample_trigger_lookup)
         assert base == "Fix this code"
         assert triggers == ["ultrathink"]
 
-    def test_extracts_multiple_triggers(self, sample_config, sample_alias_map) -> None:
+    def test_extracts_multiple_triggers(self, sample_trigger_lookup) -> None:
         """Should extract multiple trailing triggers."""
         prompt = "Fix this code +ultrathink +absolute"
-        base, triggers = split_prompt_and_triggers(
-            prompt, sample_config, sample_alias_map
-        )
+        base, triggers = split_prompt_and_triggers(prompt, sample_trigger_lookup)
         assert base == "Fix this code"
         assert triggers == ["ultrathink", "absolute"]
 
-    def test_ignores_unmapped_triggers(self, sample_config, sample_alias_map) -> None:
+    def test_ignores_unmapped_triggers(self, sample_trigger_lookup) -> None:
         """Should ignore triggers not in config."""
         prompt = "Fix this code +ultrathink +unknown"
-        base, triggers = split_prompt_and_triggers(
-            prompt, sample_config, sample_alias_map
-        )
+        base, triggers = split_prompt_and_triggers(prompt, sample_trigger_lookup)
         assert base == "Fix this code"
         assert triggers == ["ultrathink"]
 
-    def test_removes_all_trigger_like_tokens(
-        self, sample_config, sample_alias_map
-    ) -> None:
+    def test_removes_all_trigger_like_tokens(self, sample_trigger_lookup) -> None:
         """Should remove all trailing tokens starting with + from output."""
         prompt = "Fix this code +ultrathink +unknown +another"
-        base, triggers = split_prompt_and_triggers(
-            prompt, sample_config, sample_alias_map
-        )
+        base, triggers = split_prompt_and_triggers(prompt, sample_trigger_lookup)
         assert base == "Fix this code"
         assert "+unknown" not in base
         assert "+another" not in base
 
-    def test_stops_at_non_trigger_token(self, sample_config, sample_alias_map) -> None:
+    def test_stops_at_non_trigger_token(self, sample_trigger_lookup) -> None:
         """Should stop extracting when non-trigger token encountered."""
         prompt = "Fix this code quickly +ultrathink"
-        base, triggers = split_prompt_and_triggers(
-            prompt, sample_config, sample_alias_map
-        )
+        base, triggers = split_prompt_and_triggers(prompt, sample_trigger_lookup)
         assert base == "Fix this code quickly"
         assert triggers == ["ultrathink"]
 
-    def test_deduplicates_triggers(self, sample_config, sample_alias_map) -> None:
+    def test_deduplicates_triggers(self, sample_trigger_lookup) -> None:
         """Should deduplicate repeated triggers while preserving order."""
         prompt = "Fix this code +ultrathink +absolute +ultrathink"
-        base, triggers = split_prompt_and_triggers(
-            prompt, sample_config, sample_alias_map
-        )
+        base, triggers = split_prompt_and_triggers(prompt, sample_trigger_lookup)
         assert base == "Fix this code"
         assert triggers == ["ultrathink", "absolute"]
 
-    def test_handles_prompt_without_triggers(
-        self, sample_config, sample_alias_map
-    ) -> None:
+    def test_handles_prompt_without_triggers(self, sample_trigger_lookup) -> None:
         """Should return empty triggers list for prompt without triggers."""
         prompt = "Fix this code"
-        base, triggers = split_prompt_and_triggers(
-            prompt, sample_config, sample_alias_map
-        )
+        base, triggers = split_prompt_and_triggers(prompt, sample_trigger_lookup)
         assert base == "Fix this code"
         assert triggers == []
 
-    def test_handles_empty_prompt(self, sample_config, sample_alias_map) -> None:
+    def test_skips_tokenizing_without_prefix(self, sample_trigger_lookup) -> None:
+        """Should return the stripped prompt when no + appears."""
+        prompt = "Fix  this code \n"
+        base, triggers = split_prompt_and_triggers(prompt, sample_trigger_lookup)
+        assert base == "Fix  this code"
+        assert triggers == []
+
+    def test_handles_empty_prompt(self, sample_trigger_lookup) -> None:
         """Should handle empty prompt gracefully."""
         prompt = ""
-        base, triggers = split_prompt_and_triggers(
-            prompt, sample_config, sample_alias_map
-        )
+        base, triggers = split_prompt_and_triggers(prompt, sample_trigger_lookup)
         assert base == ""
         assert triggers == []
 
-    def test_strips_whitespace(self, sample_config, sample_alias_map) -> None:
+    def test_strips_whitespace(self, sample_trigger_lookup) -> None:
         """Should strip trailing whitespace from base prompt."""
         prompt = "Fix this code  +ultrathink"
-        base, triggers = split_prompt_and_triggers(
-            prompt, sample_config, sample_alias_map
-        )
+        base, triggers = split_prompt_and_triggers(prompt, sample_trigger_lookup)
         assert base == "Fix this code"
         assert not base.endswith(" ")
 
-    def test_resolves_alias_triggers(self, sample_config, sample_alias_map) -> None:
+    def test_resolves_alias_triggers(self, sample_trigger_lookup) -> None:
         """Should resolve alias triggers to canonical names."""
         prompt = "Fix this code +seqthi"
-        base, triggers = split_prompt_and_triggers(
-            prompt, sample_config, sample_alias_map
-        )
+        base, triggers = split_prompt_and_triggers(prompt, sample_trigger_lookup)
         assert base == "Fix this code"
         assert triggers == ["sequential-thinking"]
 
-    def test_deduplicates_alias_and_canonical(
-        self, sample_config, sample_alias_map
+    def test_preserves_inner_whitespace_of_base_prompt(
+        self, sample_trigger_lookup
     ) -> None:
-        """Should deduplicate when both alias and canonical are used."""
-        prompt = "Fix this code +seqthi +sequential-thinking"
+        """Should keep the base prompt's own spacing and newlines untouched."""
+        prompt = "Fix  this\n\tcode \n +ultrathink\t+seqthi  "
+        base, triggers = split_prompt_and_triggers(prompt, sample_trigger_lookup)
+        assert base == "Fix  this\n\tcode"
+        assert triggers == ["ultrathink", "sequential-thinking"]
+
+    def test_extracts_triggers_beyond_one_batch(self, sample_trigger_lookup) -> None:
+        """Should keep scanning when trailing triggers exceed one rsplit batch."""
+        count = prompt_flag_appender.TRIGGER_SCAN_BATCH * 2 + 3
+        prompt = "Fix this code +seqthi" + " +nope" * count + " +ultrathink"
+        base, triggers = split_prompt_and_triggers(prompt, sample_trigger_lookup)
+        assert base == "Fix this code"
+        assert triggers == ["sequential-thinking", "ultrathink"]
+
+    def test_stops_at_lone_prefix_token(self, sample_trigger_lookup) -> None:
+        """Should treat a bare + as ordinary prompt text."""
+        prompt = "a + +ultrathink"
+        base, triggers = split_prompt_and_triggers(prompt, sample_trigger_lookup)
+        assert base == "a +"
+        assert triggers == ["ultrathink"]
+
+    def test_handles_prompt_of_only_triggers(self, sample_trigger_lookup) -> None:
+        """Should return an empty base prompt when every token is a trigger."""
         base, triggers = split_prompt_and_triggers(
-            prompt, sample_config, sample_alias_map
+            "  +ultrathink +seqthi", sample_trigger_lookup
         )
+        assert base == ""
+        assert triggers == ["ultrathink", "sequential-thinking"]
+
+    def test_deduplicates_alias_and_canonical(self, sample_trigger_lookup) -> None:
+        """Should deduplicate when both alias and canonical are used."""
+        prompt = "Fix this code +seqthi +sequential-thinking"
+        base, triggers = split_prompt_and_triggers(prompt, sample_trigger_lookup)
         assert base == "Fix this code"
         assert triggers == ["sequential-thinking"]
 
@@ -635,7 +675,7 @@ class TestMain:
                     return_value=sample_alias_map,
                 ):
                     with patch("sys.stdin", MagicMock()):
-                        with patch("json.load", return_value=input_data):
+                        with patch("json.loads", return_value=input_data):
                             with patch(
                                 "prompt_flag_appender.get_active_mode_fragments",
                                 return_value=[],
@@ -659,7 +699,7 @@ class TestMain:
                     return_value=sample_alias_map,
                 ):
                     with patch("sys.stdin", MagicMock()):
-                        with patch("json.load", return_value=input_data):
+                        with patch("json.loads", return_value=input_data):
                             with patch(
                                 "prompt_flag_appender.get_active_mode_fragments",
                                 return_value=[],
@@ -683,7 +723,7 @@ class TestMain:
                     return_value=sample_alias_map,
                 ):
                     with patch("sys.stdin", MagicMock()):
-                        with patch("json.load", return_value=input_data):
+                        with patch("json.loads", return_value=input_data):
                             with patch(
                                 "prompt_flag_appender.get_active_mode_fragments",
                                 return_value=[mode_fragment],
@@ -707,7 +747,7 @@ class TestMain:
                     return_value=sample_alias_map,
                 ):
                     with patch("sys.stdin", MagicMock()):
-                        with patch("json.load", return_value=input_data):
+                        with patch("json.loads", return_value=input_data):
                             with patch(
                                 "prompt_flag_appender.get_active_mode_fragments",
                                 return_value=[],
@@ -732,7 +772,7 @@ class TestMain:
             ):
                 with patch("prompt_flag_appender.build_alias_map", return_value={}):
                     with patch("sys.stdin", MagicMock()):
-                        with patch("json.load", return_value=input_data):
+                        with patch("json.loads", return_value=input_data):
                             with patch(
                                 "prompt_flag_appender.get_active_mode_fragments",
                                 return_value=[],
@@ -762,7 +802,7 @@ class TestMain:
             ):
                 with patch("prompt_flag_appender.build_alias_map", return_value={}):
                     with patch("sys.stdin", MagicMock()):
-                        with patch("json.load", return_value=input_data):
+                        with patch("json.loads", return_value=input_data):
                             with patch(
                                 "prompt_flag_appender.get_active_mode_fragments",
                                 return_value=[mode_fragment],
@@ -777,6 +817,20 @@ class TestMain:
         assert mode_pos != -1
         assert always_pos < mode_pos
 
+    def test_skips_config_load_on_invalid_input(self) -> None:
+        """Should reject bad stdin before loading any configuration."""
+        with patch("prompt_flag_appender.exit_if_disabled"):
+            with patch("prompt_flag_appender.load_config") as mock_load:
+                with patch("sys.stdin", MagicMock()):
+                    with patch(
+                        "json.loads",
+                        side_effect=json.JSONDecodeError("msg", "doc", 0),
+                    ):
+                        with pytest.raises(SystemExit):
+                            main()
+
+        mock_load.assert_not_called()
+
     def test_handles_json_decode_error(self, capsys) -> None:
         """Should exit 1 and print error on JSON decode error."""
         with patch("prompt_flag_appender.exit_if_disabled"):
@@ -784,7 +838,7 @@ class TestMain:
                 with patch("prompt_flag_appender.build_alias_map", return_value={}):
                     with patch("sys.stdin", MagicMock()):
                         with patch(
-                            "json.load",
+                            "json.loads",
                             side_effect=json.JSONDecodeError("msg", "doc", 0),
                         ):
                             with pytest.raises(SystemExit) as exc_info:
@@ -802,7 +856,7 @@ class TestMain:
             with patch("prompt_flag_appender.load_config", return_value={}):
                 with patch("prompt_flag_appender.build_alias_map", return_value={}):
                     with patch("sys.stdin", MagicMock()):
-                        with patch("json.load", return_value=input_data):
+                        with patch("json.loads", return_value=input_data):
                             with pytest.raises(SystemExit) as exc_info:
                                 main()
 
@@ -817,7 +871,7 @@ class TestMain:
                 with patch("prompt_flag_appender.build_alias_map", return_value={}):
                     with patch("sys.stdin", MagicMock()):
                         with patch(
-                            "json.load", side_effect=Exception("Unexpected error")
+                            "json.loads", side_effect=Exception("Unexpected error")
                         ):
                             with pytest.raises(SystemExit) as exc_info:
                                 main()
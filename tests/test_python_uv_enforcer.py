@@ -25,6 +25,37 @@ spec.loader.exec_module(python_uv_enforcer)
 main = python_uv_enforcer.main
 
 
+def stdin_with(payload: bytes) -> MagicMock:
+    """Build a stdin mock whose buffer yields the given raw bytes."""
+    stdin = MagicMock()
+    stdin.buffer.read.return_value = payload
+    return stdin
+
+
+# =============================================================================
+# Tests for module-level patterns
+# =============================================================================
+
+
+class TestPatterns:
+    """Test the precompiled command patterns."""
+
+    def test_tool_pattern_matches_each_tool_as_whole_word(self) -> None:
+        """Should match every listed tool only as a complete leading word."""
+        pattern = python_uv_enforcer.PYTHON_TOOL_PATTERN
+        for tool in python_uv_enforcer.PYTHON_TOOLS:
+            assert pattern.match(f"{tool} --version")
+        assert pattern.match("pipx install ruff") is None
+        assert pattern.match("echo pip") is None
+
+    def test_allowed_pattern_matches_venv_and_uv(self) -> None:
+        """Should allow venv creation and uv commands."""
+        pattern = python_uv_enforcer.ALLOWED_COMMAND_PATTERN
+        assert pattern.match("python3 -m venv .venv")
+        assert pattern.match("uv run pytest")
+        assert pattern.match("python -m pytest") is None
+
+
 # =============================================================================
 # Tests for main()
 # =============================================================================
@@ -41,8 +72,8 @@ class TestMain:
         }
 
         with patch("python_uv_enforcer.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("sys.stdin", stdin_with(json.dumps(input_data).encode())):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -59,8 +90,8 @@ class TestMain:
         }
 
         with patch("python_uv_enforcer.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("sys.stdin", stdin_with(json.dumps(input_data).encode())):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -76,8 +107,8 @@ class TestMain:
         }
 
         with patch("python_uv_enforcer.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("sys.stdin", stdin_with(json.dumps(input_data).encode())):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -93,8 +124,8 @@ class TestMain:
         }
 
         with patch("python_uv_enforcer.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("sys.stdin", stdin_with(json.dumps(input_data).encode())):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -107,8 +138,8 @@ class TestMain:
         input_data = {"tool_name": "Bash", "tool_input": {"command": "pytest tests/"}}
 
         with patch("python_uv_enforcer.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("sys.stdin", stdin_with(json.dumps(input_data).encode())):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -121,8 +152,8 @@ class TestMain:
         input_data = {"tool_name": "Bash", "tool_input": {"command": "black ."}}
 
         with patch("python_uv_enforcer.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("sys.stdin", stdin_with(json.dumps(input_data).encode())):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -135,8 +166,8 @@ class TestMain:
         input_data = {"tool_name": "Bash", "tool_input": {"command": "mypy src/"}}
 
         with patch("python_uv_enforcer.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("sys.stdin", stdin_with(json.dumps(input_data).encode())):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -144,6 +175,20 @@ class TestMain:
         captured = capsys.readouterr()
         assert "uv run mypy" in captured.err
 
+    def test_suggests_uv_run_for_other_tools(self, capsys) -> None:
+        """Should fall back to "uv run <command>" for tools without a mapping."""
+        input_data = {"tool_name": "Bash", "tool_input": {"command": "isort ."}}
+
+        with patch("python_uv_enforcer.exit_if_disabled"):
+            with patch("sys.stdin", stdin_with(json.dumps(input_data).encode())):
+                with patch("json.loads", return_value=input_data):
+                    with pytest.raises(SystemExit) as exc_info:
+                        main()
+
+        assert exc_info.value.code == 2
+        captured = capsys.readouterr()
+        assert "uv run isort ." in captured.err
+
     def test_allows_uv_commands(self) -> None:
         """Should allow uv commands to pass through."""
         input_data = {
@@ -152,8 +197,8 @@ class TestMain:
         }
 
         with patch("python_uv_enforcer.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("sys.stdin", stdin_with(json.dumps(input_data).encode())):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -167,8 +212,8 @@ class TestMain:
         }
 
         with patch("python_uv_enforcer.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("sys.stdin", stdin_with(json.dumps(input_data).encode())):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -182,8 +227,8 @@ class TestMain:
         }
 
         with patch("python_uv_enforcer.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("sys.stdin", stdin_with(json.dumps(input_data).encode())):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -194,8 +239,8 @@ class TestMain:
         input_data = {"tool_name": "Bash", "tool_input": {"command": "git status"}}
 
         with patch("python_uv_enforcer.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("sys.stdin", stdin_with(json.dumps(input_data).encode())):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -209,18 +254,33 @@ class TestMain:
         }
 
         with patch("python_uv_enforcer.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+            with patch("sys.stdin", stdin_with(json.dumps(input_data).encode())):
+                with patch("json.loads", return_value=input_data):
+                    with pytest.raises(SystemExit) as exc_info:
+                        main()
+
+        assert exc_info.value.code == 0
+
+    def test_skips_json_parse_for_unrelated_command(self) -> None:
+        """Should exit 0 without parsing input that names no Python tool."""
+        payload = json.dumps(
+            {"tool_name": "Bash", "tool_input": {"command": "git status"}}
+        ).encode()
+
+        with patch("python_uv_enforcer.exit_if_disabled"):
+            with patch("sys.stdin", stdin_with(payload)):
+                with patch("json.loads") as mock_loads:
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
         assert exc_info.value.code == 0
+        mock_loads.assert_not_called()
 
     def test_exits_successfully_on_exception(self) -> None:
         """Should exit 0 on unexpected exceptions (silent failure)."""
         with patch("python_uv_enforcer.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
-                with patch("json.load", side_effect=Exception("Unexpected error")):
+            with patch("sys.stdin", stdin_with(b'{"command": "pip"}')):
+                with patch("json.loads", side_effect=Exception("Unexpected error")):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -229,9 +289,9 @@ class TestMain:
     def test_handles_malformed_json(self) -> None:
         """Should exit 0 when stdin contains malformed JSON."""
         with patch("python_uv_enforcer.exit_if_disabled"):
-            with patch("sys.stdin", MagicMock()):
+            with patch("sys.stdin", stdin_with(b'{"command": "pip"}')):
                 with patch(
-                    "json.load", side_effect=json.JSONDecodeError("msg", "doc", 0)
+                    "json.loads", side_effect=json.JSONDecodeError("msg", "doc", 0)
                 ):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
@@ -80,6 +80,18 @@ class TestExtractTagVersion:
         version = extract_tag_version("git tag vInvalid")
         assert version is None
 
+    def test_extracts_version_with_extra_whitespace(self) -> None:
+        """Should still match when words are separated by tabs or runs of spaces."""
+        version = extract_tag_version("git\ttag   v1.2.3")
+        assert version == "1.2.3"
+
+    def test_skips_regex_without_tag_literal(self) -> None:
+        """Should not run the regex for commands that never mention 'tag'."""
+        with patch.object(release_check, "TAG_VERSION_PATTERN") as mock_pattern:
+            assert extract_tag_version("ls -la") is None
+
+        mock_pattern.search.assert_not_called()
+
 
 # =============================================================================
 # Tests for extract_release_version()
@@ -128,6 +140,13 @@ class TestExtractReleaseVersion:
         version = extract_release_version("gh release list")
         assert version is None
 
+    def test_skips_regex_without_release_literal(self) -> None:
+        """Should not run the regex for commands that never mention 'release'."""
+        with patch.object(release_check, "RELEASE_VERSION_PATTERN") as mock_pattern:
+            assert extract_release_version("gh pr create") is None
+
+        mock_pattern.search.assert_not_called()
+
 
 # =============================================================================
 # Tests for check_version_in_changelog()
@@ -209,6 +228,15 @@ class TestCheckVersionInChangelog:
                 result = check_version_in_changelog("0.1.4")
                 assert result is True
 
+    def test_searches_changelog_with_invalid_bytes(self, tmp_path) -> None:
+        """Should search line by line, tolerating non-UTF-8 bytes."""
+        changelog = tmp_path / "CHANGELOG.md"
+        changelog.write_bytes(b"## [2.0.0]\n" + b"- \xff invalid utf-8\n" * 1000)
+
+        with patch.dict(os.environ, {"CLAUDE_PROJECT_DIR": str(tmp_path)}):
+            assert check_version_in_changelog("2.0.0") is True
+            assert check_version_in_changelog("1.9.9") is False
+
     def test_simple_string_search(self) -> None:
         """Should use simple string search to find version."""
         changelog_content = """# Changelog
@@ -250,7 +278,9 @@ class TestMain:
         mock_path.open = mock_file
 
         with patch("release_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "sys.stdin.buffer.read", return_value=json.dumps(input_data).encode()
+            ):
                 with patch.dict(os.environ, {"CLAUDE_PROJECT_DIR": "/fake"}):
                     with patch("pathlib.Path.__truediv__", return_value=mock_path):
                         with pytest.raises(SystemExit) as exc_info:
@@ -276,7 +306,9 @@ class TestMain:
         mock_path.open = mock_file
 
         with patch("release_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "sys.stdin.buffer.read", return_value=json.dumps(input_data).encode()
+            ):
                 with patch.dict(os.environ, {"CLAUDE_PROJECT_DIR": "/fake"}):
                     with patch("pathlib.Path.__truediv__", return_value=mock_path):
                         with pytest.raises(SystemExit) as exc_info:
@@ -306,7 +338,9 @@ class TestMain:
         mock_path.open = mock_file
 
         with patch("release_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "sys.stdin.buffer.read", return_value=json.dumps(input_data).encode()
+            ):
                 with patch.dict(os.environ, {"CLAUDE_PROJECT_DIR": "/fake"}):
                     with patch("pathlib.Path.__truediv__", return_value=mock_path):
                         with pytest.raises(SystemExit) as exc_info:
@@ -333,7 +367,9 @@ class TestMain:
         mock_path.open = mock_file
 
         with patch("release_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "sys.stdin.buffer.read", return_value=json.dumps(input_data).encode()
+            ):
                 with patch.dict(os.environ, {"CLAUDE_PROJECT_DIR": "/fake"}):
                     with patch("pathlib.Path.__truediv__", return_value=mock_path):
                         with pytest.raises(SystemExit) as exc_info:
@@ -351,7 +387,9 @@ class TestMain:
         mock_path.exists.return_value = False
 
         with patch("release_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "sys.stdin.buffer.read", return_value=json.dumps(input_data).encode()
+            ):
                 with patch.dict(os.environ, {"CLAUDE_PROJECT_DIR": "/fake"}):
                     with patch("pathlib.Path.__truediv__", return_value=mock_path):
                         with pytest.raises(SystemExit) as exc_info:
@@ -367,7 +405,10 @@ class TestMain:
 
         with patch("release_check.exit_if_disabled"):
             with patch("os.environ.get", return_value="1"):
-                with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+                with patch(
+                    "sys.stdin.buffer.read",
+                    return_value=json.dumps(input_data).encode(),
+                ):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -381,7 +422,9 @@ class TestMain:
         }
 
         with patch("release_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "sys.stdin.buffer.read", return_value=json.dumps(input_data).encode()
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -395,7 +438,9 @@ class TestMain:
         }
 
         with patch("release_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "sys.stdin.buffer.read", return_value=json.dumps(input_data).encode()
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -409,7 +454,9 @@ class TestMain:
         }
 
         with patch("release_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "sys.stdin.buffer.read", return_value=json.dumps(input_data).encode()
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -420,7 +467,9 @@ class TestMain:
         input_data = {"tool_name": "Bash", "tool_input": {"command": "git tag 1.2.3"}}
 
         with patch("release_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "sys.stdin.buffer.read", return_value=json.dumps(input_data).encode()
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -429,7 +478,9 @@ class TestMain:
     def test_exits_successfully_on_exception(self) -> None:
         """Should exit 0 on unexpected exceptions (silent failure)."""
         with patch("release_check.exit_if_disabled"):
-            with patch("sys.stdin.read", side_effect=Exception("Unexpected error")):
+            with patch(
+                "sys.stdin.buffer.read", side_effect=Exception("Unexpected error")
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -438,7 +489,7 @@ class TestMain:
     def test_handles_malformed_json(self) -> None:
         """Should exit 0 when stdin contains malformed JSON."""
         with patch("release_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value="not valid json"):
+            with patch("sys.stdin.buffer.read", return_value=b"not valid json"):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -449,7 +500,9 @@ class TestMain:
         input_data = {"tool_name": "Bash", "tool_input": {}}
 
         with patch("release_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "sys.stdin.buffer.read", return_value=json.dumps(input_data).encode()
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -472,7 +525,9 @@ class TestGhReleaseConfirmation:
         }
 
         with patch("release_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "sys.stdin.buffer.read", return_value=json.dumps(input_data).encode()
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -491,7 +546,9 @@ class TestGhReleaseConfirmation:
         }
 
         with patch("release_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "sys.stdin.buffer.read", return_value=json.dumps(input_data).encode()
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -502,7 +559,9 @@ class TestGhReleaseConfirmation:
         input_data = {"tool_name": "Bash", "tool_input": {"command": "gh release list"}}
 
         with patch("release_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "sys.stdin.buffer.read", return_value=json.dumps(input_data).encode()
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -516,7 +575,9 @@ class TestGhReleaseConfirmation:
         }
 
         with patch("release_check.exit_if_disabled"):
-            with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+            with patch(
+                "sys.stdin.buffer.read", return_value=json.dumps(input_data).encode()
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -531,7 +592,10 @@ class TestGhReleaseConfirmation:
 
         with patch("release_check.exit_if_disabled"):
             with patch("os.environ.get", return_value="1"):
-                with patch("sys.stdin.read", return_value=json.dumps(input_data)):
+                with patch(
+                    "sys.stdin.buffer.read",
+                    return_value=json.dumps(input_data).encode(),
+                ):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -25,6 +25,38 @@ spec.loader.exec_module(release_reminder)
 main = release_reminder.main
 
 
+# =============================================================================
+# Tests for has_release_keyword()
+# =============================================================================
+
+
+class TestHasReleaseKeyword:
+    """Test has_release_keyword() function."""
+
+    @pytest.mark.parametrize(
+        "prompt",
+        ["Releases are due", "TAG\tv2", "version   bump", "ship (v1.4.0)", "V10.0."],
+    )
+    def test_detects_keywords_and_versions(self, prompt: str) -> None:
+        """Should detect keywords and version patterns in any case."""
+        assert release_reminder.has_release_keyword(prompt)
+
+    @pytest.mark.parametrize(
+        "prompt",
+        ["a prerelease build", "retag the commit", "dev1.2.3 build", "see v1.2"],
+    )
+    def test_requires_keyword_at_word_start(self, prompt: str) -> None:
+        """Should ignore keywords and versions that don't start a word."""
+        assert not release_reminder.has_release_keyword(prompt)
+
+    def test_skips_keyword_regex_without_literals(self) -> None:
+        """Should not run the keyword regex when no literal is present."""
+        with patch.object(release_reminder, "TRIGGER_KEYWORDS") as mock_keywords:
+            assert not release_reminder.has_release_keyword("explain this function")
+
+        mock_keywords.search.assert_not_called()
+
+
 # =============================================================================
 # Tests for main()
 # =============================================================================
@@ -42,7 +74,7 @@ class TestMain:
 
         with patch("release_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -62,7 +94,7 @@ class TestMain:
 
         with patch("release_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -79,7 +111,7 @@ class TestMain:
 
         with patch("release_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -96,7 +128,7 @@ class TestMain:
 
         with patch("release_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -113,7 +145,7 @@ class TestMain:
 
         with patch("release_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -127,7 +159,7 @@ class TestMain:
 
         with patch("release_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -144,7 +176,7 @@ class TestMain:
 
         with patch("release_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -161,7 +193,7 @@ class TestMain:
 
         with patch("release_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -178,7 +210,7 @@ class TestMain:
 
         with patch("release_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -192,7 +224,7 @@ class TestMain:
 
         with patch("release_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -204,7 +236,7 @@ class TestMain:
         """Should exit 0 on unexpected exceptions (silent failure)."""
         with patch("release_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", side_effect=Exception("Unexpected error")):
+                with patch("json.loads", side_effect=Exception("Unexpected error")):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -215,7 +247,7 @@ class TestMain:
         with patch("release_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
                 with patch(
-                    "json.load", side_effect=json.JSONDecodeError("msg", "doc", 0)
+                    "json.loads", side_effect=json.JSONDecodeError("msg", "doc", 0)
                 ):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
@@ -228,7 +260,7 @@ class TestMain:
 
         with patch("release_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
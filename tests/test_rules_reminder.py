@@ -26,6 +26,31 @@ main = rules_reminder.main
 REMINDER = rules_reminder.REMINDER
 
 
+# =============================================================================
+# Tests for has_trigger_keyword()
+# =============================================================================
+
+
+class TestHasTriggerKeyword:
+    """Test has_trigger_keyword() function."""
+
+    @pytest.mark.parametrize(
+        "prompt",
+        ["Please FIX it", "let's set up CI", "clean up the tests", "a cleanup pass"],
+    )
+    def test_detects_keywords_and_phrases(self, prompt: str) -> None:
+        """Should detect keywords and two-word phrases in any case."""
+        assert rules_reminder.has_trigger_keyword(prompt)
+
+    @pytest.mark.parametrize(
+        "prompt",
+        ["what does prefix mean", "rename fix_bug", "a set-up fee", "explain this"],
+    )
+    def test_requires_whole_word_match(self, prompt: str) -> None:
+        """Should ignore keywords embedded in longer words or identifiers."""
+        assert not rules_reminder.has_trigger_keyword(prompt)
+
+
 # =============================================================================
 # Tests for main()
 # =============================================================================
@@ -40,7 +65,7 @@ class TestMain:
 
         with patch("rules_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -59,7 +84,7 @@ class TestMain:
 
         with patch("rules_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -76,7 +101,7 @@ class TestMain:
 
         with patch("rules_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -93,7 +118,7 @@ class TestMain:
 
         with patch("rules_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -110,7 +135,7 @@ class TestMain:
 
         with patch("rules_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -127,7 +152,7 @@ class TestMain:
 
         with patch("rules_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -144,7 +169,7 @@ class TestMain:
 
         with patch("rules_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -161,7 +186,7 @@ class TestMain:
 
         with patch("rules_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -175,7 +200,7 @@ class TestMain:
 
         with patch("rules_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", return_value=input_data):
+                with patch("json.loads", return_value=input_data):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -187,7 +212,7 @@ class TestMain:
         """Should exit 0 on unexpected exceptions (silent failure)."""
         with patch("rules_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
-                with patch("json.load", side_effect=Exception("Unexpected error")):
+                with patch("json.loads", side_effect=Exception("Unexpected error")):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
 
@@ -198,7 +223,7 @@ class TestMain:
         with patch("rules_reminder.exit_if_disabled"):
             with patch("sys.stdin", MagicMock()):
                 with patch(
-                    "json.load", side_effect=json.JSONDecodeError("msg", "doc", 0)
+                    "json.loads", side_effect=json.JSONDecodeError("msg", "doc", 0)
                 ):
                     with pytest.raises(SystemExit) as exc_info:
                         main()
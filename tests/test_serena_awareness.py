@@ -13,6 +13,7 @@ Also tests session marker functionality:
 """
 
 import json
+import os
 import sys
 import time
 from pathlib import Path
@@ -93,6 +94,14 @@ another_field: value2
         result = serena_awareness.parse_project_name(str(config))
         assert result == "test-project"
 
+    def test_parses_project_name_on_continuation_line(self, tmp_path) -> None:
+        """Should accept a plain scalar value on the following indented line."""
+        config = tmp_path / "project.yml"
+        config.write_text("project_name:\n  my-project\nlanguage: python\n")
+
+        result = serena_awareness.parse_project_name(str(config))
+        assert result == "my-project"
+
     def test_returns_none_for_missing_field(self, tmp_path) -> None:
         """Should return None when project_name field missing."""
         config = tmp_path / "project.yml"
@@ -324,6 +333,26 @@ class TestIsFirstPromptInSession:
         assert result2 is True
         assert result1_again is False
 
+    def test_refreshes_marker_mtime_on_later_prompts(
+        self, clean_session_markers
+    ) -> None:
+        """Should keep an active session's marker fresh for cleanup."""
+        serena_awareness.is_first_prompt_in_session("session-active")
+        marker = clean_session_markers / "session-active.seen"
+        os.utime(marker, (0, 0))
+
+        serena_awareness.is_first_prompt_in_session("session-active")
+
+        assert marker.stat().st_mtime > 0
+
+    def test_cleans_up_only_for_new_sessions(self, clean_session_markers) -> None:
+        """Should skip the stale-marker sweep on repeat prompts."""
+        with patch.object(serena_awareness, "cleanup_old_session_markers") as mock:
+            serena_awareness.is_first_prompt_in_session("session-sweep")
+            serena_awareness.is_first_prompt_in_session("session-sweep")
+
+        mock.assert_called_once_with("session-sweep")
+
 
 class TestCleanupOldSessionMarkers:
     """Test cleanup_old_session_markers() stale marker removal."""
@@ -336,8 +365,6 @@ class TestCleanupOldSessionMarkers:
         old_marker = clean_session_markers / "old-session.seen"
         old_marker.touch()
         old_time = time.time() - (10 * 86400)  # 10 days ago
-        import os
-
         os.utime(old_marker, (old_time, old_time))
 
         # Run cleanup
@@ -345,6 +372,18 @@ class TestCleanupOldSessionMarkers:
 
         assert not old_marker.exists()
 
+    def test_ignores_files_without_marker_suffix(self, clean_session_markers) -> None:
+        """Should only remove stale *.seen markers."""
+        clean_session_markers.mkdir(parents=True)
+        other_file = clean_session_markers / "notes.txt"
+        other_file.touch()
+        old_time = time.time() - (10 * 86400)  # 10 days ago
+        os.utime(other_file, (old_time, old_time))
+
+        serena_awareness.cleanup_old_session_markers("current-session")
+
+        assert other_file.exists()
+
     def test_preserves_current_session(self, clean_session_markers) -> None:
         """Should never delete current session's marker, even if old."""
         clean_session_markers.mkdir(parents=True)
@@ -353,8 +392,6 @@ class TestCleanupOldSessionMarkers:
         current_marker = clean_session_markers / "current-session.seen"
         current_marker.touch()
         old_time = time.time() - (10 * 86400)  # 10 days ago
-        import os
-
         os.utime(current_marker, (old_time, old_time))
 
         # Run cleanup with current session ID
@@ -370,8 +407,6 @@ class TestCleanupOldSessionMarkers:
         recent_marker = clean_session_markers / "recent-session.seen"
         recent_marker.touch()
         recent_time = time.time() - (1 * 86400)  # 1 day ago
-        import os
-
         os.utime(recent_marker, (recent_time, recent_time))
 
         # Run cleanup
@@ -412,7 +447,7 @@ class TestIntegration:
 
         # Mock stdin with session_id (UserPromptSubmit format)
         stdin_data = json.dumps({"session_id": "test-session-1", "prompt": "hello"})
-        monkeypatch.setattr("sys.stdin.read", lambda: stdin_data)
+        monkeypatch.setattr("sys.stdin.buffer.read", lambda: stdin_data.encode())
 
         # Run main - expect SystemExit(0)
         with pytest.raises(SystemExit) as exc_info:
@@ -437,7 +472,7 @@ class TestIntegration:
 
         # Mock stdin with session_id
         stdin_data = json.dumps({"session_id": "test-session-2", "prompt": "hello"})
-        monkeypatch.setattr("sys.stdin.read", lambda: stdin_data)
+        monkeypatch.setattr("sys.stdin.buffer.read", lambda: stdin_data.encode())
 
         # Run main - expect SystemExit(0)
         with pytest.raises(SystemExit) as exc_info:
@@ -461,7 +496,7 @@ class TestIntegration:
 
         # Mock stdin with session_id
         stdin_data = json.dumps({"session_id": "test-session-3", "prompt": "hello"})
-        monkeypatch.setattr("sys.stdin.read", lambda: stdin_data)
+        monkeypatch.setattr("sys.stdin.buffer.read", lambda: stdin_data.encode())
 
         # Run main - expect SystemExit(0)
         with pytest.raises(SystemExit) as exc_info:
@@ -476,7 +511,7 @@ class TestIntegration:
     def test_main_exits_cleanly_on_invalid_json(self, monkeypatch, capsys) -> None:
         """Should exit with status 0 on invalid JSON (fail open)."""
         # Force an exception by providing invalid stdin
-        monkeypatch.setattr("sys.stdin.read", lambda: "invalid json")
+        monkeypatch.setattr("sys.stdin.buffer.read", lambda: b"invalid json")
 
         # Should not raise exception, should exit 0
         with pytest.raises(SystemExit) as exc_info:
@@ -490,7 +525,7 @@ class TestIntegration:
         """Should exit with status 0 when session_id is missing."""
         # Valid JSON but no session_id
         stdin_data = json.dumps({"prompt": "hello"})
-        monkeypatch.setattr("sys.stdin.read", lambda: stdin_data)
+        monkeypatch.setattr("sys.stdin.buffer.read", lambda: stdin_data.encode())
 
         # Should exit 0 without output
         with pytest.raises(SystemExit) as exc_info:
@@ -516,7 +551,7 @@ class TestIntegration:
 
         # First prompt - should output
         stdin_data = json.dumps({"session_id": "repeat-session", "prompt": "first"})
-        monkeypatch.setattr("sys.stdin.read", lambda: stdin_data)
+        monkeypatch.setattr("sys.stdin.buffer.read", lambda: stdin_data.encode())
 
         with pytest.raises(SystemExit):
             serena_awareness.main()
@@ -526,7 +561,7 @@ class TestIntegration:
 
         # Second prompt - should be silent
         stdin_data = json.dumps({"session_id": "repeat-session", "prompt": "second"})
-        monkeypatch.setattr("sys.stdin.read", lambda: stdin_data)
+        monkeypatch.setattr("sys.stdin.buffer.read", lambda: stdin_data.encode())
 
         with pytest.raises(SystemExit):
             serena_awareness.main()
@@ -552,7 +587,7 @@ class TestIntegration:
 
         # Mock stdin with session_id
         stdin_data = json.dumps({"session_id": "disabled-session", "prompt": "hello"})
-        monkeypatch.setattr("sys.stdin.read", lambda: stdin_data)
+        monkeypatch.setattr("sys.stdin.buffer.read", lambda: stdin_data.encode())
 
         # Mock sys.argv to set hook name
         with patch.object(sys, "argv", ["/path/to/serena-awareness.py"]):
@@ -790,7 +825,7 @@ class TestAggressiveModeIntegration:
 
         # Mock stdin with session_id
         stdin_data = json.dumps({"session_id": "aggressive-env-session", "prompt": "x"})
-        monkeypatch.setattr("sys.stdin.read", lambda: stdin_data)
+        monkeypatch.setattr("sys.stdin.buffer.read", lambda: stdin_data.encode())
 
         # Run main
         with pytest.raises(SystemExit) as exc_info:
@@ -829,7 +864,7 @@ class TestAggressiveModeIntegration:
         stdin_data = json.dumps(
             {"session_id": "aggressive-flag-session", "prompt": "x"}
         )
-        monkeypatch.setattr("sys.stdin.read", lambda: stdin_data)
+        monkeypatch.setattr("sys.stdin.buffer.read", lambda: stdin_data.encode())
 
         # Run main
         with pytest.raises(SystemExit) as exc_info:
@@ -858,7 +893,7 @@ class TestAggressiveModeIntegration:
 
         # Mock stdin with session_id
         stdin_data = json.dumps({"session_id": "normal-mode-session", "prompt": "x"})
-        monkeypatch.setattr("sys.stdin.read", lambda: stdin_data)
+        monkeypatch.setattr("sys.stdin.buffer.read", lambda: stdin_data.encode())
 
         # Run main
         with pytest.raises(SystemExit) as exc_info: